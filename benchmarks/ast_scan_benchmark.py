@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.tools.repo_tools import RepoManager
+
+
+_MODULE_TEMPLATE = '''from langgraph.graph import END, START, StateGraph
+
+
+class Worker{index}:
+	def run(self, payload: dict) -> dict:
+		return {{key: value for key, value in payload.items() if value}}
+
+
+def build_graph_{index}(state_type: type) -> StateGraph:
+	builder = StateGraph(state_type)
+	builder.add_node("node_{index}", Worker{index}().run)
+	builder.add_edge(START, "node_{index}")
+	builder.add_edge("node_{index}", END)
+	return builder
+'''
+
+
+def _build_synthetic_repo(root: Path, file_count: int, padding_functions: int) -> None:
+	padding = "".join(
+		f"\n\ndef helper_{number}(value: int) -> int:\n\treturn value * {number} + len(str(value))\n"
+		for number in range(padding_functions)
+	)
+	for index in range(file_count):
+		package_dir = root / f"pkg_{index % 50:02d}"
+		package_dir.mkdir(parents=True, exist_ok=True)
+		(package_dir / f"module_{index:05d}.py").write_text(
+			_MODULE_TEMPLATE.format(index=index) + padding,
+			encoding="utf-8",
+		)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description="Benchmark parallel AST scanning")
+	parser.add_argument("--files", type=int, default=2000)
+	parser.add_argument("--padding-functions", type=int, default=40)
+	parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+	parser.add_argument("--repeat", type=int, default=3)
+	args = parser.parse_args()
+
+	print(f"CPU cores available: {os.cpu_count()}")
+	with tempfile.TemporaryDirectory() as temp_dir:
+		repo_root = Path(temp_dir)
+		_build_synthetic_repo(repo_root, args.files, args.padding_functions)
+
+		# No AST cache so every run measures real parsing work.
+		manager = RepoManager()
+		baseline: float | None = None
+		scan_baseline: float | None = None
+		# The scan column is the pool phase alone; total also includes reading the
+		# files and the import-closure symbol pass, which do not scale with workers.
+		print(
+			f"{'workers':>8} {'total_s':>8} {'speedup':>8} {'scan_s':>8} {'scan_x':>8} "
+			f"{'symbols_s':>9} {'files':>7}"
+		)
+		for workers in args.workers:
+			timings: list[float] = []
+			scan_timings: list[float] = []
+			symbol_timings: list[float] = []
+			for _ in range(args.repeat):
+				started = time.perf_counter()
+				analysis = manager.analyze_graph_structure(str(repo_root), workers=workers)
+				timings.append(time.perf_counter() - started)
+				phases = analysis["summary"]["phase_timings_ms"]
+				scan_timings.append(phases["scan"] / 1000)
+				symbol_timings.append(phases["symbol_index"] / 1000)
+
+			best = min(timings)
+			best_scan = min(scan_timings)
+			baseline = baseline or best
+			scan_baseline = scan_baseline or best_scan
+			print(
+				f"{workers:>8} {best:>8.3f} {baseline / best:>8.2f} {best_scan:>8.3f} "
+				f"{scan_baseline / best_scan:>8.2f} {min(symbol_timings):>9.3f} "
+				f"{analysis['summary']['python_files_scanned']:>7}"
+			)
+
+if __name__ == "__main__":
+	main()
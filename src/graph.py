@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import threading
 
 from langchain_core.globals import set_debug
 set_debug(True)
@@ -11,12 +12,17 @@ from langgraph.graph import END, START, StateGraph
 
 from src.nodes.detectives import (
     doc_analyst_node,
+    pdf_ingestion_node,
     repo_investigator_node,
     vision_inspector_node,
 )
 from src.nodes.justice import chief_justice_node
 from src.nodes.judges import defense_node, prosecutor_node, tech_lead_node
 from src.state import AgentState
+from src.tools.audit_store import AuditStore
+from src.tools.cache_store import env_int
+from src.tools.doc_tools import warm_document_converter
+from src.tools.pdf_parallel import PDF_PAGE_WORKERS_ENV, warm_page_pool
 
 # Configure logging for professional trace visibility
 logging.basicConfig(level=logging.INFO)
@@ -50,6 +56,7 @@ workflow = StateGraph(AgentState)
 # Add Detective Nodes
 workflow.add_node("doc_analyst_node", doc_analyst_node)
 workflow.add_node("repo_investigator_node", repo_investigator_node)
+workflow.add_node("pdf_ingestion_node", pdf_ingestion_node)
 workflow.add_node("vision_inspector_node", vision_inspector_node)
 
 # Add the Critical Fan-In Node
@@ -62,14 +69,17 @@ workflow.add_node("chief_justice_node", chief_justice_node)
 # Stage 1: Repo investigation first (establishes repo_path and repo-scoped pdf_path)
 workflow.add_edge(START, "repo_investigator_node")
 
-# Stage 2: Parallel document and vision analysis on resolved target-repo PDF
-workflow.add_edge("repo_investigator_node", "doc_analyst_node")
-workflow.add_edge("repo_investigator_node", "vision_inspector_node")
+# Stage 2: Open and parse the resolved target-repo PDF once
+workflow.add_edge("repo_investigator_node", "pdf_ingestion_node")
+
+# Stage 3: Parallel document and vision analysis on the shared PDF artifact
+workflow.add_edge("pdf_ingestion_node", "doc_analyst_node")
+workflow.add_edge("pdf_ingestion_node", "vision_inspector_node")
 
 # Fan-In (Detectives -> Aggregator)
-workflow.add_edge("repo_investigator_node", "evidence_aggregator_node")
-workflow.add_edge("doc_analyst_node", "evidence_aggregator_node")
-workflow.add_edge("vision_inspector_node", "evidence_aggregator_node")
+# One join edge: the aggregator waits for both branches and fires once. Repo
+# evidence is already upstream through pdf_ingestion_node.
+workflow.add_edge(["doc_analyst_node", "vision_inspector_node"], "evidence_aggregator_node")
 
 # Judicial Fan-Out (Aggregator -> Judges)
 workflow.add_edge("evidence_aggregator_node", "prosecutor_node")
@@ -87,11 +97,18 @@ workflow.add_edge("chief_justice_node", END)
 app = workflow.compile()
 
 
-def _build_initial_state(repo_url: str, pdf_path: str) -> AgentState:
+def _build_initial_state(
+    repo_url: str,
+    pdf_path: str,
+    incremental: bool = False,
+    previous_audit: dict | None = None,
+) -> AgentState:
     return {
         "repo_url": repo_url,
         "pdf_path": pdf_path,
         "rubric_dimensions": [],
+        "incremental": incremental,
+        "previous_audit": previous_audit,
         "evidences": {},
         "opinions": [],
         "messages": [],
@@ -110,16 +127,43 @@ def _parse_args() -> argparse.Namespace:
         default="reports/final_report.pdf",
         help="Path to architectural report PDF",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-run only detectors and rubric dimensions whose inputs changed since the last audit",
+    )
     return parser.parse_args()
 
 if __name__ == "__main__":
     args = _parse_args()
-    initial_state = _build_initial_state(args.repo_url, args.pdf_path)
+    audit_store = AuditStore()
+    previous_audit = audit_store.load(args.repo_url) if args.incremental else None
+    initial_state = _build_initial_state(
+        args.repo_url,
+        args.pdf_path,
+        incremental=args.incremental,
+        previous_audit=previous_audit,
+    )
+
+    # Load Docling's layout models while the repository is being cloned. Page-pool
+    # workers each load their own copy, so nothing is warmed when no PDF will be
+    # converted or an incremental run is likely to reuse the previous evidence.
+    if args.pdf_path and previous_audit is None:
+        threading.Thread(target=warm_document_converter, daemon=True).start()
+        threading.Thread(
+            target=warm_page_pool,
+            args=(env_int(PDF_PAGE_WORKERS_ENV, 1), warm_document_converter),
+            daemon=True,
+        ).start()
 
     print("--- Executing Forensic Swarm ---")
     print(f"Repo URL: {args.repo_url}")
     print(f"PDF Path: {args.pdf_path}")
+    if args.incremental:
+        baseline = previous_audit.get("commit_sha") if previous_audit else None
+        print(f"Incremental baseline: {baseline or 'none (full audit)'}")
     final_state = app.invoke(initial_state)
+    audit_store.save(args.repo_url, final_state)
     
     evidence_keys = list(final_state.get("evidences", {}).keys())
     print(f"\n✅ Audit Phase 1 Complete")
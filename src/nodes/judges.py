@@ -11,6 +11,7 @@ from langchain_groq import ChatGroq
 
 from src.nodes.llm_locks import LLM_CALL_LOCK
 from src.state import AgentState, JudicialOpinion
+from src.tools.audit_store import anchored_location, dimension_inputs
 
 load_dotenv()
 
@@ -141,6 +142,36 @@ def _truncate_evidence_context(evidence_strings: list[str], max_chars: int = 200
     return payload[:1000] + " ...[TRUNCATED]... " + payload[-1000:]
 
 
+def _reusable_opinions(
+    state: AgentState,
+    judge_label: str,
+    dimensions: list[dict[str, Any]],
+) -> dict[str, JudicialOpinion]:
+    previous = state.get("previous_audit") if state.get("incremental") else None
+    if not previous:
+        return {}
+
+    changed_inputs = state.get("changed_inputs", {})
+    unchanged_criteria = {
+        str(dimension.get("id"))
+        for dimension in dimensions
+        if not any(changed_inputs.get(kind, True) for kind in dimension_inputs(dimension))
+    }
+
+    repo_path = state.get("repo_path", "")
+    reusable: dict[str, JudicialOpinion] = {}
+    for item in previous.get("opinions", []):
+        try:
+            opinion = JudicialOpinion.model_validate(item)
+        except Exception:
+            continue
+        if opinion.judge == judge_label and opinion.criterion_id in unchanged_criteria:
+            # Cited locations were stored relative to the previous run's clone.
+            opinion.cited_evidence = [anchored_location(cited, repo_path) for cited in opinion.cited_evidence]
+            reusable[opinion.criterion_id] = opinion
+    return reusable
+
+
 def _run_judge(
     state: AgentState,
     *,
@@ -162,8 +193,15 @@ def _run_judge(
         evidence_context = _truncate_evidence_context(evidence_strings)
 
         opinions: list[JudicialOpinion] = []
+        reusable = _reusable_opinions(state, judge_label, dimensions)
 
         for index, dimension in enumerate(dimensions, start=1):
+            reused_opinion = reusable.get(str(dimension.get("id", "unknown_criterion")))
+            if reused_opinion is not None:
+                # Inputs for this dimension are unchanged since the last audit.
+                opinions.append(reused_opinion)
+                continue
+
             time.sleep(15)
             if index % 5 == 0:
                 time.sleep(30)
@@ -266,7 +304,8 @@ def _run_judge(
         return {
             "opinions": opinions,
             "messages": [
-                f"{judge_label} node completed {len(opinions)} criterion reviews."
+                f"{judge_label} node completed {len(opinions)} criterion reviews "
+                f"({len(reusable)} reused from the previous audit)."
             ],
         }
     except Exception as error:
@@ -4,6 +4,9 @@ from typing import Annotated, Dict, List, Literal, Optional, Any
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
 
+from src.tools.doc_tools import PdfArtifact
+from src.tools.repo_snapshot import RepoSnapshot
+
 # --- Detective Output ---
 
 class Evidence(BaseModel):
@@ -65,8 +68,22 @@ class AgentState(TypedDict):
     """
     repo_url: str
     repo_path: str
+    # Built once by the repo investigator and shared by reference so downstream
+    # nodes resolve paths from memory instead of re-walking the clone.
+    repo_snapshot: Optional[RepoSnapshot]
     pdf_path: str
+    # Parsed once by the PDF ingestion node; doc and vision detectors read text,
+    # chunks and extracted image paths from it instead of reopening the file.
+    pdf_artifact: Optional[PdfArtifact]
     rubric_dimensions: List[Dict]
+
+    # Incremental re-audit bookkeeping: the audited commit, the previously stored
+    # audit record and which detector inputs changed since then.
+    incremental: bool
+    previous_audit: Optional[Dict[str, Any]]
+    repo_commit: str
+    pdf_relative_path: str
+    changed_inputs: Dict[str, bool]
     
     # operator.ior: Merges dictionaries from parallel detectives without overwriting
     evidences: Annotated[
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import re
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Iterable
+
+
+Handler = Callable[[ast.AST, "TraversalContext"], None]
+_SCOPE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def dotted_name(node: ast.AST | None) -> str | None:
+	parts: list[str] = []
+	while isinstance(node, ast.Attribute):
+		parts.append(node.attr)
+		node = node.value
+	if not isinstance(node, ast.Name):
+		return None
+	parts.append(node.id)
+	return ".".join(reversed(parts))
+
+
+class TraversalContext:
+	__slots__ = ("file_path", "scope")
+
+	def __init__(self, file_path: str) -> None:
+		self.file_path = file_path
+		self.scope: list[str] = []
+
+	@property
+	def qualified_scope(self) -> str:
+		return ".".join(self.scope)
+
+
+class AstDetector(ABC):
+	name: ClassVar[str] = ""
+	version: ClassVar[int] = 1
+	# Raw byte tokens that must appear in a file for the detector to find anything.
+	# None means the detector needs every file and disables the byte prefilter.
+	trigger_tokens: ClassVar[tuple[bytes, ...] | None] = ()
+
+	def __init__(self, file_path: str) -> None:
+		self.file_path = file_path
+		self.findings: list[dict[str, Any]] = []
+
+	@abstractmethod
+	def handlers(self) -> dict[type[ast.AST], Handler]:
+		...
+
+	def finish(self) -> list[dict[str, Any]]:
+		return self.findings
+
+
+_REGISTERED_DETECTORS: list[type[AstDetector]] = []
+
+
+def register_detector(detector_class: type[AstDetector]) -> type[AstDetector]:
+	if not detector_class.name:
+		raise ValueError(f"{detector_class.__name__} must define a detector name.")
+	if detector_class not in _REGISTERED_DETECTORS:
+		_REGISTERED_DETECTORS.append(detector_class)
+	return detector_class
+
+
+def registered_detectors() -> tuple[type[AstDetector], ...]:
+	return tuple(_REGISTERED_DETECTORS)
+
+
+def detector_signature(detectors: Iterable[type[AstDetector]]) -> str:
+	fingerprint = ",".join(f"{detector.name}@{detector.version}" for detector in detectors)
+	return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+
+def _token_regex(token: bytes) -> bytes:
+	# Python allows whitespace and line continuations around ".", "=" and "(", so
+	# "eval (", "os . system" and "shell =True" must still match their tokens.
+	parts = re.split(rb"([.=(])", token)
+	return b"".join(
+		rb"[\s\\]*" + re.escape(part) + rb"[\s\\]*" if part in {b".", b"=", b"("} else re.escape(part)
+		for part in parts
+		if part
+	)
+
+
+@lru_cache(maxsize=32)
+def trigger_pattern(token_groups: tuple[tuple[bytes, ...] | None, ...]) -> re.Pattern[bytes] | None:
+	if any(group is None for group in token_groups):
+		return None
+	tokens = sorted({token for group in token_groups for token in group or ()})
+	if not tokens:
+		return None
+	return re.compile(b"|".join(_token_regex(token) for token in tokens))
+
+
+def run_fused_traversal(
+	tree: ast.AST,
+	detectors: list[Any],
+	file_path: str,
+) -> list[float]:
+	# One pre-order walk (the same order as ast.NodeVisitor) dispatching each node
+	# to every detector that registered a handler for its type.
+	dispatch: dict[type[ast.AST], list[tuple[int, Handler]]] = {}
+	for index, detector in enumerate(detectors):
+		for node_type, handler in detector.handlers().items():
+			dispatch.setdefault(node_type, []).append((index, handler))
+
+	timings = [0.0] * len(detectors)
+	context = TraversalContext(file_path)
+	exit_marker = object()
+	stack: list[Any] = [tree]
+
+	while stack:
+		node = stack.pop()
+		if node is exit_marker:
+			context.scope.pop()
+			continue
+
+		for index, handler in dispatch.get(type(node), ()):
+			started = time.perf_counter()
+			handler(node, context)
+			timings[index] += time.perf_counter() - started
+
+		if isinstance(node, _SCOPE_NODES):
+			context.scope.append(node.name)
+			stack.append(exit_marker)
+		stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+	return timings
+
+
+@register_detector
+class UnsafeExecutionDetector(AstDetector):
+	name = "unsafe_execution"
+	version = 3
+	# Call-shaped tokens: bare "eval" or "shell" also match docstrings and names
+	# such as "evaluate", which would let most files through the prefilter.
+	# "shell=" rather than "shell=True" so "shell=(True)" is not skipped.
+	trigger_tokens = (
+		b"os.system",
+		b"os.popen",
+		b"getoutput",
+		b"getstatusoutput",
+		b"shell=",
+		b"eval(",
+		b"exec(",
+	)
+
+	_SHELL_CALLS = {"os.system", "os.popen", "commands.getoutput", "commands.getstatusoutput"}
+	_EVAL_CALLS = {"eval", "exec"}
+
+	def handlers(self) -> dict[type[ast.AST], Handler]:
+		return {ast.Call: self._on_call}
+
+	def _on_call(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.Call)
+		call_name = dotted_name(node.func)
+		if call_name is None:
+			return
+
+		kind: str | None = None
+		if call_name in self._SHELL_CALLS:
+			kind = "raw_shell"
+		elif call_name in self._EVAL_CALLS:
+			kind = "dynamic_eval"
+		elif call_name.startswith("subprocess.") or call_name in {"Popen", "run", "call", "check_output"}:
+			for keyword in node.keywords:
+				if keyword.arg == "shell" and isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
+					kind = "shell_true"
+
+		if kind is not None:
+			self.findings.append(
+				{"line": node.lineno, "call": call_name, "kind": kind, "scope": context.qualified_scope}
+			)
+
+
+@register_detector
+class StructuredOutputDetector(AstDetector):
+	name = "structured_output"
+	trigger_tokens = (b"with_structured_output", b"bind_tools", b"OutputParser")
+
+	def handlers(self) -> dict[type[ast.AST], Handler]:
+		return {ast.Call: self._on_call}
+
+	def _on_call(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.Call)
+		call_name = dotted_name(node.func) or ""
+		method = call_name.rsplit(".", 1)[-1]
+
+		if method in {"with_structured_output", "bind_tools"}:
+			schema = dotted_name(node.args[0]) if node.args else None
+			self.findings.append(
+				{"line": node.lineno, "call": method, "schema": schema, "scope": context.qualified_scope}
+			)
+		elif method.endswith("OutputParser"):
+			self.findings.append(
+				{"line": node.lineno, "call": method, "schema": None, "scope": context.qualified_scope}
+			)
+
+
+@register_detector
+class StateSchemaDetector(AstDetector):
+	name = "state_schema"
+	trigger_tokens = (b"BaseModel", b"TypedDict", b"Annotated")
+
+	_SCHEMA_BASES = {"BaseModel": "pydantic", "TypedDict": "typeddict"}
+
+	def handlers(self) -> dict[type[ast.AST], Handler]:
+		return {ast.ClassDef: self._on_class, ast.AnnAssign: self._on_annotated_field}
+
+	def _on_class(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.ClassDef)
+		for base in node.bases:
+			base_name = (dotted_name(base) or "").rsplit(".", 1)[-1]
+			if base_name in self._SCHEMA_BASES:
+				self.findings.append(
+					{
+						"line": node.lineno,
+						"kind": self._SCHEMA_BASES[base_name],
+						"class": node.name,
+						"fields": sum(isinstance(item, ast.AnnAssign) for item in node.body),
+					}
+				)
+				return
+
+	def _on_annotated_field(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.AnnAssign)
+		annotation = node.annotation
+		if not isinstance(annotation, ast.Subscript):
+			return
+		if (dotted_name(annotation.value) or "").rsplit(".", 1)[-1] != "Annotated":
+			return
+		if not isinstance(annotation.slice, ast.Tuple) or len(annotation.slice.elts) < 2:
+			return
+
+		reducer = dotted_name(annotation.slice.elts[1])
+		field_name = node.target.id if isinstance(node.target, ast.Name) else None
+		self.findings.append(
+			{
+				"line": node.lineno,
+				"kind": "annotated_reducer",
+				"class": context.qualified_scope,
+				"field": field_name,
+				"reducer": reducer,
+			}
+		)
+
+
+# Not registered: nearly every file defines or imports something, so running it in
+# the fused pass would defeat the byte prefilter. RepoManager runs it on demand over
+# the import closure of the graph builder files instead.
+class SymbolIndexDetector(AstDetector):
+	name = "symbols"
+	trigger_tokens = None
+
+	def __init__(self, file_path: str) -> None:
+		super().__init__(file_path)
+		self.imports: dict[str, list[Any]] = {}
+		self.instances: dict[str, str] = {}
+		self.classes: list[str] = []
+		self.definitions: dict[str, dict[str, Any]] = {}
+
+	def handlers(self) -> dict[type[ast.AST], Handler]:
+		return {
+			ast.Import: self._on_import,
+			ast.ImportFrom: self._on_import_from,
+			ast.ClassDef: self._on_class,
+			ast.FunctionDef: self._on_function,
+			ast.AsyncFunctionDef: self._on_function,
+			ast.Assign: self._on_assign,
+			ast.Call: self._on_call,
+		}
+
+	def finish(self) -> list[dict[str, Any]]:
+		return [
+			{
+				"kind": "module",
+				"imports": self.imports,
+				"instances": self.instances,
+				"classes": self.classes,
+			},
+			*({**definition, "calls": list(definition["calls"])} for definition in self.definitions.values()),
+		]
+
+	def _on_import(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.Import)
+		for alias in node.names:
+			if alias.asname:
+				self.imports[alias.asname] = [alias.name, 0, None]
+			else:
+				# "import a.b" binds "a"; the dotted remainder resolves through attributes.
+				head = alias.name.split(".", 1)[0]
+				self.imports[head] = [head, 0, None]
+
+	def _on_import_from(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.ImportFrom)
+		for alias in node.names:
+			if alias.name != "*":
+				self.imports[alias.asname or alias.name] = [node.module or "", node.level, alias.name]
+
+	def _on_class(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.ClassDef)
+		self.classes.append(".".join([*context.scope, node.name]))
+
+	def _on_function(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+		symbol = ".".join([*context.scope, node.name])
+		self.definitions[symbol] = {"kind": "def", "symbol": symbol, "line": node.lineno, "calls": {}}
+
+	def _on_assign(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.Assign)
+		if context.scope or len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
+			return
+		# Module-level singletons such as `_MANAGER = RepoManager()` let
+		# `_MANAGER.method()` calls resolve to the class method.
+		if isinstance(node.value, ast.Call):
+			constructor = dotted_name(node.value.func)
+			if constructor is not None:
+				self.instances[node.targets[0].id] = constructor
+
+	def _on_call(self, node: ast.AST, context: TraversalContext) -> None:
+		assert isinstance(node, ast.Call)
+		definition = self.definitions.get(context.qualified_scope)
+		call_name = dotted_name(node.func)
+		if definition is not None and call_name is not None:
+			# A dict keeps first-seen order with O(1) de-duplication.
+			definition["calls"].setdefault(call_name, None)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from src.tools.cache_store import cache_root
+from src.tools.repo_cache import normalize_repo_url
+
+
+INPUT_KINDS = ("repo", "history", "pdf")
+# Clones live in temporary directories, so stored locations name the repo root
+# with this marker and are re-anchored to the current clone when reused.
+REPO_ROOT_MARKER = "<repo>"
+_ARTIFACT_INPUTS = {
+	"github_repo": ("repo",),
+	"pdf_report": ("pdf",),
+	"pdf_images": ("pdf",),
+}
+_DIMENSION_INPUTS = {
+	"git_forensic_analysis": ("history",),
+	# Report accuracy cross-checks claims in the PDF against the code.
+	"report_accuracy": ("pdf", "repo"),
+}
+
+
+def dimension_inputs(dimension: dict[str, Any]) -> tuple[str, ...]:
+	criterion_id = str(dimension.get("id", ""))
+	if criterion_id in _DIMENSION_INPUTS:
+		return _DIMENSION_INPUTS[criterion_id]
+	return _ARTIFACT_INPUTS.get(str(dimension.get("target_artifact", "")), INPUT_KINDS)
+
+
+def detect_changed_inputs(
+	previous: dict[str, Any] | None,
+	commit_sha: str | None,
+	pdf_relative_path: str | None,
+	changed_files: list[str] | None,
+) -> dict[str, bool]:
+	everything = {kind: True for kind in INPUT_KINDS}
+	if not previous or not commit_sha or not previous.get("commit_sha"):
+		return everything
+	if previous.get("commit_sha") == commit_sha:
+		return {
+			"repo": False,
+			"history": False,
+			"pdf": previous.get("pdf_path") != pdf_relative_path,
+		}
+	if changed_files is None:
+		return everything
+
+	normalized = {path.replace("\\", "/") for path in changed_files}
+	pdf_path = (pdf_relative_path or "").replace("\\", "/")
+	return {
+		# Any tracked file counts: the repo evidence also carries the snapshot, digest
+		# inputs and duplicate fingerprints, not just Python ASTs.
+		"repo": bool(normalized),
+		"history": True,
+		"pdf": previous.get("pdf_path") != pdf_relative_path or pdf_path in normalized,
+	}
+
+
+def portable_location(text: str, repo_path: str | None) -> str:
+	if not repo_path:
+		return text
+	return text.replace(str(Path(repo_path)), REPO_ROOT_MARKER)
+
+
+def anchored_location(text: str, repo_path: str | None) -> str:
+	if not repo_path:
+		return text
+	return text.replace(REPO_ROOT_MARKER, str(Path(repo_path)))
+
+
+class AuditStore:
+	def __init__(self, root: Path | None = None) -> None:
+		self.root = root or cache_root("audits")
+		self.root.mkdir(parents=True, exist_ok=True)
+
+	def _record_path(self, repo_url: str) -> Path:
+		key = hashlib.sha256(normalize_repo_url(repo_url).encode("utf-8")).hexdigest()[:24]
+		return self.root / f"{key}.json"
+
+	def load(self, repo_url: str) -> dict[str, Any] | None:
+		try:
+			record = json.loads(self._record_path(repo_url).read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			return None
+		return record if isinstance(record, dict) else None
+
+	def save(self, repo_url: str, final_state: dict[str, Any]) -> dict[str, Any] | None:
+		commit_sha = final_state.get("repo_commit")
+		if not commit_sha:
+			return None
+
+		repo_path = final_state.get("repo_path")
+		record = {
+			"repo_url": normalize_repo_url(repo_url),
+			"commit_sha": commit_sha,
+			"pdf_path": final_state.get("pdf_relative_path"),
+			"audited_at": time.time(),
+			"rubric_dimensions": final_state.get("rubric_dimensions", []),
+			"evidences": {
+				bucket: [_portable_evidence(_dump(item), repo_path) for item in items]
+				for bucket, items in final_state.get("evidences", {}).items()
+			},
+			"opinions": [_portable_opinion(_dump(item), repo_path) for item in final_state.get("opinions", [])],
+		}
+
+		record_path = self._record_path(repo_url)
+		staging_path = record_path.with_suffix(".json.tmp")
+		staging_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+		os.replace(staging_path, record_path)
+		return record
+
+
+def _dump(item: Any) -> Any:
+	return item.model_dump() if hasattr(item, "model_dump") else item
+
+
+def _portable_evidence(item: Any, repo_path: str | None) -> Any:
+	if isinstance(item, dict) and isinstance(item.get("location"), str):
+		item = {**item, "location": portable_location(item["location"], repo_path)}
+	return item
+
+
+def _portable_opinion(item: Any, repo_path: str | None) -> Any:
+	# Judges may cite an evidence location verbatim.
+	if isinstance(item, dict) and isinstance(item.get("cited_evidence"), list):
+		item = {
+			**item,
+			"cited_evidence": [
+				portable_location(cited, repo_path) if isinstance(cited, str) else cited
+				for cited in item["cited_evidence"]
+			],
+		}
+	return item
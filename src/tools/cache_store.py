@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+try:
+	import fcntl
+except ImportError:
+	fcntl = None
+
+try:
+	import msvcrt
+except ImportError:
+	msvcrt = None
+
+
+CACHE_DIR_ENV = "AUDITOR_CACHE_DIR"
+
+
+def cache_root(*parts: str) -> Path:
+	configured = os.environ.get(CACHE_DIR_ENV, "").strip()
+	base = Path(configured).expanduser() if configured else Path.home() / ".cache" / "automaton_auditor"
+	path = base.joinpath(*parts)
+	path.mkdir(parents=True, exist_ok=True)
+	return path
+
+
+def env_int(name: str, default: int) -> int:
+	value = os.environ.get(name, "").strip()
+	if not value:
+		return default
+	try:
+		return int(value)
+	except ValueError:
+		return default
+
+
+def directory_size(path: Path) -> int:
+	total = 0
+	for root, _, files in os.walk(path):
+		for name in files:
+			try:
+				total += os.lstat(os.path.join(root, name)).st_size
+			except OSError:
+				continue
+	return total
+
+
+class FileLock:
+	def __init__(self, path: Path, poll_interval: float = 0.1) -> None:
+		self.path = path
+		self._poll_interval = poll_interval
+		self._fd: int | None = None
+
+	@property
+	def locked(self) -> bool:
+		return self._fd is not None
+
+	def acquire(self, blocking: bool = True, timeout: float | None = None) -> bool:
+		if self._fd is not None:
+			return True
+
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+		deadline = None if timeout is None else time.monotonic() + timeout
+
+		while True:
+			if self._try_lock(fd):
+				self._fd = fd
+				return True
+			if not blocking or (deadline is not None and time.monotonic() >= deadline):
+				os.close(fd)
+				return False
+			time.sleep(self._poll_interval)
+
+	def release(self) -> None:
+		if self._fd is None:
+			return
+
+		try:
+			if fcntl is not None:
+				fcntl.flock(self._fd, fcntl.LOCK_UN)
+			elif msvcrt is not None:
+				os.lseek(self._fd, 0, os.SEEK_SET)
+				msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+		finally:
+			os.close(self._fd)
+			self._fd = None
+
+	@staticmethod
+	def _try_lock(fd: int) -> bool:
+		try:
+			if fcntl is not None:
+				fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+			elif msvcrt is not None:
+				os.lseek(fd, 0, os.SEEK_SET)
+				msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+			return True
+		except OSError:
+			return False
+
+	def __enter__(self) -> "FileLock":
+		self.acquire()
+		return self
+
+	def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+		self.release()
+
+
+class JsonBlobCache:
+	def __init__(self, root: Path, max_bytes: int, compress: bool = False) -> None:
+		self.root = root
+		self.root.mkdir(parents=True, exist_ok=True)
+		self.max_bytes = max_bytes
+		self.compress = compress
+		self.hits = 0
+		self.misses = 0
+		self._approx_bytes: int | None = None
+
+	@classmethod
+	def from_env(
+		cls,
+		name: str,
+		max_bytes_env: str,
+		default_max_bytes: int,
+		compress: bool = False,
+	) -> "JsonBlobCache":
+		return cls(cache_root(name), env_int(max_bytes_env, default_max_bytes), compress=compress)
+
+	def get(self, key: str) -> Any | None:
+		entry_path = self._entry_path(key)
+		try:
+			raw = entry_path.read_bytes()
+			value = json.loads(gzip.decompress(raw) if self.compress else raw)
+		except (OSError, ValueError, EOFError):
+			self.misses += 1
+			return None
+
+		try:
+			# mtime doubles as the LRU clock.
+			os.utime(entry_path)
+		except OSError:
+			pass
+		self.hits += 1
+		return value
+
+	def put(self, key: str, value: Any) -> None:
+		entry_path = self._entry_path(key)
+		payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+		if self.compress:
+			payload = gzip.compress(payload)
+
+		entry_path.parent.mkdir(parents=True, exist_ok=True)
+		staging_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+		try:
+			staging_path.write_bytes(payload)
+			os.replace(staging_path, entry_path)
+		except OSError:
+			staging_path.unlink(missing_ok=True)
+			return
+
+		if self._approx_bytes is None:
+			self._approx_bytes = directory_size(self.root)
+		else:
+			self._approx_bytes += len(payload)
+		if self._approx_bytes > self.max_bytes:
+			self.evict()
+
+	def evict(self, target_ratio: float = 0.8) -> int:
+		entries: list[tuple[float, int, Path]] = []
+		for entry_path in self.root.glob("*/*"):
+			try:
+				stat = entry_path.stat()
+			except OSError:
+				continue
+			entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+		total = sum(size for _, size, _ in entries)
+		target = int(self.max_bytes * target_ratio)
+		removed = 0
+		entries.sort(key=lambda item: item[0])
+		for _, size, entry_path in entries:
+			if total <= target:
+				break
+			try:
+				entry_path.unlink()
+			except OSError:
+				continue
+			total -= size
+			removed += 1
+
+		self._approx_bytes = total
+		return removed
+
+	def _entry_path(self, key: str) -> Path:
+		digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+		suffix = ".json.gz" if self.compress else ".json"
+		return self.root / digest[:2] / f"{digest}{suffix}"
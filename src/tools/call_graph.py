@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import builtins
+import os
+from collections import deque
+from typing import Any
+
+
+_BUILTIN_NAMES = frozenset(dir(builtins))
+# Method calls on locals of unknown type are dropped when they look like plain
+# container/string operations; anything else (llm.invoke, ...) is kept verbatim.
+_BUILTIN_METHODS = frozenset(
+	name
+	for value_type in (str, bytes, list, dict, set, tuple)
+	for name in dir(value_type)
+	if not name.startswith("_")
+)
+_MAX_ALIAS_HOPS = 8
+
+
+def module_name_for(relative_path: str) -> str:
+	parts = relative_path.replace(os.sep, "/").removesuffix(".py").split("/")
+	if parts and parts[-1] == "__init__":
+		parts.pop()
+	return ".".join(part for part in parts if part)
+
+
+def absolute_import(module: str, is_package: bool, spec: list[Any]) -> str:
+	imported_module, level, name = spec
+	if level:
+		package_parts = module.split(".")
+		if not is_package:
+			package_parts = package_parts[:-1]
+		package_parts = package_parts[: max(0, len(package_parts) - (level - 1))]
+		imported_module = ".".join(part for part in (*package_parts, imported_module) if part)
+	return f"{imported_module}.{name}" if name else imported_module
+
+
+class CallGraph:
+	def __init__(self) -> None:
+		self.modules: dict[str, dict[str, Any]] = {}
+		self.definitions: dict[str, dict[str, Any]] = {}
+		self.classes: set[str] = set()
+		self.edges: dict[str, list[str]] = {}
+		self._module_aliases: dict[str, str | None] = {}
+		self._closures: dict[str, tuple[list[str], list[str]]] = {}
+
+	@classmethod
+	def from_symbol_findings(cls, findings: list[dict[str, Any]]) -> "CallGraph":
+		graph = cls()
+		raw_calls: list[tuple[str, str, str, list[str]]] = []
+
+		for finding in findings:
+			module = module_name_for(finding["file"])
+			if finding.get("kind") == "module":
+				graph.modules[module] = {
+					"file": finding["file"],
+					"is_package": finding["file"].replace(os.sep, "/").endswith("__init__.py"),
+					"imports": finding.get("imports", {}),
+					"instances": finding.get("instances", {}),
+				}
+				graph.classes.update(f"{module}.{name}" for name in finding.get("classes", []))
+			elif finding.get("kind") == "def":
+				symbol = f"{module}.{finding['symbol']}"
+				graph.definitions[symbol] = {"file": finding["file"], "line": finding.get("line")}
+				raw_calls.append((module, finding["symbol"], symbol, finding.get("calls", [])))
+
+		# Suffix aliases let "tools.repo_tools" match "src.tools.repo_tools" when a
+		# project imports its packages relative to a source root.
+		for module in graph.modules:
+			parts = module.split(".")
+			for start in range(1, len(parts)):
+				alias = ".".join(parts[start:])
+				if alias in graph._module_aliases and graph._module_aliases[alias] != module:
+					graph._module_aliases[alias] = None
+				else:
+					graph._module_aliases[alias] = module
+
+		for module, local_symbol, symbol, calls in raw_calls:
+			resolved: dict[str, None] = {}
+			for call in calls:
+				target = graph.resolve(module, call, local_symbol)
+				if target is not None:
+					resolved.setdefault(target, None)
+			graph.edges[symbol] = list(resolved)
+		return graph
+
+	def resolve(
+		self,
+		module: str,
+		reference: str,
+		scope: str | None = None,
+		constructor: bool = True,
+	) -> str | None:
+		head, _, rest = reference.partition(".")
+		scope_parts = scope.split(".") if scope else []
+		info = self.modules.get(module, {})
+		base: str | None = None
+
+		if head in {"self", "cls"} and scope_parts:
+			for end in range(len(scope_parts), 0, -1):
+				candidate = f"{module}.{'.'.join(scope_parts[:end])}"
+				if candidate in self.classes:
+					base = candidate
+					break
+		if base is None:
+			# Innermost enclosing scope first, like Python's own name lookup (minus closures).
+			for end in range(len(scope_parts), -1, -1):
+				candidate = ".".join([module, *scope_parts[:end], head])
+				if candidate in self.definitions or candidate in self.classes:
+					base = candidate
+					break
+		if base is None and head in info.get("imports", {}):
+			base = self._import_target(module, info["imports"][head])
+		if base is None and head in info.get("instances", {}):
+			base = self.resolve(module, info["instances"][head], constructor=False)
+		if base is None:
+			if not rest and head in _BUILTIN_NAMES:
+				return None
+			if rest and reference.rsplit(".", 1)[-1] in _BUILTIN_METHODS:
+				return None
+			return reference
+
+		return self._canonical(f"{base}.{rest}" if rest else base, constructor)
+
+	def callees(self, symbol: str) -> list[str]:
+		return list(self.edges.get(symbol, []))
+
+	def transitive_calls(self, symbol: str) -> dict[str, list[str]]:
+		# Closures are memoised, so repeated queries are dictionary lookups.
+		if symbol not in self._closures:
+			internal: list[str] = []
+			external: set[str] = set()
+			seen = {symbol}
+			queue = deque(self.edges.get(symbol, []))
+			while queue:
+				target = queue.popleft()
+				if target in seen:
+					continue
+				seen.add(target)
+				if target in self.definitions:
+					internal.append(target)
+					queue.extend(self.edges.get(target, []))
+				elif target not in self.classes:
+					external.add(target)
+			self._closures[symbol] = (sorted(internal), sorted(external))
+
+		internal, external = self._closures[symbol]
+		return {"internal": list(internal), "external": list(external)}
+
+	def calls_transitively(self, symbol: str, target_prefix: str) -> bool:
+		closure = self.transitive_calls(symbol)
+		return any(
+			callee == target_prefix or callee.startswith(f"{target_prefix}.")
+			for callee in (*closure["internal"], *closure["external"])
+		)
+
+	def node_call_report(self, topology: dict[str, Any]) -> list[dict[str, Any]]:
+		report: list[dict[str, Any]] = []
+		for builder in topology.get("builders", []):
+			module = module_name_for(builder["file"])
+			nodes: dict[str, Any] = {}
+			for node_name, target in builder.get("node_targets", {}).items():
+				symbol = self.resolve(module, target)
+				if symbol is None:
+					continue
+				entry: dict[str, Any] = {"symbol": symbol, "defined": symbol in self.definitions}
+				if entry["defined"]:
+					entry["defined_in"] = self.definitions[symbol]["file"]
+					entry["direct_calls"] = self.callees(symbol)
+					entry.update(self.transitive_calls(symbol))
+				nodes[node_name] = entry
+			report.append({"file": builder["file"], "builder": builder["builder"], "nodes": nodes})
+		return report
+
+	def summary(self) -> dict[str, int]:
+		return {
+			"modules": len(self.modules),
+			"definitions": len(self.definitions),
+			"classes": len(self.classes),
+			"call_edges": sum(len(targets) for targets in self.edges.values()),
+		}
+
+	def _import_target(self, module: str, spec: list[Any]) -> str:
+		return absolute_import(module, bool(self.modules.get(module, {}).get("is_package")), spec)
+
+	def _canonical(self, reference: str, constructor: bool = True) -> str:
+		# Follow package re-exports ("from .repo_tools import RepoManager" in an
+		# __init__) and source-root aliases until the name stops changing.
+		for _ in range(_MAX_ALIAS_HOPS):
+			if reference in self.definitions or reference in self.classes:
+				break
+			rewritten = self._rewrite_once(reference)
+			if rewritten is None or rewritten == reference:
+				break
+			reference = rewritten
+
+		# Calling a class runs its constructor.
+		if constructor and reference in self.classes and f"{reference}.__init__" in self.definitions:
+			return f"{reference}.__init__"
+		return reference
+
+	def _rewrite_once(self, reference: str) -> str | None:
+		parts = reference.split(".")
+		for end in range(len(parts) - 1, 0, -1):
+			prefix = ".".join(parts[:end])
+			module = prefix if prefix in self.modules else self._module_aliases.get(prefix)
+			if module is None:
+				continue
+			head, remainder = parts[end], parts[end + 1 :]
+			imports = self.modules[module]["imports"]
+			if head in imports:
+				target = self._import_target(module, imports[head])
+			elif module != prefix:
+				target = f"{module}.{head}"
+			else:
+				return None
+			return ".".join([target, *remainder])
+		return None
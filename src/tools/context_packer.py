@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from src.tools.repo_digest import CHARS_PER_TOKEN, MIN_PARTIAL_FILE_TOKENS, estimate_tokens
+
+if TYPE_CHECKING:
+	from src.tools.doc_tools import ForensicChunk
+
+
+DOC_CONTEXT_TOKEN_BUDGET_ENV = "AUDITOR_DOC_CONTEXT_TOKEN_BUDGET"
+DEFAULT_DOC_CONTEXT_TOKEN_BUDGET = 4_500
+
+
+@dataclass(slots=True)
+class PackedContext:
+	text: str
+	estimated_tokens: int
+	token_budget: int
+	chunk_ids: list[str] = field(default_factory=list)
+	truncated_chunk_ids: list[str] = field(default_factory=list)
+	omitted_chunks: int = 0
+
+	def summary(self) -> dict[str, Any]:
+		summary = asdict(self)
+		summary.pop("text")
+		return summary
+
+
+def render_chunk(chunk: ForensicChunk) -> str:
+	pages = f" (pages {', '.join(str(page) for page in chunk.page_numbers)})" if chunk.page_numbers else ""
+	marker = "#" * max(chunk.header_level, 1)
+	return f"{marker} {chunk.header}{pages}\n{chunk.content}\n\n"
+
+
+def pack_context(
+	chunks: list[ForensicChunk],
+	ranked: list[tuple[float, ForensicChunk]],
+	token_budget: int = DEFAULT_DOC_CONTEXT_TOKEN_BUDGET,
+) -> PackedContext:
+	# Without any relevance signal the document is packed front to back.
+	candidates = [chunk for score, chunk in ranked if score > 0] or list(chunks)
+	order = {chunk.chunk_id: position for position, chunk in enumerate(chunks)}
+
+	selected: dict[str, str] = {}
+	truncated: list[str] = []
+	used_tokens = 0
+	for chunk in candidates:
+		section = render_chunk(chunk)
+		section_tokens = estimate_tokens(section)
+		remaining = token_budget - used_tokens
+		if section_tokens <= remaining:
+			selected[chunk.chunk_id] = section
+			used_tokens += section_tokens
+			continue
+		# A lower-ranked but smaller section may still fit, so keep scanning.
+		if remaining >= MIN_PARTIAL_FILE_TOKENS:
+			marker = "\n... [truncated: context budget reached]\n\n"
+			partial = section[: max(0, remaining * CHARS_PER_TOKEN - len(marker))] + marker
+			selected[chunk.chunk_id] = partial
+			truncated.append(chunk.chunk_id)
+			used_tokens += estimate_tokens(partial)
+
+	# Selected sections are emitted in document order so the prompt still reads top to bottom.
+	chunk_ids = sorted(selected, key=lambda chunk_id: order.get(chunk_id, len(order)))
+	return PackedContext(
+		text="".join(selected[chunk_id] for chunk_id in chunk_ids),
+		estimated_tokens=used_tokens,
+		token_budget=token_budget,
+		chunk_ids=chunk_ids,
+		truncated_chunk_ids=truncated,
+		omitted_chunks=len(chunks) - len(chunk_ids),
+	)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+
+PAGE_KEYS = frozenset({"page", "page_no", "page_num", "page_number"})
+_PAGE_MENTION = re.compile(r"\b(?:page|p\.)\s*(\d{1,4})\b", re.IGNORECASE)
+_LINE_MARKUP = re.compile(r"^(?:#{1,6}\s+|[-*+]\s+|\d+[.)]\s+|>\s*)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+	return _WHITESPACE.sub(" ", _LINE_MARKUP.sub("", text.strip())).strip().lower()
+
+
+def page_mentions(text: str) -> set[int]:
+	return {int(match) for match in _PAGE_MENTION.findall(text)}
+
+
+@dataclass(slots=True)
+class ProvenanceIndex:
+	pages: list[int] = field(default_factory=list)
+	text_pages: dict[str, set[int]] = field(default_factory=dict)
+	tables: list[dict[str, Any]] = field(default_factory=list)
+	tables_by_page: dict[int, list[str]] = field(default_factory=dict)
+	first_table_number: int = 1
+
+	@classmethod
+	def build(cls, payload: dict[str, Any] | None, first_table_number: int = 1) -> "ProvenanceIndex":
+		# One iterative walk over the Docling JSON collects every page reference,
+		# text-to-page provenance and table; chunking then only does dict lookups.
+		# Streamed page ranges pass first_table_number so table ids stay unique.
+		index = cls(first_table_number=first_table_number)
+		pages: set[int] = set()
+		stack: list[tuple[str, Any, bool]] = [("", payload or {}, False)]
+		while stack:
+			prefix, node, inside_table = stack.pop()
+			if isinstance(node, list):
+				for position in range(len(node) - 1, -1, -1):
+					stack.append((f"{prefix}[{position}]", node[position], inside_table))
+				continue
+			if not isinstance(node, dict):
+				continue
+
+			text = node.get("text")
+			if isinstance(text, str) and text.strip():
+				item_pages = _provenance_pages(node)
+				if item_pages:
+					index.text_pages.setdefault(normalize_text(text), set()).update(item_pages)
+
+			children: list[tuple[str, Any, bool]] = []
+			for key, value in node.items():
+				full_key = f"{prefix}.{key}" if prefix else str(key)
+				page = _page_value(value) if str(key).lower() in PAGE_KEYS else None
+				if page:
+					pages.add(page)
+				child_in_table = inside_table
+				if not inside_table and "table" in str(key).lower():
+					child_in_table = index._register_table(full_key, value)
+				children.append((full_key, value, child_in_table))
+			stack.extend(reversed(children))
+
+		index.pages = sorted(pages)
+		return index
+
+	def _register_table(self, key: str, value: Any) -> bool:
+		if isinstance(value, dict):
+			self._add_table(key, value)
+			return True
+		if isinstance(value, list):
+			if value and all(isinstance(item, dict) for item in value):
+				for position, item in enumerate(value):
+					self._add_table(f"{key}[{position}]", item)
+			else:
+				self._add_table(key, {}, entries=len(value))
+			return True
+		return False
+
+	def _add_table(self, key: str, value: dict[str, Any], entries: int | None = None) -> None:
+		data = value.get("data") if isinstance(value.get("data"), dict) else {}
+		page = _page_value(value.get("page") or value.get("page_no") or value.get("page_number"))
+		if page is None:
+			page = min(_provenance_pages(value), default=None)
+		record: dict[str, Any] = {
+			"table_id": f"table_{self.first_table_number + len(self.tables):03d}",
+			"key": key,
+			"rows": value.get("rows") or value.get("row_count") or data.get("num_rows"),
+			"cols": value.get("cols") or value.get("column_count") or data.get("num_cols"),
+			"page": page,
+		}
+		if entries is not None:
+			record["entries"] = entries
+		self.tables.append(record)
+		if page is not None:
+			self.tables_by_page.setdefault(page, []).append(record["table_id"])
+
+	def pages_for(self, lines: list[str]) -> list[int]:
+		found: set[int] = set()
+		for line in lines:
+			normalized = normalize_text(line)
+			if not normalized:
+				continue
+			found.update(self.text_pages.get(normalized, ()))
+			found.update(page_mentions(line))
+		return sorted(page for page in found if page > 0)
+
+	def tables_for(self, pages: list[int]) -> list[str]:
+		table_ids: list[str] = []
+		for page in pages:
+			table_ids.extend(self.tables_by_page.get(page, ()))
+		return table_ids
+
+
+def _page_value(value: Any) -> int | None:
+	if isinstance(value, bool):
+		return None
+	if isinstance(value, int):
+		return value if value > 0 else None
+	if isinstance(value, str) and value.isdigit():
+		return int(value) or None
+	return None
+
+
+def _provenance_pages(node: dict[str, Any]) -> set[int]:
+	provenance = node.get("prov")
+	if not isinstance(provenance, list):
+		return set()
+	pages: set[int] = set()
+	for entry in provenance:
+		if isinstance(entry, dict):
+			page = _page_value(entry.get("page_no") or entry.get("page"))
+			if page:
+				pages.add(page)
+	return pages
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from src.tools.cache_store import JsonBlobCache
+from src.tools.context_packer import render_chunk
+from src.tools.repo_digest import CHARS_PER_TOKEN, estimate_tokens
+
+if TYPE_CHECKING:
+	from src.tools.doc_tools import ForensicChunk
+
+
+DOC_SUMMARY_MODE_ENV = "AUDITOR_DOC_SUMMARY_MODE"
+DOC_SUMMARY_CONCURRENCY_ENV = "AUDITOR_DOC_SUMMARY_CONCURRENCY"
+DOC_SUMMARY_CACHE_MAX_BYTES_ENV = "AUDITOR_DOC_SUMMARY_CACHE_MAX_BYTES"
+DEFAULT_DOC_SUMMARY_CONCURRENCY = 4
+DEFAULT_DOC_SUMMARY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SUMMARY_MODES = ("auto", "single", "map_reduce")
+SUMMARY_PROMPT_VERSION = 1
+# Roughly a 100-page report; shorter documents go through the single packed call.
+MAP_REDUCE_MIN_DOCUMENT_TOKENS = 40_000
+MAP_WINDOW_TOKENS = 3_000
+REDUCE_BUDGET_TOKENS = 6_000
+MAX_ATTEMPTS = 3
+RESULT_KEYS = ("scoring_rubric_rules", "technical_constraints")
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+MAP_PROMPT = (
+	"You are a forensic auditor for a LangGraph project. From the report excerpt below, "
+	"list every scoring rubric rule and every technical constraint it states. "
+	"Return only JSON with keys 'scoring_rubric_rules' and 'technical_constraints', "
+	"each a list of short strings; use empty lists when the excerpt has none.\n\n"
+	"EXCERPT:\n{text}"
+)
+REDUCE_PROMPT = (
+	"You are a forensic auditor for a LangGraph project. Merge the partial extractions "
+	"below into one result, removing duplicates and keeping concrete thresholds. "
+	"Return only JSON with keys 'scoring_rubric_rules' and 'technical_constraints'.\n\n"
+	"PARTIAL EXTRACTIONS:\n{text}"
+)
+
+
+@dataclass(slots=True)
+class SummaryResult:
+	text: str
+	units: int = 0
+	map_calls: int = 0
+	cache_hits: int = 0
+	reduce_calls: int = 0
+	reduce_rounds: int = 0
+	elapsed_seconds: float = 0.0
+
+	def summary(self) -> dict[str, Any]:
+		summary = asdict(self)
+		summary.pop("text")
+		return summary
+
+
+def parse_extraction(text: str) -> dict[str, list[str]]:
+	match = _JSON_OBJECT.search(text)
+	try:
+		payload = json.loads(match.group(0)) if match else {}
+	except ValueError:
+		payload = {}
+	if not isinstance(payload, dict):
+		payload = {}
+	result: dict[str, list[str]] = {}
+	for key in RESULT_KEYS:
+		value = payload.get(key, [])
+		if isinstance(value, str):
+			value = [value]
+		result[key] = [str(item) for item in value] if isinstance(value, list) else []
+	if not match and text.strip():
+		# Keep free-text answers rather than silently dropping a section.
+		result["scoring_rubric_rules"].append(text.strip())
+	return result
+
+
+def iter_map_units(chunks: Iterable[ForensicChunk], window_tokens: int = MAP_WINDOW_TOKENS) -> Iterator[str]:
+	# One unit per chunk keeps cache keys stable when an unrelated section is edited;
+	# only sections larger than the window are split.
+	window_chars = window_tokens * CHARS_PER_TOKEN
+	for chunk in chunks:
+		text = render_chunk(chunk)
+		for start in range(0, len(text), window_chars):
+			yield text[start : start + window_chars]
+
+
+class MapReduceSummarizer:
+	def __init__(
+		self,
+		invoke: Callable[[str], str],
+		cache: JsonBlobCache | None = None,
+		concurrency: int = DEFAULT_DOC_SUMMARY_CONCURRENCY,
+		model_key: str = "",
+		map_window_tokens: int = MAP_WINDOW_TOKENS,
+		reduce_budget_tokens: int = REDUCE_BUDGET_TOKENS,
+	) -> None:
+		self._invoke = invoke
+		self._cache = cache
+		self._concurrency = max(1, concurrency)
+		self._model_key = model_key
+		self._map_window_tokens = map_window_tokens
+		self._reduce_budget_tokens = reduce_budget_tokens
+
+	def summarize(self, chunks: Iterable[ForensicChunk]) -> SummaryResult:
+		# Chunks may be a live generator: map calls start while later pages are
+		# still being converted, and only the small partial results are kept.
+		started = time.perf_counter()
+		result = SummaryResult(text="")
+
+		def counted_units() -> Iterator[str]:
+			for unit in iter_map_units(chunks, self._map_window_tokens):
+				result.units += 1
+				yield unit
+
+		partials = self._run_all("map", MAP_PROMPT, counted_units(), result)
+		texts = [self._format_partial(partial) for partial in partials if any(partial.values())]
+
+		# Reduce in rounds until everything fits in a single call.
+		while len(texts) > 1 and estimate_tokens("\n".join(texts)) > self._reduce_budget_tokens:
+			result.reduce_rounds += 1
+			merged = self._run_all("reduce", REDUCE_PROMPT, self._group(texts), result)
+			texts = [self._format_partial(partial) for partial in merged]
+
+		result.reduce_rounds += 1
+		final = self._run_all("reduce", REDUCE_PROMPT, ["\n".join(texts)], result)[0] if texts else {}
+		result.text = json.dumps({key: final.get(key, []) for key in RESULT_KEYS}, ensure_ascii=False)
+		result.elapsed_seconds = round(time.perf_counter() - started, 3)
+		return result
+
+	def _group(self, texts: list[str]) -> list[str]:
+		groups: list[str] = []
+		current: list[str] = []
+		current_tokens = 0
+		for text in texts:
+			tokens = estimate_tokens(text)
+			if current and current_tokens + tokens > self._reduce_budget_tokens:
+				groups.append("\n".join(current))
+				current, current_tokens = [], 0
+			current.append(text)
+			current_tokens += tokens
+		if current:
+			groups.append("\n".join(current))
+		# Guarantee progress even when every partial is individually oversized.
+		if len(groups) == len(texts) and len(texts) > 1:
+			groups = ["\n".join(texts[index : index + 2]) for index in range(0, len(texts), 2)]
+		return groups
+
+	def _run_all(
+		self,
+		stage: str,
+		template: str,
+		texts: Iterable[str],
+		result: SummaryResult,
+	) -> list[dict[str, list[str]]]:
+		outputs: list[dict[str, list[str]] | Future] = []
+		submitted: dict[str, Future] = {}
+		running: set[Future] = set()
+		# Bounded pool: the provider's rate limit, not the document size, sets the fan-out.
+		with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+			for text in texts:
+				key = self._cache_key(stage, text)
+				if key in submitted:
+					outputs.append(submitted[key])
+					continue
+				cached = self._cache.get(key) if self._cache is not None else None
+				if cached is not None:
+					outputs.append(cached)
+					result.cache_hits += 1
+					continue
+				# Pulling more input waits while the queue is full, so a streamed
+				# document is never buffered ahead of the LLM calls.
+				if len(running) >= self._concurrency * 2:
+					_, running = wait(running, return_when=FIRST_COMPLETED)
+				future = executor.submit(self._call_and_store, key, template.format(text=text))
+				submitted[key] = future
+				running.add(future)
+				outputs.append(future)
+
+		if stage == "map":
+			result.map_calls += len(submitted)
+		else:
+			result.reduce_calls += len(submitted)
+		return [output.result() if isinstance(output, Future) else output for output in outputs]
+
+	def _call_and_store(self, key: str, prompt: str) -> dict[str, list[str]]:
+		output = self._call(prompt)
+		if self._cache is not None:
+			self._cache.put(key, output)
+		return output
+
+	def _call(self, prompt: str) -> dict[str, list[str]]:
+		for attempt in range(MAX_ATTEMPTS):
+			try:
+				return parse_extraction(self._invoke(prompt))
+			except Exception as error:
+				if attempt == MAX_ATTEMPTS - 1:
+					raise RuntimeError(f"Summarization call failed: {error}") from error
+				status_code = getattr(error, "status_code", None)
+				time.sleep(10 * (attempt + 1) if status_code == 429 else 1)
+		return {key: [] for key in RESULT_KEYS}
+
+	def _cache_key(self, stage: str, text: str) -> str:
+		digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+		return f"summary-v{SUMMARY_PROMPT_VERSION}-{stage}-{self._model_key}:{digest}"
+
+	@staticmethod
+	def _format_partial(partial: dict[str, list[str]]) -> str:
+		return json.dumps({key: partial.get(key, []) for key in RESULT_KEYS}, ensure_ascii=False)
@@ -1,23 +1,146 @@
 from __future__ import annotations
 
+import hashlib
 import re
 import tempfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from importlib import metadata
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 from pydantic import BaseModel, Field
 
+from src.tools.cache_store import JsonBlobCache
+from src.tools.context_packer import DEFAULT_DOC_CONTEXT_TOKEN_BUDGET, PackedContext, pack_context
+from src.tools.doc_index import ProvenanceIndex
+from src.tools.pdf_parallel import (
+	DEFAULT_PAGES_PER_RANGE,
+	convert_ranges,
+	iter_converted_ranges,
+	iter_split_document,
+	offset_pages,
+	page_ranges,
+	split_document,
+	stitch_ranges,
+)
+from src.tools.pdf_probe import (
+	TIER_FULL,
+	TIER_PYMUPDF,
+	TIER_TABLES,
+	TIER_TEXT,
+	PROBE_VERSION,
+	PdfProbe,
+	probe_document,
+	pymupdf_conversion,
+)
+from src.tools.text_index import Bm25Index, split_sentences, tokenize
+
 try:
 	from docling.document_converter import DocumentConverter
 except ImportError:
 	DocumentConverter = None
 
+try:
+	from docling.datamodel.base_models import DocumentStream, InputFormat
+	from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+	from docling.document_converter import PdfFormatOption
+except ImportError:
+	DocumentStream = None
+	InputFormat = None
+	PdfPipelineOptions = None
+	TableFormerMode = None
+	PdfFormatOption = None
+
 try:
 	import fitz
 except ImportError:
 	fitz = None
 
 
+DOCLING_CACHE_MAX_BYTES_ENV = "AUDITOR_DOCLING_CACHE_MAX_BYTES"
+DEFAULT_DOCLING_CACHE_MAX_BYTES = 512 * 1024 * 1024
+CONVERSION_CACHE_VERSION = 3
+RUBRIC_SECTION_TITLES = ("objectives", "deliverables", "constraints")
+MAX_SECTION_CHARS = 2000
+_HEADER_PATTERN = re.compile(r"^(#{1,2})\s+(.*)$")
+_ANY_HEADING = re.compile(r"^\s{0,3}#{1,6}\s+", re.MULTILINE)
+
+# Separate locks: building a converter must not wait on, or deadlock with, a
+# conversion that already holds the pipeline.
+_CONVERTER_LOCK = threading.Lock()
+_CONVERSION_LOCK = threading.Lock()
+_SHARED_CONVERTERS: dict[str, Any] = {}
+
+
+def docling_version() -> str:
+	try:
+		return metadata.version("docling")
+	except metadata.PackageNotFoundError:
+		return "unavailable"
+
+
+def conversion_engine() -> str:
+	if DocumentConverter is not None:
+		return f"docling-{docling_version()}"
+	if fitz is not None:
+		return f"pymupdf-{fitz.VersionBind}"
+	return "unavailable"
+
+
+def _build_converter(tier: str) -> Any:
+	if tier == TIER_FULL or PdfPipelineOptions is None or PdfFormatOption is None:
+		return DocumentConverter()
+	# Born-digital reports already carry a text layer, so OCR is skipped; the table
+	# model only runs, in its fast mode, when the probe saw ruled tables.
+	options = PdfPipelineOptions()
+	options.do_ocr = False
+	options.do_table_structure = tier == TIER_TABLES
+	if tier == TIER_TABLES and TableFormerMode is not None:
+		options.table_structure_options.mode = TableFormerMode.FAST
+	return DocumentConverter(format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=options)})
+
+
+def get_shared_converter(tier: str = TIER_FULL) -> Any:
+	# DocumentConverter loads its layout models on construction, so one instance
+	# per pipeline tier is built per process and reused by every ingest.
+	if DocumentConverter is None:
+		raise RuntimeError("Docling is not installed. Run 'uv add docling' and retry.")
+	with _CONVERTER_LOCK:
+		if tier not in _SHARED_CONVERTERS:
+			_SHARED_CONVERTERS[tier] = _build_converter(tier)
+		return _SHARED_CONVERTERS[tier]
+
+
+def warm_document_converter(tier: str = TIER_TEXT) -> bool:
+	try:
+		get_shared_converter(tier)
+	except Exception:
+		return False
+	return True
+
+
+def convert_page_range(task: tuple[str, bytes, str, int]) -> tuple[str, dict[str, Any]]:
+	# Runs inside page-pool workers; each worker holds its own converters.
+	name, data, tier, first_page = task
+	if tier == TIER_PYMUPDF:
+		with fitz.open(stream=data, filetype="pdf") as document:
+			markdown_text, json_payload = pymupdf_conversion(document)
+	else:
+		result = get_shared_converter(tier).convert(DocumentStream(name=name, stream=BytesIO(data)))
+		markdown_text = DocAnalyst._extract_markdown(result)
+		json_payload = DocAnalyst._extract_json(result)
+	return markdown_text, offset_pages(json_payload, first_page - 1)
+
+
+def pdf_content_hash(path: Path) -> str:
+	with path.open("rb") as handle:
+		return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
 class RubricDimensions(BaseModel):
 	objectives: str = Field(default="")
 	deliverables: str = Field(default="")
@@ -30,192 +153,529 @@ class ForensicChunk(BaseModel):
 	header_level: int
 	content: str
 	page_numbers: list[int] = Field(default_factory=list)
-	table_metadata: list[dict[str, Any]] = Field(default_factory=list)
+	table_ids: list[str] = Field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PdfArtifact:
+	pdf_path: str
+	content_sha256: str = ""
+	size_bytes: int = 0
+	page_count: int = 0
+	markdown: str = ""
+	json_payload: dict[str, Any] = field(default_factory=dict)
+	chunks: list[dict[str, Any]] = field(default_factory=list)
+	tables: list[dict[str, Any]] = field(default_factory=list)
+	pipeline: dict[str, Any] = field(default_factory=dict)
+	probe: PdfProbe | None = None
+	image_paths: list[str] = field(default_factory=list)
+	cache_hit: bool = False
+	error_type: str | None = None
+	error: str | None = None
+	image_error: str | None = None
+
+	@property
+	def parsed(self) -> bool:
+		return self.error is None
+
+	def summary(self) -> dict[str, Any]:
+		return {
+			"pdf_path": self.pdf_path,
+			"content_sha256": self.content_sha256,
+			"size_bytes": self.size_bytes,
+			"page_count": self.page_count,
+			"markdown_length": len(self.markdown),
+			"chunks": len(self.chunks),
+			"tables": len(self.tables),
+			"images": len(self.image_paths),
+			"cache_hit": self.cache_hit,
+			# Inspected-only artifacts report the tier the probe plans to convert with.
+			"tier": self.pipeline.get("tier") or (self.probe.tier() if self.probe is not None else None),
+			"conversion_seconds": self.pipeline.get("conversion_seconds"),
+			"error": self.error,
+			"image_error": self.image_error,
+		}
+
+
+ChunkLocator = Callable[[list[str]], tuple[list[int], list[str]]]
+
+
+def iter_header_chunks(lines: Iterable[str], locate: ChunkLocator) -> Iterator[ForensicChunk]:
+	# Lines may come from a generator, so chunks are yielded as soon as the next
+	# header closes them and only the open section is held in memory.
+	header = "Document Preamble"
+	level = 0
+	current: list[str] = []
+	count = 0
+	for line in lines:
+		match = _HEADER_PATTERN.match(line.strip())
+		if not match:
+			current.append(line)
+			continue
+		chunk = _finish_chunk(header, level, current, count + 1, locate)
+		if chunk is not None:
+			count += 1
+			yield chunk
+		level = len(match.group(1))
+		header = match.group(2).strip()
+		current = []
+
+	chunk = _finish_chunk(header, level, current, count + 1, locate)
+	if chunk is not None:
+		yield chunk
+
+
+def _finish_chunk(
+	header: str,
+	level: int,
+	lines: list[str],
+	number: int,
+	locate: ChunkLocator,
+) -> ForensicChunk | None:
+	content = "\n".join(lines).strip()
+	if not content:
+		return None
+	page_numbers, table_ids = locate([header, *lines])
+	return ForensicChunk(
+		chunk_id=f"chunk_{number:03d}",
+		header=header,
+		header_level=level,
+		content=content,
+		page_numbers=page_numbers,
+		table_ids=table_ids,
+	)
+
+
+class RubricSectionCollector:
+	def __init__(self, titles: tuple[str, ...] = RUBRIC_SECTION_TITLES) -> None:
+		self._patterns = {
+			title: (
+				re.compile(rf"{re.escape(title)}\b", re.IGNORECASE),
+				re.compile(rf"^\s{{0,3}}#{{1,6}}\s*{re.escape(title)}\b.*$", re.IGNORECASE | re.MULTILINE),
+			)
+			for title in titles
+		}
+		self._sections: dict[str, str] = {}
+
+	def add(self, chunk: ForensicChunk) -> None:
+		# Only the first match per title is kept, truncated, so memory stays flat
+		# however many chunks stream past.
+		for title, (header_pattern, heading_pattern) in self._patterns.items():
+			if title in self._sections:
+				continue
+			if header_pattern.match(chunk.header):
+				body = chunk.content
+			else:
+				match = heading_pattern.search(chunk.content)
+				if not match:
+					continue
+				body = chunk.content[match.end() :]
+			next_heading = _ANY_HEADING.search(body)
+			if next_heading:
+				body = body[: next_heading.start()]
+			self._sections[title] = DocAnalyst._truncate_snippet(body, max_chars=MAX_SECTION_CHARS)
+
+	def section(self, title: str) -> str:
+		return self._sections.get(title, "")
 
 
 class DocumentForensics:
-	def __init__(self) -> None:
+	def __init__(
+		self,
+		conversion_cache: JsonBlobCache | None = None,
+		page_workers: int = 1,
+		pages_per_range: int = DEFAULT_PAGES_PER_RANGE,
+	) -> None:
 		self._markdown_text: str = ""
 		self._json_payload: dict[str, Any] = {}
 		self._chunks: list[ForensicChunk] = []
+		self._tables: dict[str, dict[str, Any]] = {}
+		self._chunk_index: Bm25Index[ForensicChunk] = Bm25Index()
+		self._sentence_index: Bm25Index[str] = Bm25Index()
+		self._conversion_cache = conversion_cache
+		self._page_workers = page_workers
+		self._pages_per_range = max(1, pages_per_range)
+		self._pipeline: dict[str, Any] = {}
 
 	@property
 	def chunks(self) -> list[ForensicChunk]:
 		return list(self._chunks)
 
-	def ingest(self, pdf_path: str) -> dict[str, Any]:
+	@property
+	def pipeline(self) -> dict[str, Any]:
+		return dict(self._pipeline)
+
+	@property
+	def tables(self) -> list[dict[str, Any]]:
+		return list(self._tables.values())
+
+	def table(self, table_id: str) -> dict[str, Any] | None:
+		return self._tables.get(table_id)
+
+	def load(
+		self,
+		markdown_text: str,
+		json_payload: dict[str, Any],
+		chunks: list[dict[str, Any]],
+		tables: list[dict[str, Any]] | None = None,
+	) -> None:
+		self._markdown_text = markdown_text
+		self._json_payload = json_payload
+		self._chunks = [ForensicChunk(**chunk) for chunk in chunks]
+		self._tables = {table["table_id"]: table for table in tables or []}
+		self._build_search_indexes()
+
+	def _build_search_indexes(self) -> None:
+		# Built once per document so every rubric query is a postings lookup.
+		chunks = self._chunks
+		self._reset_search_indexes()
+		for chunk in chunks:
+			self._index_chunk(chunk)
+		self._chunks = chunks
+
+	def _reset_search_indexes(self) -> None:
+		self._chunks = []
+		self._chunk_index = Bm25Index()
+		self._sentence_index = Bm25Index()
+
+	def _index_chunk(self, chunk: ForensicChunk) -> None:
+		self._chunks.append(chunk)
+		self._chunk_index.add(f"{chunk.header}\n{chunk.content}", chunk)
+		for sentence in split_sentences(chunk.content):
+			self._sentence_index.add(sentence, sentence)
+
+	def iter_chunks(
+		self,
+		pdf_path: str,
+		data: bytes | None = None,
+		content_hash: str | None = None,
+		probe: PdfProbe | None = None,
+		retain: bool = False,
+	) -> Iterator[ForensicChunk]:
+		# Full markdown and JSON are never kept: each page range is converted,
+		# chunked and handed on, then dropped before the next one is read. Chunks
+		# are only indexed for search_sections/rank_chunks when retain is set.
+		self._markdown_text = ""
+		self._json_payload = {}
+		self._tables = {}
+		self._pipeline = {}
+		self._reset_search_indexes()
+
+		count = 0
+		chars = 0
+		for chunk in self._stream_chunks(Path(pdf_path), data, content_hash, probe):
+			if retain:
+				self._index_chunk(chunk)
+			count += 1
+			chars += len(chunk.content)
+			yield chunk
+		self._pipeline.update(chunks=count, content_chars=chars)
+
+	def _stream_chunks(
+		self,
+		path: Path,
+		data: bytes | None,
+		content_hash: str | None,
+		probe: PdfProbe | None,
+	) -> Iterator[ForensicChunk]:
+		if not path.exists() or not path.is_file():
+			raise FileNotFoundError(f"PDF file not found: {path}")
+
+		cache_key: str | None = None
+		if self._conversion_cache is not None:
+			if content_hash is None and data is not None:
+				content_hash = hashlib.sha256(data).hexdigest()
+			cache_key = self._conversion_cache_key(path, content_hash)
+			cached = self._conversion_cache.get(cache_key)
+			if cached is not None:
+				self._tables = {table["table_id"]: table for table in cached["tables"]}
+				self._pipeline = {**cached["pipeline"], "cache_hit": True}
+				for chunk_data in cached["chunks"]:
+					yield ForensicChunk(**chunk_data)
+				return
+
+		if fitz is None or (DocumentConverter is not None and DocumentStream is None):
+			result = self.ingest(str(path), data=data, content_hash=content_hash, probe=probe)
+			if not result.get("success", False):
+				raise RuntimeError(result.get("error", "Unknown PDF parsing error"))
+			self._pipeline = {**result["pipeline"], "cache_hit": result["cache_hit"]}
+			chunks = self._chunks
+			self._markdown_text = ""
+			self._json_payload = {}
+			self._reset_search_indexes()
+			yield from chunks
+			return
+
+		started = time.perf_counter()
+		# Only the compact chunk records are held, and only to fill the cache.
+		chunk_dumps: list[dict[str, Any]] | None = [] if cache_key is not None else None
+		with self._open_document(path, data) as document:
+			probe = probe or probe_document(document)
+			ranges = page_ranges(probe.page_count, self._pages_per_range)
+			range_tiers: list[str] = []
+
+			def tasks() -> Iterator[tuple[str, bytes, str, int]]:
+				for (first, last), part in zip(ranges, iter_split_document(document, ranges)):
+					tier = probe.range_tier(first, last) if DocumentConverter is not None else TIER_PYMUPDF
+					range_tiers.append(tier)
+					yield f"{path.stem}_p{first}-{last}.pdf", part, tier, first
+
+			if self._page_workers > 1:
+				converted = iter_converted_ranges(convert_page_range, tasks(), self._page_workers, warm_document_converter)
+			else:
+				converted = (self._convert_range_locked(task) for task in tasks())
+
+			active: list[ProvenanceIndex] = []
+			seen_pages: set[int] = set()
+
+			def range_lines() -> Iterator[str]:
+				separate = False
+				for markdown_text, json_payload in converted:
+					index = ProvenanceIndex.build(json_payload, first_table_number=len(self._tables) + 1)
+					self._tables.update((table["table_id"], table) for table in index.tables)
+					seen_pages.update(index.pages)
+					active.append(index)
+					markdown_text = markdown_text.strip()
+					if not markdown_text:
+						continue
+					# Ranges are separated by one blank line, exactly as stitch_ranges
+					# joins them, so streamed chunks match the batch output.
+					if separate:
+						yield ""
+					separate = True
+					yield from markdown_text.splitlines()
+
+			def locate(lines: list[str]) -> tuple[list[int], list[str]]:
+				local = sorted({page for index in active for page in index.pages_for(lines)})
+				table_ids = [table_id for index in active for table_id in index.tables_for(local)]
+				# Ranges before the one now being read can no longer be referenced.
+				del active[:-1]
+				return local or sorted(seen_pages), table_ids
+
+			for chunk in iter_header_chunks(range_lines(), locate):
+				if chunk_dumps is not None:
+					chunk_dumps.append(chunk.model_dump())
+				yield chunk
+
+		pipeline = {
+			"tier": "mixed" if len(set(range_tiers)) > 1 else next(iter(range_tiers), None),
+			"engine": conversion_engine(),
+			"mode": "streamed",
+			"range_tiers": range_tiers,
+			"workers": self._page_workers,
+			"conversion_seconds": round(time.perf_counter() - started, 3),
+			"probe": probe.summary(),
+		}
+		self._pipeline = {**pipeline, "cache_hit": False}
+		# Written only once the stream is fully consumed. Streamed entries carry no
+		# markdown or JSON, so ingest() treats them as a miss and upgrades them.
+		if cache_key is not None and self._conversion_cache is not None and chunk_dumps is not None:
+			self._conversion_cache.put(
+				cache_key,
+				{"chunks": chunk_dumps, "tables": self.tables, "pipeline": pipeline},
+			)
+
+	@staticmethod
+	def _convert_range_locked(task: tuple[str, bytes, str, int]) -> tuple[str, dict[str, Any]]:
+		with _CONVERSION_LOCK:
+			return convert_page_range(task)
+
+	@staticmethod
+	def _conversion_cache_key(path: Path, content_hash: str | None) -> str:
+		digest = content_hash or pdf_content_hash(path)
+		return f"{conversion_engine()}-v{CONVERSION_CACHE_VERSION}-probe{PROBE_VERSION}:{digest}"
+
+	def ingest(
+		self,
+		pdf_path: str,
+		data: bytes | None = None,
+		content_hash: str | None = None,
+		probe: PdfProbe | None = None,
+	) -> dict[str, Any]:
 		path = Path(pdf_path)
 		if not path.exists():
 			return self._error_payload("FileNotFoundError", f"PDF file not found: {pdf_path}")
 		if not path.is_file():
 			return self._error_payload("FileNotFoundError", f"PDF path is not a file: {pdf_path}")
 
-		if DocumentConverter is None:
+		if DocumentConverter is None and fitz is None:
 			return self._error_payload(
 				"ImportError",
 				"Docling is not installed. Run 'uv add docling' and retry.",
 			)
 
 		try:
-			converter = DocumentConverter()
-			result = converter.convert(str(path))
-			markdown_text = DocAnalyst._extract_markdown(result)
-			json_payload = DocAnalyst._extract_json(result)
+			cache_key: str | None = None
+			if self._conversion_cache is not None:
+				cache_key = self._conversion_cache_key(path, content_hash)
+				cached = self._conversion_cache.get(cache_key)
+				if cached is not None and "markdown" in cached:
+					self.load(cached["markdown"], cached["json"], cached["chunks"], cached["tables"])
+					return {
+						"success": True,
+						"pdf_path": str(path),
+						"markdown": self._markdown_text,
+						"json": self._json_payload,
+						"chunks": cached["chunks"],
+						"tables": cached["tables"],
+						"pipeline": cached["pipeline"],
+						"cache_hit": True,
+					}
+
+			started = time.perf_counter()
+			if probe is None and fitz is not None:
+				probe = self._probe(path, data)
+			if DocumentConverter is None:
+				# Without Docling the text layer is still usable for chunking and search.
+				tier = TIER_PYMUPDF
+			else:
+				tier = probe.tier() if probe is not None else TIER_FULL
+
+			range_tiers: list[str] = []
+			if self._use_page_pool(probe):
+				markdown_text, json_payload, range_tiers = self._convert_page_ranges(path, data, probe)
+			elif tier == TIER_PYMUPDF:
+				with self._open_document(path, data) as document:
+					markdown_text, json_payload = pymupdf_conversion(document)
+			else:
+				converter = get_shared_converter(tier)
+				# Docling pipelines are not documented as thread-safe; the doc and vision
+				# branches may share this process.
+				source: Any = str(path)
+				if data is not None and DocumentStream is not None:
+					# Bytes already read by the caller are handed over instead of reopening the file.
+					source = DocumentStream(name=path.name, stream=BytesIO(data))
+				with _CONVERSION_LOCK:
+					result = converter.convert(source)
+				markdown_text = DocAnalyst._extract_markdown(result)
+				json_payload = DocAnalyst._extract_json(result)
+			pipeline = {
+				"tier": tier if len(set(range_tiers)) <= 1 else "mixed",
+				"engine": conversion_engine(),
+				"mode": "page_parallel" if range_tiers else "serial",
+				"range_tiers": range_tiers,
+				"workers": self._page_workers if range_tiers else 1,
+				"conversion_seconds": round(time.perf_counter() - started, 3),
+				"probe": probe.summary() if probe is not None else None,
+			}
 
 			self._markdown_text = markdown_text
 			self._json_payload = json_payload
 			self._chunks = self.chunk_markdown_by_headers(markdown_text, json_payload)
+			self._build_search_indexes()
+			chunk_dumps = [chunk.model_dump() for chunk in self._chunks]
+			tables = self.tables
+
+			if cache_key is not None and self._conversion_cache is not None:
+				self._conversion_cache.put(
+					cache_key,
+					{
+						"markdown": markdown_text,
+						"json": json_payload,
+						"chunks": chunk_dumps,
+						"tables": tables,
+						"pipeline": pipeline,
+					},
+				)
 
 			return {
 				"success": True,
 				"pdf_path": str(path),
 				"markdown": markdown_text,
 				"json": json_payload,
-				"chunks": [chunk.model_dump() for chunk in self._chunks],
+				"chunks": chunk_dumps,
+				"tables": tables,
+				"pipeline": pipeline,
+				"cache_hit": False,
 			}
 		except Exception as error:
 			return self._error_payload(
 				"CorruptedOrUnreadablePDF",
-				f"Failed to parse PDF with Docling: {error}",
+				f"Failed to parse PDF with {conversion_engine()}: {error}",
 			)
 
+	def _use_page_pool(self, probe: PdfProbe | None) -> bool:
+		if self._page_workers <= 1 or probe is None or fitz is None:
+			return False
+		if DocumentConverter is not None and DocumentStream is None:
+			return False
+		return probe.page_count > self._pages_per_range
+
+	def _convert_page_ranges(
+		self,
+		path: Path,
+		data: bytes | None,
+		probe: PdfProbe,
+	) -> tuple[str, dict[str, Any], list[str]]:
+		ranges = page_ranges(probe.page_count, self._pages_per_range)
+		with self._open_document(path, data) as document:
+			parts = split_document(document, ranges)
+		# Each range gets the cheapest tier its own pages allow.
+		tiers = [
+			probe.range_tier(first, last) if DocumentConverter is not None else TIER_PYMUPDF
+			for first, last in ranges
+		]
+		tasks = [
+			(f"{path.stem}_p{first}-{last}.pdf", part, tier, first)
+			for (first, last), part, tier in zip(ranges, parts, tiers)
+		]
+		results = convert_ranges(convert_page_range, tasks, self._page_workers, warm_document_converter)
+		markdown_text, json_payload = stitch_ranges(ranges, results)
+		return markdown_text, json_payload, tiers
+
+	@staticmethod
+	def _open_document(path: Path, data: bytes | None) -> Any:
+		return fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(str(path))
+
+	def _probe(self, path: Path, data: bytes | None) -> PdfProbe | None:
+		try:
+			with self._open_document(path, data) as document:
+				return probe_document(document)
+		except Exception:
+			# A PDF PyMuPDF cannot read is still handed to the full Docling pipeline.
+			return None
+
 	def chunk_markdown_by_headers(
 		self,
 		markdown_text: str,
 		json_payload: dict[str, Any] | None = None,
 	) -> list[ForensicChunk]:
+		index = ProvenanceIndex.build(json_payload)
+		self._tables = {table["table_id"]: table for table in index.tables}
 		if not markdown_text.strip():
 			return []
 
-		payload = json_payload or {}
-		global_page_numbers = self._extract_page_numbers(markdown_text, payload)
-		table_metadata = self._extract_table_metadata(payload)
-
-		lines = markdown_text.splitlines()
-		chunks: list[ForensicChunk] = []
-		current_header = "Document Preamble"
-		current_level = 0
-		current_lines: list[str] = []
-		chunk_index = 0
-
-		def flush_current_chunk() -> None:
-			nonlocal chunk_index, current_header, current_level, current_lines
-			content = "\n".join(current_lines).strip()
-			if not content:
-				return
-
-			local_pages = self._extract_page_numbers(content, payload)
-			selected_pages = local_pages if local_pages else global_page_numbers
-			chunk_index += 1
-			chunks.append(
-				ForensicChunk(
-					chunk_id=f"chunk_{chunk_index:03d}",
-					header=current_header,
-					header_level=current_level,
-					content=content,
-					page_numbers=selected_pages,
-					table_metadata=table_metadata,
-				)
-			)
-
-		header_regex = re.compile(r"^(#{1,2})\s+(.*)$")
-
-		for line in lines:
-			match = header_regex.match(line.strip())
-			if match:
-				flush_current_chunk()
-				current_level = len(match.group(1))
-				current_header = match.group(2).strip()
-				current_lines = []
-				continue
-			current_lines.append(line)
+		def locate(lines: list[str]) -> tuple[list[int], list[str]]:
+			# Pages come from the lines' Docling provenance and explicit page mentions;
+			# chunks that cannot be located keep the document-wide page list.
+			local_pages = index.pages_for(lines)
+			return local_pages or index.pages, index.tables_for(local_pages)
 
-		flush_current_chunk()
-		return chunks
+		return list(iter_header_chunks(markdown_text.splitlines(), locate))
 
-	def search_sections(self, query: str) -> list[dict[str, Any]]:
+	def search_sections(self, query: str, limit: int | None = None) -> list[dict[str, Any]]:
 		if not query or not query.strip():
 			return []
-		if not self._chunks:
-			return []
-
-		keywords = [
-			word.lower()
-			for word in re.findall(r"[a-zA-Z0-9_]+", query)
-			if len(word) > 2
-		]
-		if not keywords:
-			return []
-
-		scored: list[tuple[int, ForensicChunk]] = []
-		for chunk in self._chunks:
-			haystack = f"{chunk.header}\n{chunk.content}".lower()
-			score = sum(haystack.count(keyword) for keyword in keywords)
-			if score > 0:
-				scored.append((score, chunk))
-
-		scored.sort(key=lambda item: item[0], reverse=True)
-		return [item[1].model_dump() for item in scored]
-
-	@staticmethod
-	def _extract_page_numbers(
-		text: str,
-		json_payload: dict[str, Any] | None = None,
-	) -> list[int]:
-		page_numbers = {
-			int(match)
-			for match in re.findall(r"\b(?:page|p\.)\s*(\d{1,4})\b", text, flags=re.IGNORECASE)
-		}
-
-		payload = json_payload or {}
-		for key, value in DocumentForensics._walk_dict(payload):
-			if key.lower() in {"page", "page_no", "page_num", "page_number"}:
-				if isinstance(value, int):
-					page_numbers.add(value)
-				elif isinstance(value, str) and value.isdigit():
-					page_numbers.add(int(value))
-
-		return sorted(number for number in page_numbers if number > 0)
-
-	@staticmethod
-	def _extract_table_metadata(json_payload: dict[str, Any]) -> list[dict[str, Any]]:
-		tables: list[dict[str, Any]] = []
-		for key, value in DocumentForensics._walk_dict(json_payload):
-			if "table" not in key.lower():
+		return [chunk.model_dump() for _, chunk in self._chunk_index.search(query, limit)]
+
+	def rank_chunks(self, queries: list[str]) -> list[tuple[float, ForensicChunk]]:
+		# Each query is normalised to its best chunk so one verbose rubric
+		# dimension cannot drown out the others.
+		totals: dict[int, float] = {}
+		for query in queries:
+			scores = self._chunk_index.score(query)
+			if not scores:
 				continue
+			best = max(scores.values())
+			for position, score in scores.items():
+				totals[position] = totals.get(position, 0.0) + score / best
+		ranked = sorted(totals.items(), key=lambda pair: (-pair[1], pair[0]))
+		return [(score, self._chunks[position]) for position, score in ranked]
 
-			if isinstance(value, dict):
-				tables.append(
-					{
-						"key": key,
-						"rows": value.get("rows") or value.get("row_count"),
-						"cols": value.get("cols") or value.get("column_count"),
-						"page": value.get("page")
-						or value.get("page_no")
-						or value.get("page_number"),
-					}
-				)
-			elif isinstance(value, list):
-				tables.append({"key": key, "entries": len(value)})
-
-		return tables
-
-	@staticmethod
-	def _walk_dict(payload: Any) -> list[tuple[str, Any]]:
-		items: list[tuple[str, Any]] = []
-
-		def walk(node: Any, prefix: str = "") -> None:
-			if isinstance(node, dict):
-				for key, value in node.items():
-					full_key = f"{prefix}.{key}" if prefix else str(key)
-					items.append((full_key, value))
-					walk(value, full_key)
-			elif isinstance(node, list):
-				for index, value in enumerate(node):
-					walk(value, f"{prefix}[{index}]")
-
-		walk(payload)
-		return items
+	def search_sentences(self, query: str, limit: int | None = None) -> list[tuple[float, str]]:
+		if not query or not query.strip():
+			return []
+		return self._sentence_index.search(query, limit)
 
 	def _error_payload(self, error_type: str, message: str) -> dict[str, Any]:
 		return {
@@ -225,17 +685,30 @@ class DocumentForensics:
 			"markdown": "",
 			"json": {},
 			"chunks": [],
+			"tables": [],
+			"pipeline": {},
 		}
 
 
 class DocAnalyst:
-	def __init__(self) -> None:
+	def __init__(
+		self,
+		conversion_cache: JsonBlobCache | None = None,
+		page_workers: int = 1,
+		pages_per_range: int = DEFAULT_PAGES_PER_RANGE,
+	) -> None:
 		self._pdf_path: Path | None = None
 		self._markdown_text: str = ""
-		self._json_payload: dict[str, Any] = {}
 		self._dimensions = RubricDimensions()
+		self._sections: RubricSectionCollector | None = None
+		self._section_terms: dict[str, Counter[str]] = {}
+		self._section_terms_source: RubricDimensions | None = None
 		self._image_output_dirs: list[str] = []
-		self._forensics = DocumentForensics()
+		self._forensics = DocumentForensics(
+			conversion_cache=conversion_cache,
+			page_workers=page_workers,
+			pages_per_range=pages_per_range,
+		)
 
 	def load_requirements(self, pdf_path: str) -> dict[str, Any]:
 		path = Path(pdf_path)
@@ -249,34 +722,174 @@ class DocAnalyst:
 
 		self._pdf_path = path
 		self._markdown_text = result.get("markdown", "")
-		self._json_payload = result.get("json", {})
+		self._sections = None
 		return {
 			"pdf_path": str(path),
 			"markdown": self._markdown_text,
-			"json": self._json_payload,
+			"json": result.get("json", {}),
 			"chunks": result.get("chunks", []),
+			"tables": result.get("tables", []),
+			"pipeline": result.get("pipeline", {}),
+			"cache_hit": result.get("cache_hit", False),
 		}
 
+	def inspect_pdf(self, pdf_path: str) -> PdfArtifact:
+		# Hash, probe and images only; the text is converted later by whoever
+		# consumes it, e.g. by streaming iter_requirements(artifact.pdf_path).
+		artifact, _ = self._inspect(Path(pdf_path))
+		return artifact
+
+	def ingest_pdf(self, pdf_path: str) -> PdfArtifact:
+		path = Path(pdf_path)
+		artifact, data = self._inspect(path)
+		if data is None:
+			return artifact
+
+		result = self._forensics.ingest(
+			str(path),
+			data=data,
+			content_hash=artifact.content_sha256,
+			probe=artifact.probe,
+		)
+		if result.get("success", False):
+			artifact.markdown = result.get("markdown", "")
+			artifact.json_payload = result.get("json", {})
+			artifact.chunks = result.get("chunks", [])
+			artifact.tables = result.get("tables", [])
+			artifact.pipeline = result.get("pipeline", {})
+			artifact.cache_hit = bool(result.get("cache_hit", False))
+			self._pdf_path = path
+			self._markdown_text = artifact.markdown
+			self._sections = None
+		else:
+			artifact.error_type = result.get("error_type", "DoclingError")
+			artifact.error = result.get("error", "Unknown PDF parsing error")
+		return artifact
+
+	def _inspect(self, path: Path) -> tuple[PdfArtifact, bytes | None]:
+		if not path.exists() or not path.is_file():
+			message = f"PDF file not found: {path}" if not path.exists() else f"PDF path is not a file: {path}"
+			return (
+				PdfArtifact(
+					pdf_path=str(path),
+					error_type="FileNotFoundError",
+					error=message,
+					image_error=message,
+				),
+				None,
+			)
+
+		# One read feeds the hash, the probe and the image extraction.
+		data = path.read_bytes()
+		artifact = PdfArtifact(
+			pdf_path=str(path),
+			content_sha256=hashlib.sha256(data).hexdigest(),
+			size_bytes=len(data),
+		)
+
+		if fitz is None:
+			artifact.image_error = "PyMuPDF is not installed. Run 'uv add pymupdf' and retry."
+		else:
+			try:
+				with fitz.open(stream=data, filetype="pdf") as document:
+					artifact.page_count = document.page_count
+					try:
+						artifact.probe = probe_document(document)
+					except Exception:
+						artifact.probe = None
+					artifact.image_paths = self._extract_images(document)
+			except Exception as error:
+				artifact.image_error = f"Failed to extract images from PDF: {error}"
+		return artifact, data
+
+	def load_artifact(self, artifact: PdfArtifact) -> dict[str, Any]:
+		if artifact.error_type == "FileNotFoundError":
+			raise FileNotFoundError(artifact.error)
+		if artifact.error:
+			raise RuntimeError(artifact.error)
+
+		self._pdf_path = Path(artifact.pdf_path)
+		self._markdown_text = artifact.markdown
+		self._dimensions = RubricDimensions()
+		self._sections = None
+		self._forensics.load(artifact.markdown, artifact.json_payload, artifact.chunks, artifact.tables)
+		return {
+			"pdf_path": artifact.pdf_path,
+			"markdown": artifact.markdown,
+			"json": artifact.json_payload,
+			"chunks": artifact.chunks,
+			"tables": artifact.tables,
+			"pipeline": artifact.pipeline,
+			"cache_hit": artifact.cache_hit,
+		}
+
+	def iter_requirements(
+		self,
+		pdf_path: str,
+		content_hash: str | None = None,
+		probe: PdfProbe | None = None,
+		retain: bool = False,
+	) -> Iterator[ForensicChunk]:
+		# Streaming counterpart of load_requirements: rubric sections are filled
+		# chunk by chunk and no full markdown copy is kept. Pass retain=True to
+		# also index the chunks for search_sections and pack_context.
+		collector = RubricSectionCollector()
+		self._pdf_path = Path(pdf_path)
+		self._markdown_text = ""
+		self._dimensions = RubricDimensions()
+		self._sections = None
+		for chunk in self._forensics.iter_chunks(pdf_path, content_hash=content_hash, probe=probe, retain=retain):
+			collector.add(chunk)
+			yield chunk
+		self._sections = collector
+
+	@property
+	def pipeline(self) -> dict[str, Any]:
+		return self._forensics.pipeline
+
+	@property
+	def chunks(self) -> list[ForensicChunk]:
+		return self._forensics.chunks
+
+	def _has_requirements(self) -> bool:
+		return bool(self._markdown_text or self._forensics.chunks or self._sections is not None)
+
 	def search_sections(self, query: str) -> list[dict[str, Any]]:
 		return self._forensics.search_sections(query)
 
+	def pack_context(
+		self,
+		queries: list[str],
+		token_budget: int = DEFAULT_DOC_CONTEXT_TOKEN_BUDGET,
+	) -> PackedContext:
+		if not self._has_requirements():
+			raise RuntimeError(
+				"No requirements loaded. Call load_requirements(pdf_path) first."
+			)
+		chunks = self._forensics.chunks
+		return pack_context(chunks, self._forensics.rank_chunks(queries), token_budget)
+
 	def extract_rubric_dimensions(self) -> RubricDimensions:
-		if not self._markdown_text:
+		if not self._has_requirements():
 			raise RuntimeError(
 				"No requirements loaded. Call load_requirements(pdf_path) first."
 			)
 
+		if self._sections is None:
+			self._sections = RubricSectionCollector()
+			for chunk in self._forensics.chunks:
+				self._sections.add(chunk)
 		self._dimensions = RubricDimensions(
-			objectives=self._extract_section("objectives"),
-			deliverables=self._extract_section("deliverables"),
-			constraints=self._extract_section("constraints"),
+			objectives=self._sections.section("objectives"),
+			deliverables=self._sections.section("deliverables"),
+			constraints=self._sections.section("constraints"),
 		)
 		return self._dimensions
 
 	def query_requirements(self, query: str) -> str:
 		if not query or not query.strip():
 			raise ValueError("Query cannot be empty.")
-		if not self._markdown_text:
+		if not self._has_requirements():
 			raise RuntimeError(
 				"No requirements loaded. Call load_requirements(pdf_path) first."
 			)
@@ -296,7 +909,11 @@ class DocAnalyst:
 				"constraints": self._dimensions.constraints,
 			}
 
-		keywords = [word for word in re.findall(r"[a-zA-Z0-9_]+", normalized_query) if len(word) > 2]
+		if self._section_terms_source is not self._dimensions:
+			self._section_terms = {name: Counter(tokenize(text)) for name, text in sections.items()}
+			self._section_terms_source = self._dimensions
+
+		terms = tokenize(normalized_query)
 		best_section_name = ""
 		best_section_text = ""
 		best_score = 0
@@ -305,8 +922,8 @@ class DocAnalyst:
 			if not section_text:
 				continue
 
-			section_lower = section_text.lower()
-			score = sum(section_lower.count(keyword) for keyword in keywords)
+			section_terms = self._section_terms[section_name]
+			score = sum(section_terms[term] for term in terms)
 
 			if section_name in normalized_query:
 				score += 3
@@ -320,20 +937,11 @@ class DocAnalyst:
 			snippet = self._truncate_snippet(best_section_text)
 			return f"[{best_section_name.upper()}] {snippet}"
 
-		markdown_lower = self._markdown_text.lower()
-		sentence_candidates = re.split(r"(?<=[.!?])\s+", self._markdown_text)
-		scored_sentences: list[tuple[int, str]] = []
-
-		for sentence in sentence_candidates:
-			sentence_lower = sentence.lower()
-			score = sum(sentence_lower.count(keyword) for keyword in keywords)
-			if score > 0:
-				scored_sentences.append((score, sentence.strip()))
-
-		if scored_sentences:
-			scored_sentences.sort(key=lambda item: item[0], reverse=True)
-			return self._truncate_snippet(scored_sentences[0][1])
+		best_sentences = self._forensics.search_sentences(query, limit=1)
+		if best_sentences:
+			return self._truncate_snippet(best_sentences[0][1])
 
+		markdown_lower = self._markdown_text.lower()
 		if normalized_query in markdown_lower:
 			index = markdown_lower.index(normalized_query)
 			start = max(0, index - 200)
@@ -354,43 +962,46 @@ class DocAnalyst:
 				"PyMuPDF is not installed. Run 'uv add pymupdf' and retry."
 			)
 
+		try:
+			with fitz.open(str(path)) as document:
+				return self._extract_images(document)
+		except FileNotFoundError:
+			raise
+		except Exception as error:
+			raise RuntimeError(f"Failed to extract images from PDF: {error}") from error
+
+	def _extract_images(self, document: Any) -> list[str]:
 		image_paths: list[str] = []
 		output_dir: str | None = None
 
-		try:
-			with fitz.open(str(path)) as document:
-				for page_index in range(document.page_count):
-					page = document.load_page(page_index)
-					images = page.get_images(full=True)
+		for page_index in range(document.page_count):
+			page = document.load_page(page_index)
+			images = page.get_images(full=True)
 
-					if not images:
-						continue
+			if not images:
+				continue
 
-					if output_dir is None:
-						output_dir = tempfile.mkdtemp(prefix="docanalyst_images_")
-						self._image_output_dirs.append(output_dir)
+			if output_dir is None:
+				output_dir = tempfile.mkdtemp(prefix="docanalyst_images_")
+				self._image_output_dirs.append(output_dir)
 
-					for image_index, image_info in enumerate(images, start=1):
-						xref = image_info[0]
-						image_data = document.extract_image(xref)
-						image_bytes = image_data.get("image")
-						extension = image_data.get("ext", "png")
+			for image_index, image_info in enumerate(images, start=1):
+				xref = image_info[0]
+				image_data = document.extract_image(xref)
+				image_bytes = image_data.get("image")
+				extension = image_data.get("ext", "png")
 
-						if not image_bytes:
-							continue
+				if not image_bytes:
+					continue
 
-						filename = (
-							f"page_{page_index + 1:03d}_img_{image_index:03d}.{extension}"
-						)
-						file_path = Path(output_dir) / filename
-						file_path.write_bytes(image_bytes)
-						image_paths.append(str(file_path))
+				filename = (
+					f"page_{page_index + 1:03d}_img_{image_index:03d}.{extension}"
+				)
+				file_path = Path(output_dir) / filename
+				file_path.write_bytes(image_bytes)
+				image_paths.append(str(file_path))
 
-			return image_paths
-		except FileNotFoundError:
-			raise
-		except Exception as error:
-			raise RuntimeError(f"Failed to extract images from PDF: {error}") from error
+		return image_paths
 
 	@staticmethod
 	def _truncate_snippet(text: str, max_chars: int = 700) -> str:
@@ -399,30 +1010,6 @@ class DocAnalyst:
 			return clean
 		return clean[:max_chars].rstrip() + "..."
 
-	def _extract_section(self, section_title: str) -> str:
-		escaped_title = re.escape(section_title)
-		heading_pattern = re.compile(
-			rf"(^|\n)\s{{0,3}}#{1,6}\s*{escaped_title}\b.*?$",
-			flags=re.IGNORECASE | re.MULTILINE,
-		)
-		match = heading_pattern.search(self._markdown_text)
-		if not match:
-			return ""
-
-		section_start = match.end()
-		next_heading = re.search(
-			r"\n\s{0,3}#{1,6}\s+",
-			self._markdown_text[section_start:],
-			flags=re.MULTILINE,
-		)
-		section_end = (
-			section_start + next_heading.start()
-			if next_heading
-			else len(self._markdown_text)
-		)
-		section_body = self._markdown_text[section_start:section_end]
-		return self._truncate_snippet(section_body, max_chars=2000)
-
 	@staticmethod
 	def _extract_markdown(result: Any) -> str:
 		if hasattr(result, "document"):
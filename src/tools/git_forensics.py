@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+from statistics import median
+from typing import Any, Iterable
+
+from src.tools.git_history import CommitRecord, is_generated_path
+from src.tools.scan_limits import ScanLimits
+
+
+PHASES = ("environment_setup", "tool_engineering", "graph_orchestration")
+
+_PHASE_PATH_PATTERNS = {
+	"environment_setup": re.compile(
+		r"(^|/)(pyproject\.toml|setup\.py|setup\.cfg|requirements[^/]*\.txt|uv\.lock|poetry\.lock|"
+		r"pipfile(\.lock)?|\.python-version|\.env\.example|\.gitignore|dockerfile|readme\.md)$"
+	),
+	"tool_engineering": re.compile(r"(^|/)(tools|utils|helpers)/|_tools?\.py$|(^|/)tools?\.py$"),
+	"graph_orchestration": re.compile(r"(^|/)(nodes|agents)/|(^|/)(graph|state|workflow|orchestrator)\.py$"),
+}
+_PHASE_MESSAGE_PATTERNS = {
+	"environment_setup": re.compile(
+		r"\b(init(ial)?|setup|set up|scaffold|bootstrap|dependenc\w*|environment|env|project structure)\b"
+	),
+	"tool_engineering": re.compile(
+		r"\b(tools?|ast|clone|git(python)?|pdf|docling|pars(er|ing)|forensics?|detectives?|sandbox\w*)\b"
+	),
+	"graph_orchestration": re.compile(
+		r"\b(graph|stategraph|nodes?|edges?|orchestrat\w*|fan[- ]?(out|in)|judges?|justice|"
+		r"aggregat\w*|parallel|reducers?|state)\b"
+	),
+}
+_GENERIC_SUBJECT = re.compile(r"^(update|updates|fix|fixes|wip|commit|changes|misc|test|\.|-)?\s*\S{0,3}$")
+
+BULK_COMMIT_MIN_FILES = 10
+BULK_COMMIT_FILE_SHARE = 0.5
+BULK_COMMIT_CHURN_SHARE = 0.8
+CLUSTERED_SPAN_SECONDS = 10 * 60
+# The AST scan's vendored/generated path rules, so both detectors agree on what
+# counts as the student's own code.
+_SKIP_RULES = ScanLimits()
+
+
+def is_authored_path(path: str) -> bool:
+	return not is_generated_path(path) and _SKIP_RULES.path_skip_reason(path) is None
+
+
+def classify_commit(record: CommitRecord) -> str:
+	subject = record.subject.lower()
+	scores: dict[str, int] = {}
+	for phase in PHASES:
+		path_pattern = _PHASE_PATH_PATTERNS[phase]
+		path_hits = sum(1 for path in record.paths if path_pattern.search(path.lower()))
+		message_hits = 2 if _PHASE_MESSAGE_PATTERNS[phase].search(subject) else 0
+		scores[phase] = path_hits + message_hits
+
+	best_phase = max(PHASES, key=lambda phase: scores[phase])
+	return best_phase if scores[best_phase] > 0 else "other"
+
+
+def analyze_commit_progression(records: Iterable[CommitRecord]) -> dict[str, Any]:
+	# Records arrive newest first from git log; only per-commit scalars are kept so
+	# memory stays proportional to the commit count, not the history size.
+	timeline: list[tuple[int, str, str, int, int | None]] = []
+	authors: set[str] = set()
+	distinct_paths: set[str] = set()
+	churn_available = True
+	meaningful_subjects = 0
+
+	for record in records:
+		phase = classify_commit(record)
+		# Vendored trees and generated files are dropped from the file counts, so a
+		# commit that adds a vendored dependency does not make the file threshold;
+		# paths past the per-commit cap are assumed authored.
+		authored_paths = [path for path in record.paths if is_authored_path(path)]
+		authored_files = record.files_changed - (len(record.paths) - len(authored_paths))
+		# Lockfile and generated-code churn is left out, so a scaffold commit that adds
+		# uv.lock does not look like a bulk upload of the project's code.
+		timeline.append((record.committed_at, phase, record.sha[:10], authored_files, record.authored_churn))
+		authors.add(record.email or record.author)
+		distinct_paths.update(authored_paths)
+		if record.churn is None:
+			churn_available = False
+		subject = record.subject.strip().lower()
+		if len(subject) >= 10 and not _GENERIC_SUBJECT.match(subject):
+			meaningful_subjects += 1
+
+	# Oldest first; reversing before the stable sort keeps same-second commits in order.
+	timeline.reverse()
+	timeline.sort(key=lambda item: item[0])
+	total_commits = len(timeline)
+	if total_commits == 0:
+		return {
+			"total_commits": 0,
+			"progression_detected": False,
+			"bulk_upload_detected": True,
+			"phase_counts": {phase: 0 for phase in (*PHASES, "other")},
+		}
+
+	phase_counts = {phase: 0 for phase in (*PHASES, "other")}
+	first_index: dict[str, int] = {}
+	for index, (_, phase, _, _, _) in enumerate(timeline):
+		phase_counts[phase] += 1
+		first_index.setdefault(phase, index)
+
+	progression_order = sorted(
+		(phase for phase in PHASES if phase in first_index),
+		key=lambda phase: first_index[phase],
+	)
+	progression_detected = total_commits > 3 and progression_order == list(PHASES)
+
+	timestamps = [item[0] for item in timeline]
+	gaps = [later - earlier for earlier, later in zip(timestamps, timestamps[1:])]
+	span_seconds = timestamps[-1] - timestamps[0]
+	timestamps_clustered = total_commits > 1 and span_seconds < CLUSTERED_SPAN_SECONDS
+
+	total_churn = sum(item[4] or 0 for item in timeline) if churn_available else 0
+	file_threshold = max(BULK_COMMIT_MIN_FILES, int(len(distinct_paths) * BULK_COMMIT_FILE_SHARE))
+	bulk_commits: list[dict[str, Any]] = []
+	dominant_commit = False
+	for _, _, sha, authored_files, churn in timeline:
+		churn_share = (churn or 0) / total_churn if total_churn else 0.0
+		if authored_files >= file_threshold or churn_share >= BULK_COMMIT_CHURN_SHARE:
+			bulk_commits.append(
+				{"hash": sha, "authored_files": authored_files, "churn_share": round(churn_share, 2)}
+			)
+		dominant_commit = dominant_commit or churn_share >= BULK_COMMIT_CHURN_SHARE
+
+	# One commit carrying most of the code, or a tiny history with a sweeping
+	# commit, is the "bulk upload" failure pattern from the rubric.
+	bulk_upload_detected = (
+		total_commits <= 1
+		or timestamps_clustered
+		or dominant_commit
+		or (bool(bulk_commits) and total_commits <= 3)
+	)
+
+	return {
+		"total_commits": total_commits,
+		"progression_detected": progression_detected,
+		"bulk_upload_detected": bulk_upload_detected,
+		"progression_order": progression_order,
+		"phase_counts": phase_counts,
+		"phase_first_commit_index": {phase: first_index[phase] for phase in progression_order},
+		"timestamps_clustered": timestamps_clustered,
+		"bulk_commits": bulk_commits[:10],
+		"authors": len(authors),
+		"meaningful_message_ratio": round(meaningful_subjects / total_commits, 2),
+		"first_commit_at": _isoformat(timestamps[0]),
+		"last_commit_at": _isoformat(timestamps[-1]),
+		"span_hours": round(span_seconds / 3600, 2),
+		"median_gap_minutes": round(median(gaps) / 60, 1) if gaps else 0.0,
+		"max_gap_hours": round(max(gaps) / 3600, 2) if gaps else 0.0,
+		"distinct_paths": len(distinct_paths),
+		"churn_available": churn_available,
+		"total_churn": total_churn if churn_available else None,
+	}
+
+
+def _isoformat(timestamp: int) -> str:
+	return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
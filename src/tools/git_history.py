@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import subprocess
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from src.tools.scan_limits import GENERATED_SUFFIXES
+
+
+_RECORD_START = "\x1e"
+_FIELD_SEPARATOR = "\x1f"
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ae%x1f%at%x1f%ct%x1f%s"
+DEFAULT_MAX_PATHS_PER_COMMIT = 200
+# Lockfiles and generated code can outweigh every hand-written change in a
+# scaffold commit, so their churn is tracked apart from authored churn.
+GENERATED_NAMES = frozenset(
+	{
+		"uv.lock",
+		"poetry.lock",
+		"pipfile.lock",
+		"pdm.lock",
+		"package-lock.json",
+		"yarn.lock",
+		"pnpm-lock.yaml",
+		"cargo.lock",
+		"composer.lock",
+		"gemfile.lock",
+	}
+)
+GENERATED_PATH_SUFFIXES = (*GENERATED_SUFFIXES, ".min.js", ".min.css")
+
+
+def is_generated_path(path: str) -> bool:
+	name = path.rsplit("/", 1)[-1].lower()
+	return name in GENERATED_NAMES or name.endswith(GENERATED_PATH_SUFFIXES)
+
+
+@dataclass(frozen=True, slots=True)
+class CommitRecord:
+	sha: str
+	author: str
+	email: str
+	authored_at: int
+	committed_at: int
+	subject: str
+	files_changed: int
+	insertions: int | None
+	deletions: int | None
+	paths: tuple[str, ...]
+	generated_churn: int | None = None
+
+	@property
+	def churn(self) -> int | None:
+		if self.insertions is None or self.deletions is None:
+			return None
+		return self.insertions + self.deletions
+
+	@property
+	def authored_churn(self) -> int | None:
+		churn = self.churn
+		return None if churn is None else churn - (self.generated_churn or 0)
+
+	def as_dict(self) -> dict[str, Any]:
+		record = asdict(self)
+		record["paths"] = list(self.paths)
+		return record
+
+
+def is_partial_clone(repo_path: str | Path) -> bool:
+	completed = subprocess.run(
+		["git", "-C", str(repo_path), "config", "--get", "remote.origin.promisor"],
+		capture_output=True,
+		text=True,
+	)
+	return completed.stdout.strip().lower() == "true"
+
+
+def iter_commit_records(
+	repo_path: str | Path,
+	max_count: int | None = None,
+	numstat: bool | None = None,
+	max_paths: int = DEFAULT_MAX_PATHS_PER_COMMIT,
+) -> Iterator[CommitRecord]:
+	# In a blobless partial clone --numstat would lazily fetch every blob it diffs,
+	# so fall back to --name-only which only needs trees.
+	with_numstat = (not is_partial_clone(repo_path)) if numstat is None else numstat
+	command = [
+		"git",
+		"-C",
+		str(repo_path),
+		"-c",
+		"core.quotePath=false",
+		"log",
+		f"--format={_LOG_FORMAT}",
+		"--no-renames",
+		"--numstat" if with_numstat else "--name-only",
+	]
+	if max_count is not None:
+		command.append(f"--max-count={max_count}")
+
+	# stderr goes to a spooled file so a chatty git cannot block on a full pipe.
+	stderr_file = tempfile.TemporaryFile()
+	process = subprocess.Popen(
+		command,
+		stdout=subprocess.PIPE,
+		stderr=stderr_file,
+		text=True,
+		encoding="utf-8",
+		errors="replace",
+	)
+	assert process.stdout is not None
+
+	header: list[str] | None = None
+	paths: list[str] = []
+	files_changed = 0
+	insertions = 0
+	deletions = 0
+	generated_churn = 0
+	completed = False
+
+	def build_record() -> CommitRecord:
+		return CommitRecord(
+			sha=header[0],
+			author=header[1],
+			email=header[2],
+			authored_at=int(header[3] or 0),
+			committed_at=int(header[4] or 0),
+			subject=header[5],
+			files_changed=files_changed,
+			insertions=insertions if with_numstat else None,
+			deletions=deletions if with_numstat else None,
+			paths=tuple(paths),
+			generated_churn=generated_churn if with_numstat else None,
+		)
+
+	try:
+		for line in process.stdout:
+			line = line.rstrip("\n")
+			if line.startswith(_RECORD_START):
+				if header is not None:
+					yield build_record()
+				header = line[1:].split(_FIELD_SEPARATOR, 5)
+				header += [""] * (6 - len(header))
+				paths = []
+				files_changed = insertions = deletions = generated_churn = 0
+				continue
+
+			if not line or header is None:
+				continue
+
+			path = line
+			if with_numstat:
+				fields = line.split("\t", 2)
+				if len(fields) != 3:
+					continue
+				added, removed, path = fields
+				# Binary files report '-' for both counts.
+				line_insertions = int(added) if added.isdigit() else 0
+				line_deletions = int(removed) if removed.isdigit() else 0
+				insertions += line_insertions
+				deletions += line_deletions
+				if is_generated_path(path):
+					generated_churn += line_insertions + line_deletions
+
+			files_changed += 1
+			if len(paths) < max_paths:
+				paths.append(path)
+
+		if header is not None:
+			yield build_record()
+		completed = True
+	finally:
+		if not completed:
+			process.kill()
+		process.stdout.close()
+		return_code = process.wait()
+		stderr_file.seek(0)
+		stderr_output = stderr_file.read().decode("utf-8", errors="replace")
+		stderr_file.close()
+
+	if return_code != 0:
+		raise subprocess.CalledProcessError(return_code, command, stderr=stderr_output)
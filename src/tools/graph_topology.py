@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterable
+
+
+START_NODE = "__start__"
+END_NODE = "__end__"
+_TERMINALS = (START_NODE, END_NODE)
+
+
+class BuilderTopology:
+	def __init__(self, file_path: str, builder: str | None) -> None:
+		self.file_path = file_path
+		self.builder = builder
+		self.line: int | None = None
+		self.nodes: dict[str, str | None] = {}
+		self.edges: list[tuple[str, str, str]] = []
+		self.unresolved: list[dict[str, Any]] = []
+		self.dynamic_routers: list[dict[str, Any]] = []
+
+	def add_edge(self, source: str, target: str, kind: str) -> None:
+		self.edges.append((source, target, kind))
+
+	def analyze(self) -> dict[str, Any]:
+		vertices: dict[str, None] = dict.fromkeys(self.nodes)
+		for source, target, _ in self.edges:
+			vertices.setdefault(source)
+			vertices.setdefault(target)
+
+		successors: dict[str, list[str]] = {vertex: [] for vertex in vertices}
+		direct_out: dict[str, int] = dict.fromkeys(vertices, 0)
+		incoming: dict[str, set[str]] = {vertex: set() for vertex in vertices}
+		conditional_sources: dict[str, set[str]] = {}
+		for source, target, kind in self.edges:
+			if target not in successors[source]:
+				successors[source].append(target)
+			incoming[target].add(source)
+			if kind == "conditional":
+				conditional_sources.setdefault(source, set()).add(target)
+			else:
+				direct_out[source] += 1
+
+		levels = _bfs_levels(START_NODE, successors) if START_NODE in successors else {}
+		stages: dict[int, list[str]] = {}
+		for vertex, level in levels.items():
+			if vertex not in _TERMINALS:
+				stages.setdefault(level, []).append(vertex)
+
+		declared = [node for node in vertices if node not in _TERMINALS]
+		return {
+			"file": self.file_path,
+			"builder": self.builder,
+			"line": self.line,
+			"nodes": sorted(declared),
+			"node_targets": {node: target for node, target in sorted(self.nodes.items()) if target},
+			"edges": [
+				{"source": source, "target": target, "kind": kind}
+				for source, target, kind in self.edges
+			],
+			"entry_points": sorted(successors.get(START_NODE, [])),
+			"finish_points": sorted(node for node in declared if END_NODE in successors[node]),
+			# Static edges from one node all fire in the next superstep; conditional
+			# branches are a choice, so they are reported separately.
+			"fan_out": {
+				node: sorted(target for target in successors[node] if target not in conditional_sources.get(node, ()))
+				for node in declared
+				if direct_out[node] >= 2
+			},
+			"fan_in": {
+				node: sorted(incoming[node])
+				for node in (*declared, END_NODE)
+				if node in incoming and len(incoming[node]) >= 2
+			},
+			"conditional_branches": {
+				node: sorted(targets) for node, targets in sorted(conditional_sources.items())
+			},
+			"dynamic_routers": self.dynamic_routers,
+			"unreachable": sorted(node for node in declared if node not in levels) if levels else [],
+			"reaches_end": END_NODE in levels,
+			"cycles": _strongly_connected_cycles(successors),
+			"parallel_stages": [sorted(stage) for _, stage in sorted(stages.items()) if len(stage) >= 2],
+			"stages": [sorted(stage) for _, stage in sorted(stages.items())],
+			"unresolved_edges": self.unresolved,
+		}
+
+
+def build_graph_topology(components: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+	builders: dict[tuple[str, str | None], BuilderTopology] = {}
+
+	def topology_for(record: dict[str, Any]) -> BuilderTopology:
+		key = (record.get("file", ""), record.get("builder"))
+		if key not in builders:
+			builders[key] = BuilderTopology(*key)
+		return builders[key]
+
+	for record in components.get("stategraph_instantiations", []):
+		topology = topology_for(record)
+		topology.line = topology.line or record.get("line")
+
+	for record in components.get("add_node_calls", []):
+		topology = topology_for(record)
+		if record.get("node_name"):
+			topology.nodes[record["node_name"]] = record.get("target")
+		else:
+			topology.unresolved.append(_location(record, "node_name_expression"))
+
+	for record in components.get("add_edge_calls", []):
+		topology = topology_for(record)
+		sources = record.get("source")
+		target = record.get("target")
+		if sources is None or target is None:
+			topology.unresolved.append(_location(record, "source_expression", "target_expression"))
+			continue
+		kind = "join" if isinstance(sources, list) else "direct"
+		for source in _as_list(sources):
+			topology.add_edge(source, target, kind)
+
+	for record in components.get("add_conditional_edges_calls", []):
+		topology = topology_for(record)
+		source = record.get("source")
+		targets = record.get("targets")
+		if source is None:
+			topology.unresolved.append(_location(record, "source_expression"))
+			continue
+		if targets is None:
+			topology.dynamic_routers.append(
+				{"source": source, "router": record.get("router"), "line": record.get("line")}
+			)
+			continue
+		for target in targets:
+			if target.get("node") is None:
+				topology.unresolved.append(_location(record, "source_expression") | {"branch": target})
+				continue
+			topology.add_edge(source, target["node"], "conditional")
+
+	graphs = [topology.analyze() for _, topology in sorted(builders.items(), key=lambda item: (item[0][0], item[0][1] or ""))]
+	return {
+		"builders": graphs,
+		"parallel_fan_out_detected": any(graph["fan_out"] for graph in graphs),
+		"fan_in_detected": any(
+			node != END_NODE for graph in graphs for node in graph["fan_in"]
+		),
+		"cycles_detected": any(graph["cycles"] for graph in graphs),
+	}
+
+
+def _as_list(value: str | list[str]) -> list[str]:
+	return value if isinstance(value, list) else [value]
+
+
+def _location(record: dict[str, Any], *expression_keys: str) -> dict[str, Any]:
+	location = {"line": record.get("line")}
+	for key in expression_keys:
+		if key in record:
+			location[key] = record[key]
+	return location
+
+
+def _bfs_levels(start: str, successors: dict[str, list[str]]) -> dict[str, int]:
+	levels = {start: 0}
+	queue = deque([start])
+	while queue:
+		vertex = queue.popleft()
+		for target in successors[vertex]:
+			if target not in levels:
+				levels[target] = levels[vertex] + 1
+				queue.append(target)
+	return levels
+
+
+def _strongly_connected_cycles(successors: dict[str, list[str]]) -> list[list[str]]:
+	# Iterative Tarjan: O(V + E) and safe for graphs deeper than the recursion limit.
+	index_of: dict[str, int] = {}
+	low_link: dict[str, int] = {}
+	on_stack: set[str] = set()
+	stack: list[str] = []
+	cycles: list[list[str]] = []
+	counter = 0
+
+	for root in successors:
+		if root in index_of:
+			continue
+		work: list[tuple[str, Iterable[str]]] = [(root, iter(successors[root]))]
+		index_of[root] = low_link[root] = counter
+		counter += 1
+		stack.append(root)
+		on_stack.add(root)
+
+		while work:
+			vertex, children = work[-1]
+			advanced = False
+			for child in children:
+				if child not in index_of:
+					index_of[child] = low_link[child] = counter
+					counter += 1
+					stack.append(child)
+					on_stack.add(child)
+					work.append((child, iter(successors[child])))
+					advanced = True
+					break
+				if child in on_stack:
+					low_link[vertex] = min(low_link[vertex], index_of[child])
+			if advanced:
+				continue
+
+			work.pop()
+			if work:
+				parent = work[-1][0]
+				low_link[parent] = min(low_link[parent], low_link[vertex])
+			if low_link[vertex] == index_of[vertex]:
+				component: list[str] = []
+				while True:
+					member = stack.pop()
+					on_stack.discard(member)
+					component.append(member)
+					if member == vertex:
+						break
+				if len(component) > 1 or vertex in successors[vertex]:
+					cycles.append(sorted(component))
+
+	return cycles
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import keyword
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from src.tools.cache_store import cache_root
+from src.tools.repo_cache import normalize_repo_url
+
+
+NUM_PERMUTATIONS = 128
+LSH_BANDS = 32
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 5
+EMPTY_BIN = (1 << 57) - 1
+DEFAULT_DUPLICATE_THRESHOLD = 0.8
+_BIN_BITS = NUM_PERMUTATIONS.bit_length() - 1
+
+_COMMENT_PATTERN = re.compile(rb"#[^\n]*")
+_TOKEN_PATTERN = re.compile(rb"[A-Za-z_]\w*|\d[\w.]*|[^\s\w]")
+_KEYWORDS = frozenset(word.encode("ascii") for word in (*keyword.kwlist, *keyword.softkwlist))
+
+
+def normalized_tokens(source: bytes) -> list[bytes]:
+	# Identifiers and literals collapse to placeholders so renamed variables or
+	# tweaked constants in a copied file still produce the same shingles.
+	tokens: list[bytes] = []
+	for token in _TOKEN_PATTERN.findall(_COMMENT_PATTERN.sub(b"", source)):
+		if token in _KEYWORDS:
+			tokens.append(token)
+		elif token[:1].isdigit():
+			tokens.append(b"0")
+		elif token[:1].isalpha() or token[:1] == b"_":
+			tokens.append(b"x")
+		else:
+			tokens.append(token)
+	return tokens
+
+
+def minhash_signature(source: bytes) -> list[int]:
+	# One-permutation hashing: each shingle hash picks a bin with its low bits and
+	# competes for that bin's minimum with the rest, so cost is O(shingles).
+	tokens = normalized_tokens(source)
+	bins = [EMPTY_BIN] * NUM_PERMUTATIONS
+	for start in range(max(1, len(tokens) - SHINGLE_SIZE + 1)):
+		shingle = b" ".join(tokens[start : start + SHINGLE_SIZE])
+		if not shingle:
+			continue
+		value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+		slot = value & (NUM_PERMUTATIONS - 1)
+		value >>= _BIN_BITS
+		if value < bins[slot]:
+			bins[slot] = value
+	return bins
+
+
+def merge_signatures(signatures: Iterable[list[int]]) -> list[int]:
+	# The element-wise minimum is the signature of the union of shingle sets.
+	merged = [EMPTY_BIN] * NUM_PERMUTATIONS
+	for signature in signatures:
+		merged = [min(pair) for pair in zip(merged, signature)]
+	return merged
+
+
+def estimate_similarity(first: list[int], second: list[int]) -> float:
+	matches = 0
+	occupied = 0
+	for left, right in zip(first, second):
+		if left == EMPTY_BIN and right == EMPTY_BIN:
+			continue
+		occupied += 1
+		matches += left == right
+	return matches / occupied if occupied else 0.0
+
+
+def band_keys(signature: list[int]) -> list[str]:
+	keys: list[str] = []
+	for band in range(LSH_BANDS):
+		rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+		if all(value == EMPTY_BIN for value in rows):
+			continue
+		digest = hashlib.blake2b(repr(rows).encode("ascii"), digest_size=8).hexdigest()
+		keys.append(f"{band}:{digest}")
+	return keys
+
+
+class SubmissionIndex:
+	def __init__(self, path: Path | None = None) -> None:
+		self.path = path or cache_root("minhash") / "submissions.sqlite3"
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		with self._connect() as connection:
+			connection.executescript(
+				"""
+				CREATE TABLE IF NOT EXISTS submissions (
+					repo_key TEXT PRIMARY KEY,
+					commit_sha TEXT,
+					signature TEXT NOT NULL,
+					file_blobs TEXT NOT NULL,
+					updated_at REAL NOT NULL
+				);
+				CREATE TABLE IF NOT EXISTS bands (
+					band_key TEXT NOT NULL,
+					repo_key TEXT NOT NULL,
+					PRIMARY KEY (band_key, repo_key)
+				) WITHOUT ROWID;
+				"""
+			)
+
+	@contextmanager
+	def _connect(self) -> Iterator[sqlite3.Connection]:
+		# WAL lets concurrent audits in a cohort read while one of them writes.
+		connection = sqlite3.connect(self.path, timeout=30)
+		try:
+			connection.execute("PRAGMA journal_mode=WAL")
+			with connection:
+				yield connection
+		finally:
+			connection.close()
+
+	def query(
+		self,
+		signature: list[int],
+		exclude_repo_url: str | None = None,
+		threshold: float = DEFAULT_DUPLICATE_THRESHOLD,
+		file_blobs: dict[str, str] | None = None,
+		limit: int = 10,
+	) -> list[dict[str, Any]]:
+		keys = band_keys(signature)
+		if not keys:
+			return []
+		excluded = normalize_repo_url(exclude_repo_url) if exclude_repo_url else None
+
+		# Only submissions sharing at least one LSH band are compared, so a query
+		# touches a handful of rows instead of the whole cohort.
+		placeholders = ",".join("?" * len(keys))
+		with self._connect() as connection:
+			rows = connection.execute(
+				f"""
+				SELECT s.repo_key, s.commit_sha, s.signature, s.file_blobs, COUNT(*) AS shared_bands
+				FROM bands b JOIN submissions s ON s.repo_key = b.repo_key
+				WHERE b.band_key IN ({placeholders})
+				GROUP BY s.repo_key
+				""",
+				keys,
+			).fetchall()
+
+		current_blobs = set((file_blobs or {}).values())
+		matches: list[dict[str, Any]] = []
+		for repo_key, commit_sha, stored_signature, stored_blobs, shared_bands in rows:
+			if repo_key == excluded:
+				continue
+			similarity = estimate_similarity(signature, json.loads(stored_signature))
+			if similarity < threshold:
+				continue
+			prior_blobs = set(json.loads(stored_blobs).values())
+			matches.append(
+				{
+					"repo_url": repo_key,
+					"commit_sha": commit_sha,
+					"similarity": round(similarity, 3),
+					"shared_bands": shared_bands,
+					"identical_files": len(current_blobs & prior_blobs),
+				}
+			)
+
+		matches.sort(key=lambda item: (-item["similarity"], item["repo_url"]))
+		return matches[:limit]
+
+	def add(
+		self,
+		repo_url: str,
+		commit_sha: str | None,
+		signature: list[int],
+		file_blobs: dict[str, str] | None = None,
+	) -> None:
+		repo_key = normalize_repo_url(repo_url)
+		with self._connect() as connection:
+			connection.execute("DELETE FROM bands WHERE repo_key = ?", (repo_key,))
+			connection.execute(
+				"INSERT OR REPLACE INTO submissions VALUES (?, ?, ?, ?, ?)",
+				(repo_key, commit_sha, json.dumps(signature), json.dumps(file_blobs or {}), time.time()),
+			)
+			connection.executemany(
+				"INSERT OR IGNORE INTO bands VALUES (?, ?)",
+				[(key, repo_key) for key in band_keys(signature)],
+			)
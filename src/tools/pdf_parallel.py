@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+from src.tools.doc_index import PAGE_KEYS
+
+try:
+	import fitz
+except ImportError:
+	fitz = None
+
+
+PDF_PAGE_WORKERS_ENV = "AUDITOR_PDF_PAGE_WORKERS"
+PDF_PAGES_PER_RANGE_ENV = "AUDITOR_PDF_PAGES_PER_RANGE"
+DEFAULT_PAGES_PER_RANGE = 16
+
+_POOL_LOCK = threading.Lock()
+_PAGE_POOL: ProcessPoolExecutor | None = None
+_PAGE_POOL_WORKERS = 0
+
+
+def page_ranges(page_count: int, pages_per_range: int) -> list[tuple[int, int]]:
+	size = max(1, pages_per_range)
+	return [(first, min(first + size - 1, page_count)) for first in range(1, page_count + 1, size)]
+
+
+def iter_split_document(document: Any, ranges: list[tuple[int, int]]) -> Iterator[bytes]:
+	# Each range becomes a standalone PDF so workers never need the full file.
+	for first, last in ranges:
+		with fitz.open() as part:
+			part.insert_pdf(document, from_page=first - 1, to_page=last - 1)
+			yield part.tobytes()
+
+
+def split_document(document: Any, ranges: list[tuple[int, int]]) -> list[bytes]:
+	return list(iter_split_document(document, ranges))
+
+
+def offset_pages(payload: Any, offset: int) -> Any:
+	# Range conversions number pages from 1; shift them back to document pages.
+	if not offset:
+		return payload
+	stack = [payload]
+	while stack:
+		node = stack.pop()
+		if isinstance(node, list):
+			stack.extend(node)
+			continue
+		if not isinstance(node, dict):
+			continue
+		for key in list(node):
+			value = node[key]
+			if str(key).lower() in PAGE_KEYS and isinstance(value, int) and not isinstance(value, bool):
+				node[key] = value + offset
+			elif key == "pages" and isinstance(value, dict):
+				node[key] = {
+					str(int(page) + offset) if str(page).isdigit() else page: entry
+					for page, entry in value.items()
+				}
+				stack.extend(node[key].values())
+			else:
+				stack.append(value)
+	return payload
+
+
+def stitch_ranges(
+	ranges: list[tuple[int, int]],
+	results: list[tuple[str, dict[str, Any]]],
+) -> tuple[str, dict[str, Any]]:
+	markdown = "\n\n".join(part_markdown.strip() for part_markdown, _ in results if part_markdown.strip())
+	payload = {
+		"parts": [
+			{"page_start": first, "page_end": last, "document": part_payload}
+			for (first, last), (_, part_payload) in zip(ranges, results)
+		],
+	}
+	return markdown + "\n", payload
+
+
+def get_page_pool(workers: int, initializer: Callable[[], Any] | None = None) -> ProcessPoolExecutor:
+	# Workers load conversion models once in their initializer and are kept for the
+	# life of the process, so only the first long report pays the start-up cost.
+	global _PAGE_POOL, _PAGE_POOL_WORKERS
+	with _POOL_LOCK:
+		if _PAGE_POOL is None or _PAGE_POOL_WORKERS != workers:
+			if _PAGE_POOL is not None:
+				_PAGE_POOL.shutdown(wait=False, cancel_futures=True)
+			# Spawned rather than forked: the graph runs node threads that must not be
+			# duplicated mid-flight into the children.
+			_PAGE_POOL = ProcessPoolExecutor(
+				max_workers=workers,
+				mp_context=multiprocessing.get_context("spawn"),
+				initializer=initializer,
+			)
+			_PAGE_POOL_WORKERS = workers
+		return _PAGE_POOL
+
+
+def warm_page_pool(workers: int, initializer: Callable[[], Any] | None = None) -> bool:
+	if workers <= 1:
+		return False
+	pool = get_page_pool(workers, initializer)
+	for future in [pool.submit(int) for _ in range(workers)]:
+		future.result()
+	return True
+
+
+def convert_ranges(
+	convert: Callable[[tuple[str, bytes, str, int]], tuple[str, dict[str, Any]]],
+	tasks: list[tuple[str, bytes, str, int]],
+	workers: int,
+	initializer: Callable[[], Any] | None = None,
+) -> list[tuple[str, dict[str, Any]]]:
+	# executor.map keeps submission order, so stitching is a plain concatenation.
+	pool = get_page_pool(workers, initializer)
+	return list(pool.map(convert, tasks))
+
+
+def iter_converted_ranges(
+	convert: Callable[[tuple[str, bytes, str, int]], tuple[str, dict[str, Any]]],
+	tasks: Iterable[tuple[str, bytes, str, int]],
+	workers: int,
+	initializer: Callable[[], Any] | None = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+	# At most two ranges per worker are queued, so a streaming consumer never
+	# holds more than a small window of converted pages.
+	pool = get_page_pool(workers, initializer)
+	pending: deque[Future] = deque()
+	for task in tasks:
+		pending.append(pool.submit(convert, task))
+		if len(pending) >= workers * 2:
+			yield pending.popleft().result()
+	while pending:
+		yield pending.popleft().result()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+TIER_TEXT = "text_only"
+TIER_TABLES = "tables"
+TIER_FULL = "full"
+TIER_PYMUPDF = "pymupdf"
+
+# Part of the conversion cache key: the thresholds below pick the pipeline tier,
+# and the tier shapes the converted output. Bump it when any of them changes.
+PROBE_VERSION = 1
+MIN_TEXT_CHARS = 200
+SCANNED_IMAGE_COVERAGE = 0.3
+TEXT_LAYER_COVERAGE = 0.9
+TABLE_RULE_MIN = 10
+HEADING_SIZE_RATIO = 1.15
+MAX_HEADING_CHARS = 120
+
+
+@dataclass(slots=True)
+class PdfProbe:
+	page_count: int = 0
+	text_pages: list[int] = field(default_factory=list)
+	scanned_pages: list[int] = field(default_factory=list)
+	table_pages: list[int] = field(default_factory=list)
+	blank_pages: list[int] = field(default_factory=list)
+	text_chars: int = 0
+	elapsed_seconds: float = 0.0
+
+	@property
+	def text_coverage(self) -> float:
+		content_pages = self.page_count - len(self.blank_pages)
+		return len(self.text_pages) / content_pages if content_pages else 1.0
+
+	def tier(self) -> str:
+		# OCR only pays off when a real share of the pages has no text layer, and
+		# the table model only when ruled tables are likely.
+		if self.scanned_pages and self.text_coverage < TEXT_LAYER_COVERAGE:
+			return TIER_FULL
+		if self.table_pages:
+			return TIER_TABLES
+		return TIER_TEXT
+
+	def range_tier(self, first_page: int, last_page: int) -> str:
+		def within(pages: list[int]) -> list[int]:
+			return [page for page in pages if first_page <= page <= last_page]
+
+		return PdfProbe(
+			page_count=last_page - first_page + 1,
+			text_pages=within(self.text_pages),
+			scanned_pages=within(self.scanned_pages),
+			table_pages=within(self.table_pages),
+			blank_pages=within(self.blank_pages),
+		).tier()
+
+	def summary(self) -> dict[str, Any]:
+		summary = asdict(self)
+		for key in ("text_pages", "scanned_pages", "table_pages", "blank_pages"):
+			summary[key] = len(summary[key])
+		summary["text_coverage"] = round(self.text_coverage, 3)
+		summary["tier"] = self.tier()
+		return summary
+
+
+def probe_document(document: Any) -> PdfProbe:
+	started = time.perf_counter()
+	probe = PdfProbe(page_count=document.page_count)
+	for page_index in range(document.page_count):
+		page = document.load_page(page_index)
+		page_number = page_index + 1
+		chars = len(page.get_text("text").strip())
+		probe.text_chars += chars
+		if chars >= MIN_TEXT_CHARS:
+			probe.text_pages.append(page_number)
+		elif _image_coverage(page) >= SCANNED_IMAGE_COVERAGE:
+			probe.scanned_pages.append(page_number)
+		elif chars == 0:
+			probe.blank_pages.append(page_number)
+		else:
+			probe.text_pages.append(page_number)
+		if _ruling_count(page) >= TABLE_RULE_MIN:
+			probe.table_pages.append(page_number)
+	probe.elapsed_seconds = round(time.perf_counter() - started, 4)
+	return probe
+
+
+def _image_coverage(page: Any) -> float:
+	area = abs(page.rect) or 1.0
+	covered = 0.0
+	for info in page.get_image_info():
+		x0, y0, x1, y1 = info.get("bbox", (0, 0, 0, 0))
+		covered += max(0.0, x1 - x0) * max(0.0, y1 - y0)
+	return min(1.0, covered / area)
+
+
+def _ruling_count(page: Any) -> int:
+	# Ruled tables show up as many axis-aligned strokes and cell rectangles.
+	count = 0
+	for path in page.get_drawings():
+		for item in path.get("items", ()):
+			if item[0] == "re":
+				count += 1
+			elif item[0] == "l":
+				start, end = item[1], item[2]
+				if abs(start.x - end.x) < 1 or abs(start.y - end.y) < 1:
+					count += 1
+	return count
+
+
+def pymupdf_conversion(document: Any) -> tuple[str, dict[str, Any]]:
+	# Text-layer extraction shaped like Docling output: markdown with headings
+	# inferred from font size, and JSON text items carrying page provenance.
+	pages: list[list[tuple[str, float]]] = []
+	sizes: list[float] = []
+	for page_index in range(document.page_count):
+		blocks: list[tuple[str, float]] = []
+		for block in document.load_page(page_index).get_text("dict").get("blocks", ()):
+			spans = [span for line in block.get("lines", ()) for span in line.get("spans", ())]
+			text = " ".join(span.get("text", "").strip() for span in spans if span.get("text", "").strip())
+			if not text:
+				continue
+			size = max(span.get("size", 0.0) for span in spans)
+			sizes.append(size)
+			blocks.append((text, size))
+		pages.append(blocks)
+
+	body_size = statistics.median(sizes) if sizes else 0.0
+	markdown_lines: list[str] = []
+	texts: list[dict[str, Any]] = []
+	for page_number, blocks in enumerate(pages, start=1):
+		for text, size in blocks:
+			heading = body_size > 0 and size >= body_size * HEADING_SIZE_RATIO and len(text) <= MAX_HEADING_CHARS
+			markdown_lines.extend([f"## {text}" if heading else text, ""])
+			texts.append(
+				{
+					"label": "section_header" if heading else "text",
+					"text": text,
+					"prov": [{"page_no": page_number}],
+				}
+			)
+
+	payload = {
+		"origin": {"engine": TIER_PYMUPDF},
+		"texts": texts,
+		"pages": {str(page_number): {"page_no": page_number} for page_number in range(1, len(pages) + 1)},
+	}
+	return "\n".join(markdown_lines).strip() + "\n", payload
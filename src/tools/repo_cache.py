@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from git import Repo
+
+from src.tools.cache_store import FileLock, cache_root, directory_size, env_int
+
+
+MIRROR_CACHE_ENV = "AUDITOR_MIRROR_CACHE"
+MIRROR_CACHE_MAX_BYTES_ENV = "AUDITOR_MIRROR_CACHE_MAX_BYTES"
+DEFAULT_MIRROR_CACHE_MAX_BYTES = 5 * 1024 * 1024 * 1024
+
+_CASE_INSENSITIVE_HOSTS = {"github.com", "gitlab.com", "bitbucket.org"}
+_SCP_LIKE_URL = re.compile(r"^(?:[\w.-]+@)?(?P<host>[\w.-]{2,}):(?!//)(?P<path>.+)$")
+
+
+def normalize_repo_url(repo_url: str) -> str:
+	url = repo_url.strip()
+	if not url:
+		raise ValueError("Repository URL cannot be empty.")
+
+	local_path = Path(url).expanduser()
+	if "://" not in url and local_path.exists():
+		return str(local_path.resolve())
+
+	scp_match = _SCP_LIKE_URL.match(url)
+	if "://" not in url and scp_match:
+		host = scp_match.group("host").lower()
+		path = scp_match.group("path")
+	else:
+		parts = urlsplit(url)
+		host = (parts.hostname or "").lower()
+		if parts.port:
+			host = f"{host}:{parts.port}"
+		path = parts.path
+
+	path = path.strip("/")
+	if path.endswith(".git"):
+		path = path[: -len(".git")]
+	if host.split(":", 1)[0] in _CASE_INSENSITIVE_HOSTS:
+		path = path.lower()
+
+	return f"{host}/{path}" if host else path
+
+
+class MirrorCache:
+	def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+		self.root = root or cache_root("mirrors")
+		self.root.mkdir(parents=True, exist_ok=True)
+		self.max_bytes = (
+			max_bytes
+			if max_bytes is not None
+			else env_int(MIRROR_CACHE_MAX_BYTES_ENV, DEFAULT_MIRROR_CACHE_MAX_BYTES)
+		)
+
+	@classmethod
+	def from_env(cls) -> "MirrorCache | None":
+		if os.environ.get(MIRROR_CACHE_ENV, "1").strip().lower() in {"0", "false", "no", "off"}:
+			return None
+		return cls()
+
+	@property
+	def worktree_root(self) -> Path:
+		# Worktrees live next to the mirrors so local clones can hardlink objects.
+		path = self.root.parent / "worktrees"
+		path.mkdir(parents=True, exist_ok=True)
+		return path
+
+	@staticmethod
+	def cache_key(repo_url: str) -> str:
+		return hashlib.sha256(normalize_repo_url(repo_url).encode("utf-8")).hexdigest()[:24]
+
+	def mirror_path(self, repo_url: str) -> Path:
+		return self.root / f"{self.cache_key(repo_url)}.git"
+
+	def checkout(self, repo_url: str, destination: Path, no_checkout: bool = False) -> Repo:
+		key = self.cache_key(repo_url)
+		with FileLock(self.root / f"{key}.lock"):
+			mirror = self._refresh_mirror(key, repo_url)
+			cloned = Repo.clone_from(str(mirror), destination, no_checkout=no_checkout)
+			cloned.remote("origin").set_url(repo_url)
+			self._write_meta(key, repo_url, mirror)
+
+		self.evict(keep={key})
+		return cloned
+
+	def evict(self, keep: set[str] | None = None) -> list[str]:
+		protected = keep or set()
+		evicted: list[str] = []
+
+		evict_lock = FileLock(self.root / ".evict.lock")
+		if not evict_lock.acquire(blocking=False):
+			return evicted
+
+		try:
+			entries = self._read_all_meta()
+			total = sum(int(meta.get("size_bytes", 0)) for _, meta in entries)
+			entries.sort(key=lambda item: float(item[1].get("last_used", 0.0)))
+
+			for key, meta in entries:
+				if total <= self.max_bytes:
+					break
+				if key in protected:
+					continue
+
+				key_lock = FileLock(self.root / f"{key}.lock")
+				if not key_lock.acquire(blocking=False):
+					continue
+				try:
+					shutil.rmtree(self.root / f"{key}.git", ignore_errors=True)
+					(self.root / f"{key}.json").unlink(missing_ok=True)
+				finally:
+					key_lock.release()
+
+				total -= int(meta.get("size_bytes", 0))
+				evicted.append(key)
+		finally:
+			evict_lock.release()
+
+		return evicted
+
+	def _refresh_mirror(self, key: str, repo_url: str) -> Path:
+		mirror = self.root / f"{key}.git"
+		if (mirror / "HEAD").exists():
+			Repo(str(mirror)).git.fetch("--prune", "origin")
+			return mirror
+
+		shutil.rmtree(mirror, ignore_errors=True)
+		staging = Path(tempfile.mkdtemp(prefix=f"{key}.", suffix=".partial", dir=self.root))
+		try:
+			Repo.clone_from(repo_url, staging / "mirror.git", mirror=True)
+			os.replace(staging / "mirror.git", mirror)
+		finally:
+			shutil.rmtree(staging, ignore_errors=True)
+		return mirror
+
+	def _write_meta(self, key: str, repo_url: str, mirror: Path) -> None:
+		meta = {
+			"url": normalize_repo_url(repo_url),
+			"size_bytes": directory_size(mirror),
+			"last_used": time.time(),
+		}
+		meta_path = self.root / f"{key}.json"
+		staging_path = meta_path.with_suffix(".json.tmp")
+		staging_path.write_text(json.dumps(meta), encoding="utf-8")
+		os.replace(staging_path, meta_path)
+
+	def _read_all_meta(self) -> list[tuple[str, dict[str, Any]]]:
+		entries: list[tuple[str, dict[str, Any]]] = []
+		for meta_path in self.root.glob("*.json"):
+			try:
+				meta = json.loads(meta_path.read_text(encoding="utf-8"))
+			except (OSError, ValueError):
+				continue
+			if isinstance(meta, dict):
+				entries.append((meta_path.stem, meta))
+		return entries
+
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from src.tools.cache_store import JsonBlobCache
+from src.tools.repo_snapshot import RepoSnapshot
+
+
+DIGEST_TOKEN_BUDGET_ENV = "AUDITOR_DIGEST_TOKEN_BUDGET"
+DEFAULT_DIGEST_TOKEN_BUDGET = 32_000
+DIGEST_CACHE_MAX_BYTES_ENV = "AUDITOR_DIGEST_CACHE_MAX_BYTES"
+DEFAULT_DIGEST_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DIGEST_VERSION = 2
+# Rough chars-per-token ratio for code; good enough to keep prompts in budget
+# without pulling in a tokenizer.
+CHARS_PER_TOKEN = 4
+MAX_DIGEST_FILE_BYTES = 512 * 1024
+TREE_BUDGET_SHARE = 0.1
+MIN_PARTIAL_FILE_TOKENS = 200
+
+DEFAULT_IGNORE_PATTERNS = (
+	".git",
+	"node_modules",
+	"dist",
+	"build",
+	"coverage",
+	"__pycache__",
+	".venv",
+	".mypy_cache",
+	".pytest_cache",
+)
+_TEXT_LANGUAGES = frozenset(
+	{"python", "markdown", "restructuredtext", "text", "json", "toml", "yaml", "javascript", "typescript", "shell"}
+)
+_SKIPPED_NAMES = frozenset({"uv.lock", "poetry.lock", "package-lock.json", "yarn.lock", "pipfile.lock"})
+_GRAPH_HINT = re.compile(rb"StateGraph\(|\.add_node\(|\.add_conditional_edges\(")
+_STATE_PATH = re.compile(r"(^|/)(state|states|schemas?|models?|types)(\.py$|/)")
+_TOOLS_PATH = re.compile(r"(^|/)(tools?|utils|helpers)(/|\.py$)|_tools?\.py$")
+_NODES_PATH = re.compile(r"(^|/)(nodes|agents|graph|workflow)(/|\.py$)")
+_OVERVIEW_NAMES = frozenset({"readme.md", "readme.rst", "pyproject.toml", "setup.py", "setup.cfg", "requirements.txt"})
+
+
+@dataclass(slots=True)
+class RepoDigest:
+	text: str
+	estimated_tokens: int
+	token_budget: int
+	truncated: bool
+	commit_sha: str | None = None
+	files: list[str] = field(default_factory=list)
+	omitted_files: int = 0
+
+	def as_dict(self) -> dict[str, Any]:
+		return asdict(self)
+
+
+def estimate_tokens(text: str) -> int:
+	return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def rank_digest_files(
+	snapshot: RepoSnapshot,
+	ignore_patterns: tuple[str, ...] | list[str] = DEFAULT_IGNORE_PATTERNS,
+) -> list[str]:
+	languages = {path: language for language, paths in snapshot.by_language.items() for path in paths}
+	ranked: list[tuple[int, int, str]] = []
+	for relative_path, entry in snapshot.entries.items():
+		posix_path = relative_path.replace(os.sep, "/")
+		parts = posix_path.split("/")
+		if any(fnmatch.fnmatch(part, pattern) for part in parts for pattern in ignore_patterns):
+			continue
+		if parts[-1].lower() in _SKIPPED_NAMES or entry.size > MAX_DIGEST_FILE_BYTES:
+			continue
+		language = languages.get(relative_path, "other")
+		if language not in _TEXT_LANGUAGES:
+			continue
+		ranked.append((_relevance_tier(snapshot, relative_path, posix_path, language), entry.size, relative_path))
+
+	# Most relevant tier first; smaller files first inside a tier so more of them fit.
+	ranked.sort()
+	return [relative_path for _, _, relative_path in ranked]
+
+
+def _relevance_tier(snapshot: RepoSnapshot, relative_path: str, posix_path: str, language: str) -> int:
+	lowered = posix_path.lower()
+	if language == "python":
+		try:
+			with open(snapshot.absolute(relative_path), "rb") as handle:
+				if _GRAPH_HINT.search(handle.read(MAX_DIGEST_FILE_BYTES)):
+					return 0
+		except OSError:
+			pass
+		if _STATE_PATH.search(lowered):
+			return 1
+		if _TOOLS_PATH.search(lowered):
+			return 2
+		if _NODES_PATH.search(lowered):
+			return 3
+	if lowered.rsplit("/", 1)[-1] in _OVERVIEW_NAMES:
+		return 4
+	return 5 if language == "python" else 6
+
+
+def build_repo_digest(
+	snapshot: RepoSnapshot,
+	token_budget: int = DEFAULT_DIGEST_TOKEN_BUDGET,
+	ignore_patterns: tuple[str, ...] | list[str] = DEFAULT_IGNORE_PATTERNS,
+	cache: JsonBlobCache | None = None,
+) -> RepoDigest:
+	cache_key: str | None = None
+	if cache is not None and snapshot.commit_sha:
+		options = f"{token_budget}|{','.join(sorted(ignore_patterns))}"
+		options_hash = hashlib.sha1(options.encode("utf-8")).hexdigest()[:12]
+		# A sparse clone only checks out some paths of the commit, so the checked-out
+		# file set is part of the key: a sparse digest is never reused for a full clone.
+		checkout_hash = hashlib.sha1("\0".join(sorted(snapshot.entries)).encode("utf-8")).hexdigest()[:12]
+		cache_key = f"digest-v{DIGEST_VERSION}-{options_hash}-{checkout_hash}:{snapshot.commit_sha}"
+		cached = cache.get(cache_key)
+		if cached is not None:
+			return RepoDigest(**cached)
+
+	ranked = rank_digest_files(snapshot, ignore_patterns)
+	chunks: list[str] = []
+	used_tokens = 0
+	included: list[str] = []
+	truncated = False
+
+	tree_lines = ["Directory structure:"]
+	tree_budget = int(token_budget * TREE_BUDGET_SHARE)
+	tree_tokens = estimate_tokens(tree_lines[0])
+	for relative_path in sorted(ranked):
+		line = f"  {relative_path.replace(os.sep, '/')}"
+		line_tokens = estimate_tokens(line) + 1
+		if tree_tokens + line_tokens > tree_budget:
+			tree_lines.append(f"  ... {len(ranked) - len(tree_lines) + 1} more files")
+			break
+		tree_lines.append(line)
+		tree_tokens += line_tokens
+	tree_text = "\n".join(tree_lines) + "\n\n"
+	chunks.append(tree_text)
+	used_tokens += estimate_tokens(tree_text)
+
+	for relative_path in ranked:
+		try:
+			content = snapshot.absolute(relative_path).read_text(encoding="utf-8", errors="replace")
+		except OSError:
+			continue
+
+		section = f"{'=' * 48}\nFILE: {relative_path.replace(os.sep, '/')}\n{'=' * 48}\n{content}\n\n"
+		section_tokens = estimate_tokens(section)
+		remaining = token_budget - used_tokens
+		if section_tokens <= remaining:
+			chunks.append(section)
+			used_tokens += section_tokens
+			included.append(relative_path)
+			continue
+
+		truncated = True
+		if remaining >= MIN_PARTIAL_FILE_TOKENS:
+			marker = "\n... [truncated: token budget reached]\n"
+			keep_chars = max(0, remaining * CHARS_PER_TOKEN - len(marker))
+			partial = section[:keep_chars] + marker
+			chunks.append(partial)
+			used_tokens += estimate_tokens(partial)
+			included.append(relative_path)
+		break
+
+	digest = RepoDigest(
+		text="".join(chunks),
+		estimated_tokens=used_tokens,
+		token_budget=token_budget,
+		truncated=truncated,
+		commit_sha=snapshot.commit_sha,
+		files=[path.replace(os.sep, "/") for path in included],
+		omitted_files=len(ranked) - len(included),
+	)
+	if cache_key is not None and cache is not None:
+		cache.put(cache_key, digest.as_dict())
+	return digest
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.tools.repo_walker import RepoEntry, iter_repo_files
+
+
+IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".bmp"})
+_LANGUAGE_BY_SUFFIX = {
+	".py": "python",
+	".pyi": "python",
+	".ipynb": "notebook",
+	".md": "markdown",
+	".rst": "restructuredtext",
+	".txt": "text",
+	".pdf": "pdf",
+	".json": "json",
+	".toml": "toml",
+	".yaml": "yaml",
+	".yml": "yaml",
+	".js": "javascript",
+	".ts": "typescript",
+	".sh": "shell",
+}
+
+
+@dataclass(slots=True)
+class RepoSnapshot:
+	root: str
+	entries: dict[str, RepoEntry]
+	blob_shas: dict[str, str] = field(default_factory=dict)
+	by_extension: dict[str, list[str]] = field(default_factory=dict)
+	by_language: dict[str, list[str]] = field(default_factory=dict)
+	pdf_candidates: list[str] = field(default_factory=list)
+	image_candidates: list[str] = field(default_factory=list)
+	commit_sha: str | None = None
+
+	@classmethod
+	def build(cls, root: str | Path) -> "RepoSnapshot":
+		base_path = Path(root)
+		entries = {entry.path: entry for entry in sorted(iter_repo_files(base_path), key=lambda item: item.path)}
+
+		by_extension: dict[str, list[str]] = {}
+		by_language: dict[str, list[str]] = {}
+		for relative_path, entry in entries.items():
+			suffix = entry.suffix
+			by_extension.setdefault(suffix, []).append(relative_path)
+			language = "image" if suffix in IMAGE_SUFFIXES else _LANGUAGE_BY_SUFFIX.get(suffix, "other")
+			by_language.setdefault(language, []).append(relative_path)
+
+		blob_shas, commit_sha = _read_git_index(base_path, entries)
+		return cls(
+			root=str(base_path),
+			entries=entries,
+			blob_shas=blob_shas,
+			by_extension=by_extension,
+			by_language=by_language,
+			pdf_candidates=list(by_extension.get(".pdf", [])),
+			image_candidates=list(by_language.get("image", [])),
+			commit_sha=commit_sha,
+		)
+
+	def paths_with_suffix(self, suffix: str) -> list[str]:
+		return list(self.by_extension.get(suffix.lower(), []))
+
+	def contains(self, relative_path: str) -> bool:
+		return os.path.normpath(relative_path) in self.entries
+
+	def absolute(self, relative_path: str) -> Path:
+		return Path(self.root) / relative_path
+
+	def match(self, pattern: str, candidates: list[str] | None = None) -> list[str]:
+		pattern_parts = [part for part in pattern.replace("\\", "/").split("/") if part]
+		pool = self.entries if candidates is None else candidates
+		return [
+			relative_path
+			for relative_path in pool
+			if _match_parts(relative_path.split(os.sep), pattern_parts)
+		]
+
+	def summary(self) -> dict[str, object]:
+		return {
+			"files": len(self.entries),
+			"total_bytes": sum(entry.size for entry in self.entries.values()),
+			"languages": {language: len(paths) for language, paths in sorted(self.by_language.items())},
+			"pdf_candidates": len(self.pdf_candidates),
+			"image_candidates": len(self.image_candidates),
+			"commit_sha": self.commit_sha,
+		}
+
+
+def _match_parts(path_parts: list[str], pattern_parts: list[str]) -> bool:
+	# Path.glob semantics: '**' spans any number of directories, other segments
+	# match exactly one path component.
+	if not pattern_parts:
+		return not path_parts
+	head, rest = pattern_parts[0], pattern_parts[1:]
+	if head == "**":
+		return any(_match_parts(path_parts[index:], rest) for index in range(len(path_parts) + 1))
+	if not path_parts or not fnmatch.fnmatchcase(path_parts[0], head):
+		return False
+	return _match_parts(path_parts[1:], rest)
+
+
+def _read_git_index(base_path: Path, entries: dict[str, RepoEntry]) -> tuple[dict[str, str], str | None]:
+	if not (base_path / ".git").exists():
+		return {}, None
+
+	try:
+		staged = _run_git(base_path, "ls-files", "-s", "-z")
+		modified = set(_run_git(base_path, "ls-files", "-m", "-z").split("\0"))
+		head = _run_git(base_path, "rev-parse", "HEAD").strip() or None
+	except (OSError, subprocess.SubprocessError):
+		return {}, None
+
+	# Index SHAs are only trusted for files whose worktree copy matches the index.
+	blob_shas: dict[str, str] = {}
+	for record in staged.split("\0"):
+		if not record or "\t" not in record:
+			continue
+		meta, posix_path = record.split("\t", 1)
+		fields = meta.split()
+		if len(fields) < 2 or posix_path in modified:
+			continue
+		native_path = os.path.join(*posix_path.split("/"))
+		if native_path in entries:
+			blob_shas[native_path] = fields[1]
+	return blob_shas, head
+
+
+def _run_git(base_path: Path, *args: str) -> str:
+	completed = subprocess.run(
+		["git", "-C", str(base_path), *args],
+		capture_output=True,
+		check=True,
+	)
+	return os.fsdecode(completed.stdout)
@@ -1,44 +1,183 @@
 from __future__ import annotations
 
 import ast
-import inspect
+import hashlib
+import json
+import math
+import mmap
+import multiprocessing
+import re
+import subprocess
 import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from git import Repo
 from git.exc import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
 
+from src.tools.ast_detectors import (
+	AstDetector,
+	SymbolIndexDetector,
+	TraversalContext,
+	detector_signature,
+	dotted_name,
+	registered_detectors,
+	run_fused_traversal,
+	trigger_pattern,
+)
+from src.tools.cache_store import JsonBlobCache
+from src.tools.call_graph import CallGraph, absolute_import, module_name_for
+from src.tools.git_history import CommitRecord, iter_commit_records
+from src.tools.graph_topology import build_graph_topology
+from src.tools.minhash import merge_signatures, minhash_signature
+from src.tools.repo_cache import MirrorCache, normalize_repo_url
+from src.tools.repo_digest import DEFAULT_DIGEST_TOKEN_BUDGET, DEFAULT_IGNORE_PATTERNS, RepoDigest, build_repo_digest
+from src.tools.repo_snapshot import RepoSnapshot
+from src.tools.repo_walker import iter_repo_files
+from src.tools.scan_limits import SAMPLE_BYTES, ScanLimits
+
+
+CLONE_MODE_ENV = "AUDITOR_CLONE_MODE"
+CLONE_MODES = ("full", "sparse")
+# LangGraph's START and END sentinels are these plain node names.
+_SPECIAL_ENDPOINTS = {"START": "__start__", "END": "__end__"}
+# Paths the detectors actually read: Python sources for AST analysis and PDFs for
+# the doc/vision detectors. Git forensics only needs commit metadata.
+SPARSE_CHECKOUT_PATTERNS = ("*.py", "*.pdf")
+
+
+def _apply_sparse_checkout(repo: Repo, patterns: tuple[str, ...]) -> None:
+	repo.git.sparse_checkout("set", "--no-cone", *patterns)
+	repo.git.checkout()
+
+
+class GraphAstVisitor(ast.NodeVisitor, AstDetector):
+	name = "langgraph"
+	trigger_tokens = (
+		b"StateGraph",
+		b"add_node",
+		b"add_edge",
+		b"add_conditional_edges",
+		b"set_entry_point",
+		b"set_finish_point",
+	)
 
-class GraphAstVisitor(ast.NodeVisitor):
 	def __init__(self, file_path: str) -> None:
-		self.file_path = file_path
+		super().__init__(file_path)
 		self.class_names: list[str] = []
 		self.function_names: list[str] = []
 		self.stategraph_instantiations: list[dict[str, Any]] = []
 		self.add_node_calls: list[dict[str, Any]] = []
 		self.add_edge_calls: list[dict[str, Any]] = []
 		self.conditional_edge_calls: list[dict[str, Any]] = []
+		self.string_constants: dict[str, str] = {}
+		self._builder_targets: dict[int, str] = {}
+		# Endpoints are resolved after the walk so constants defined below their
+		# first use still resolve.
+		self._pending_endpoints: list[tuple[dict[str, Any], str, ast.AST]] = []
+
+	def handlers(self) -> dict[type[ast.AST], Any]:
+		return {
+			ast.ClassDef: self._record_class,
+			ast.FunctionDef: self._record_function,
+			ast.AsyncFunctionDef: self._record_function,
+			ast.Assign: self._record_assignment,
+			ast.Call: self._record_call,
+		}
+
+	def finish(self) -> list[dict[str, Any]]:
+		self.resolve_endpoints()
+		return []
 
 	def visit_ClassDef(self, node: ast.ClassDef) -> None:
-		self.class_names.append(node.name)
+		self._record_class(node)
 		self.generic_visit(node)
 
 	def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-		self.function_names.append(node.name)
+		self._record_function(node)
 		self.generic_visit(node)
 
 	def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-		self.function_names.append(node.name)
+		self._record_function(node)
+		self.generic_visit(node)
+
+	def visit_Assign(self, node: ast.Assign) -> None:
+		self._record_assignment(node)
 		self.generic_visit(node)
 
 	def visit_Call(self, node: ast.Call) -> None:
+		self._record_call(node)
+		self.generic_visit(node)
+
+	def resolve_endpoints(self) -> None:
+		for record, key, expression in self._pending_endpoints:
+			resolved = self._resolve_endpoint(expression, allow_list=key == "source")
+			if key == "node_name" and isinstance(expression, ast.Name) and record.get("target") == expression.id:
+				# add_node(fn) names the node after the function, unless fn is a string constant.
+				if resolved is None:
+					resolved = expression.id
+				else:
+					record["target"] = None
+			record[key] = resolved
+			if resolved is None:
+				record[f"{key}_expression"] = ast.unparse(expression)
+		self._pending_endpoints = []
+
+	def _resolve_endpoint(self, expression: ast.AST, allow_list: bool = False) -> Any:
+		if isinstance(expression, ast.Constant):
+			return expression.value if isinstance(expression.value, str) else None
+		if allow_list and isinstance(expression, (ast.List, ast.Tuple)):
+			# add_edge([a, b], c) waits for every source before running c.
+			sources = [self._resolve_endpoint(item) for item in expression.elts]
+			return sources if all(source is not None for source in sources) else None
+
+		name = dotted_name(expression)
+		if name is None:
+			return None
+		short_name = name.rsplit(".", 1)[-1]
+		if short_name in _SPECIAL_ENDPOINTS:
+			return _SPECIAL_ENDPOINTS[short_name]
+		return self.string_constants.get(name)
+
+	def _record_class(self, node: ast.ClassDef, context: TraversalContext | None = None) -> None:
+		self.class_names.append(node.name)
+
+	def _record_function(
+		self,
+		node: ast.FunctionDef | ast.AsyncFunctionDef,
+		context: TraversalContext | None = None,
+	) -> None:
+		self.function_names.append(node.name)
+
+	def _record_assignment(self, node: ast.Assign, context: TraversalContext | None = None) -> None:
+		if len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
+			return
+		target_name = node.targets[0].id
+		if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+			# Only module-level constants are stable enough to resolve node names.
+			if context is None or not context.scope:
+				self.string_constants[target_name] = node.value.value
+		elif isinstance(node.value, ast.Call) and (dotted_name(node.value.func) or "").endswith("StateGraph"):
+			self._builder_targets[id(node.value)] = target_name
+
+	def _defer_endpoint(self, record: dict[str, Any], key: str, expression: ast.AST | None) -> None:
+		record[key] = None
+		if expression is not None:
+			self._pending_endpoints.append((record, key, expression))
+
+	def _record_call(self, node: ast.Call, context: TraversalContext | None = None) -> None:
 		if isinstance(node.func, ast.Name) and node.func.id == "StateGraph":
 			self.stategraph_instantiations.append(
 				{
 					"file": self.file_path,
 					"line": node.lineno,
 					"column": node.col_offset,
+					"builder": self._builder_targets.get(id(node)),
 				}
 			)
 
@@ -47,59 +186,408 @@ class GraphAstVisitor(ast.NodeVisitor):
 			receiver_name = (
 				node.func.value.id if isinstance(node.func.value, ast.Name) else None
 			)
+			arguments = _call_arguments(node)
 
 			if method_name == "add_node":
-				node_name: str | None = None
-				if node.args and isinstance(node.args[0], ast.Constant):
-					if isinstance(node.args[0].value, str):
-						node_name = node.args[0].value
-				self.add_node_calls.append(
-					{
-						"file": self.file_path,
-						"line": node.lineno,
-						"column": node.col_offset,
-						"builder": receiver_name,
-						"node_name": node_name,
-					}
-				)
+				record = {
+					"file": self.file_path,
+					"line": node.lineno,
+					"column": node.col_offset,
+					"builder": receiver_name,
+					"target": None,
+				}
+				name_argument = arguments.get(0, arguments.get("node"))
+				action_argument = arguments.get(1, arguments.get("action"))
+				if action_argument is not None:
+					record["target"] = dotted_name(action_argument)
+				elif isinstance(name_argument, ast.Name):
+					record["target"] = name_argument.id
+				self._defer_endpoint(record, "node_name", name_argument)
+				self.add_node_calls.append(record)
 
 			if method_name == "add_edge":
-				self.add_edge_calls.append(
-					{
-						"file": self.file_path,
-						"line": node.lineno,
-						"column": node.col_offset,
-						"builder": receiver_name,
-					}
-				)
+				record = {
+					"file": self.file_path,
+					"line": node.lineno,
+					"column": node.col_offset,
+					"builder": receiver_name,
+					"method": method_name,
+				}
+				self._defer_endpoint(record, "source", arguments.get(0, arguments.get("start_key")))
+				self._defer_endpoint(record, "target", arguments.get(1, arguments.get("end_key")))
+				self.add_edge_calls.append(record)
+
+			if method_name in {"set_entry_point", "set_finish_point"}:
+				record = {
+					"file": self.file_path,
+					"line": node.lineno,
+					"column": node.col_offset,
+					"builder": receiver_name,
+					"method": method_name,
+				}
+				key = arguments.get(0, arguments.get("key"))
+				if method_name == "set_entry_point":
+					record["source"] = _SPECIAL_ENDPOINTS["START"]
+					self._defer_endpoint(record, "target", key)
+				else:
+					self._defer_endpoint(record, "source", key)
+					record["target"] = _SPECIAL_ENDPOINTS["END"]
+				self.add_edge_calls.append(record)
 
 			if method_name == "add_conditional_edges":
-				self.conditional_edge_calls.append(
-					{
-						"file": self.file_path,
-						"line": node.lineno,
-						"column": node.col_offset,
-						"builder": receiver_name,
-					}
-				)
+				record = {
+					"file": self.file_path,
+					"line": node.lineno,
+					"column": node.col_offset,
+					"builder": receiver_name,
+					"router": dotted_name(arguments.get(1, arguments.get("path"))),
+					"targets": None,
+				}
+				self._defer_endpoint(record, "source", arguments.get(0, arguments.get("source")))
+				self._record_path_map(record, arguments.get(2, arguments.get("path_map")))
+				self.conditional_edge_calls.append(record)
+
+	def _record_path_map(self, record: dict[str, Any], path_map: ast.AST | None) -> None:
+		if isinstance(path_map, ast.Dict):
+			branches = path_map.values
+		elif isinstance(path_map, (ast.List, ast.Tuple)):
+			branches = path_map.elts
+		else:
+			# Without a path map the router may return any node name.
+			return
+
+		labels: list[ast.AST | None] = path_map.keys if isinstance(path_map, ast.Dict) else [None] * len(branches)
+		targets: list[dict[str, Any]] = []
+		for label, branch in zip(labels, branches):
+			target: dict[str, Any] = {}
+			if isinstance(label, ast.Constant):
+				target["label"] = label.value if isinstance(label.value, (str, int, bool)) else repr(label.value)
+			self._defer_endpoint(target, "node", branch)
+			targets.append(target)
+		record["targets"] = targets
+
+
+def _call_arguments(node: ast.Call) -> dict[int | str, ast.AST]:
+	arguments: dict[int | str, ast.AST] = dict(enumerate(node.args))
+	for keyword in node.keywords:
+		if keyword.arg is not None:
+			arguments[keyword.arg] = keyword.value
+	return arguments
+
+
+AST_VISITOR_VERSION = 5
+AST_CACHE_MAX_BYTES_ENV = "AUDITOR_AST_CACHE_MAX_BYTES"
+DEFAULT_AST_CACHE_MAX_BYTES = 256 * 1024 * 1024
+AST_SCAN_WORKERS_ENV = "AUDITOR_AST_SCAN_WORKERS"
+PARALLEL_SCAN_MIN_FILES = 64
+MAX_REPORTED_SKIPS = 200
+
+_SCAN_POOL_LOCK = threading.Lock()
+_SCAN_POOL: ProcessPoolExecutor | None = None
+_SCAN_POOL_WORKERS = 0
+
+# Byte-level prefilter: files without any of these tokens cannot produce a
+# GraphAstVisitor hit, so they only get a line-anchored class/def inventory.
+_GRAPH_TOKEN_PATTERN = re.compile(b"|".join(GraphAstVisitor.trigger_tokens))
+_DEFINITION_PATTERN = re.compile(
+	r"^[ \t]*(?:(class)|(?:async[ \t]+)?def)[ \t]+([^\W\d]\w*)",
+	flags=re.MULTILINE,
+)
+_COMPONENT_KEYS = (
+	"stategraph_instantiations",
+	"add_node_calls",
+	"add_edge_calls",
+	"add_conditional_edges_calls",
+)
+
+
+def git_blob_sha(data: bytes) -> str:
+	return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def has_graph_tokens(source: bytes | mmap.mmap) -> bool:
+	return _GRAPH_TOKEN_PATTERN.search(source) is not None
+
+
+def _probe_oversized_source(absolute_path: Path) -> bool:
+	# Oversized files are never loaded; a read-only mapping lets the byte scan page
+	# through them without growing the heap.
+	try:
+		with absolute_path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+			return has_graph_tokens(mapped)
+	except (OSError, ValueError):
+		return False
+
+
+def inventory_python_source(source: bytes, relative_path: str) -> dict[str, Any]:
+	try:
+		text = source.decode("utf-8")
+	except UnicodeDecodeError as error:
+		return _error_scan_result(f"UnicodeDecodeError: {error}")
+
+	classes: list[str] = []
+	functions: list[str] = []
+	for match in _DEFINITION_PATTERN.finditer(text):
+		(classes if match.group(1) else functions).append(match.group(2))
+
+	result = _error_scan_result(None)
+	result["classes"] = classes
+	result["functions"] = functions
+	result["fingerprint"] = minhash_signature(source)
+	result["inventory_only"] = True
+	return result
+
+
+def scan_python_source(
+	source: bytes,
+	relative_path: str,
+	prefilter: bool = False,
+	detectors: tuple[type[AstDetector], ...] = (),
+	symbols: bool = False,
+) -> dict[str, Any]:
+	if prefilter:
+		pattern = trigger_pattern(
+			(GraphAstVisitor.trigger_tokens, *(detector.trigger_tokens for detector in detectors))
+		)
+		if pattern is not None and pattern.search(source) is None:
+			return inventory_python_source(source, relative_path)
+
+	try:
+		tree = ast.parse(source.decode("utf-8"), filename=relative_path)
+		visitor = GraphAstVisitor(relative_path)
+		plugins = [detector(relative_path) for detector in detectors]
+		# The symbol index rides the same walk but stays out of the trigger pattern,
+		# so prefiltered files remain inventory-only.
+		symbol_index = [SymbolIndexDetector(relative_path)] if symbols else []
+		timings = run_fused_traversal(tree, [visitor, *plugins, *symbol_index], relative_path)
+		visitor.finish()
+	except SyntaxError as error:
+		return _error_scan_result(f"SyntaxError: {error.msg} (line {error.lineno})")
+	except UnicodeDecodeError as error:
+		return _error_scan_result(f"UnicodeDecodeError: {error}")
+	except Exception as error:
+		return _error_scan_result(f"Unexpected parse error: {error}")
+
+	result = {
+		"classes": visitor.class_names,
+		"functions": visitor.function_names,
+		"components": {
+			"stategraph_instantiations": visitor.stategraph_instantiations,
+			"add_node_calls": visitor.add_node_calls,
+			"add_edge_calls": visitor.add_edge_calls,
+			"add_conditional_edges_calls": visitor.conditional_edge_calls,
+		},
+		"detectors": {plugin.name: plugin.finish() for plugin in plugins},
+		"detector_timings": {
+			detector.name: elapsed for detector, elapsed in zip([visitor, *plugins], timings)
+		},
+		# Lexical rather than AST-derived, so prefiltered and parsed files are comparable.
+		"fingerprint": minhash_signature(source),
+		"error": None,
+		"inventory_only": False,
+	}
+	if symbols:
+		result["symbols"] = symbol_index[0].finish()
+	return result
+
+
+def scan_symbols(source: bytes, relative_path: str) -> list[dict[str, Any]]:
+	try:
+		tree = ast.parse(source.decode("utf-8"), filename=relative_path)
+	except (SyntaxError, UnicodeDecodeError, ValueError):
+		return []
+	detector = SymbolIndexDetector(relative_path)
+	run_fused_traversal(tree, [detector], relative_path)
+	return detector.finish()
+
+
+def _module_paths(relative_paths: list[str]) -> dict[str, str | None]:
+	# Exact module names plus unambiguous suffix aliases, mirroring CallGraph so
+	# "tools.repo_tools" finds "src/tools/repo_tools.py" under a source root.
+	modules = {module_name_for(relative_path): relative_path for relative_path in relative_paths}
+	paths: dict[str, str | None] = dict(modules)
+	for module, relative_path in modules.items():
+		parts = module.split(".")
+		for start in range(1, len(parts)):
+			alias = ".".join(parts[start:])
+			if alias in modules:
+				continue
+			paths[alias] = relative_path if paths.get(alias, relative_path) == relative_path else None
+	return paths
+
+
+def get_scan_pool(workers: int) -> ProcessPoolExecutor:
+	# Kept for the life of the process so repeated audits do not pay the worker
+	# start-up again; spawned rather than forked because the graph runs node threads.
+	global _SCAN_POOL, _SCAN_POOL_WORKERS
+	with _SCAN_POOL_LOCK:
+		if _SCAN_POOL is None or _SCAN_POOL_WORKERS != workers:
+			if _SCAN_POOL is not None:
+				_SCAN_POOL.shutdown(wait=False, cancel_futures=True)
+			_SCAN_POOL = ProcessPoolExecutor(
+				max_workers=workers,
+				mp_context=multiprocessing.get_context("spawn"),
+			)
+			_SCAN_POOL_WORKERS = workers
+		return _SCAN_POOL
+
+
+def _scan_python_batch(
+	batch: list[tuple[str, bytes]],
+	prefilter: bool = False,
+	detectors: tuple[type[AstDetector], ...] = (),
+	symbols: bool = False,
+) -> list[dict[str, Any]]:
+	return [
+		scan_python_source(source, relative_path, prefilter=prefilter, detectors=detectors, symbols=symbols)
+		for relative_path, source in batch
+	]
+
+
+def _scan_symbol_batch(batch: list[tuple[str, bytes]]) -> list[list[dict[str, Any]]]:
+	return [scan_symbols(source, relative_path) for relative_path, source in batch]
+
+
+def _map_batches(
+	scan_batch: Callable[[list[tuple[str, bytes]]], list[Any]],
+	sources: list[tuple[str, bytes]],
+	workers: int,
+) -> list[Any]:
+	if workers <= 1 or len(sources) < PARALLEL_SCAN_MIN_FILES:
+		return scan_batch(sources)
+
+	# Several chunks per worker keeps the pool busy when file sizes are skewed,
+	# while executor.map preserves submission order for a deterministic merge.
+	chunk_size = max(1, math.ceil(len(sources) / (workers * 4)))
+	batches = [sources[start : start + chunk_size] for start in range(0, len(sources), chunk_size)]
+	results: list[Any] = []
+	for batch_results in get_scan_pool(workers).map(scan_batch, batches):
+		results.extend(batch_results)
+	return results
+
+
+def _scan_pending_sources(
+	sources: list[tuple[str, bytes]],
+	workers: int,
+	prefilter: bool = False,
+	detectors: tuple[type[AstDetector], ...] = (),
+	symbols: bool = False,
+) -> list[dict[str, Any]]:
+	scan_batch = partial(_scan_python_batch, prefilter=prefilter, detectors=detectors, symbols=symbols)
+	return _map_batches(scan_batch, sources, workers)
+
+
+def _error_scan_result(message: str | None) -> dict[str, Any]:
+	return {
+		"classes": [],
+		"functions": [],
+		"components": {key: [] for key in _COMPONENT_KEYS},
+		"detectors": {},
+		"error": message,
+		"inventory_only": False,
+	}
 
-		self.generic_visit(node)
+
+def _restamp_scan_result(result: dict[str, Any], relative_path: str) -> dict[str, Any]:
+	# Cached results are shared by identical blobs at different paths.
+	for records in result.get("components", {}).values():
+		for record in records:
+			record["file"] = relative_path
+	return result
+
+
+def _merge_scan_results(file_results: list[tuple[str, dict[str, Any]]]) -> dict[str, Any]:
+	all_classes: dict[str, list[str]] = {}
+	all_functions: dict[str, list[str]] = {}
+	detected_components: dict[str, list[dict[str, Any]]] = {key: [] for key in _COMPONENT_KEYS}
+	detector_findings: dict[str, list[dict[str, Any]]] = {}
+	detector_seconds: dict[str, float] = {}
+	parse_errors: list[dict[str, str]] = []
+	inventory_only_files = 0
+
+	for relative_path, result in file_results:
+		if result.get("inventory_only"):
+			inventory_only_files += 1
+		if result.get("error"):
+			parse_errors.append({"file": relative_path, "error": result["error"]})
+			continue
+
+		all_classes[relative_path] = result.get("classes", [])
+		all_functions[relative_path] = result.get("functions", [])
+		for key in _COMPONENT_KEYS:
+			detected_components[key].extend(result.get("components", {}).get(key, []))
+		for name, findings in result.get("detectors", {}).items():
+			detector_findings.setdefault(name, []).extend(
+				{"file": relative_path, **finding} for finding in findings
+			)
+		for name, elapsed in result.get("detector_timings", {}).items():
+			detector_seconds[name] = detector_seconds.get(name, 0.0) + elapsed
+
+	topology = build_graph_topology(detected_components)
+	return {
+		"summary": {
+			"python_files_scanned": len(file_results),
+			"classes_found": sum(len(item) for item in all_classes.values()),
+			"functions_found": sum(len(item) for item in all_functions.values()),
+			"stategraph_detected": bool(detected_components["stategraph_instantiations"]),
+			"node_definitions_detected": bool(detected_components["add_node_calls"]),
+			"prefiltered_files": inventory_only_files,
+			"parallel_fan_out_detected": topology["parallel_fan_out_detected"],
+			"fan_in_detected": topology["fan_in_detected"],
+			"detector_counts": {name: len(findings) for name, findings in detector_findings.items()},
+			# Only files parsed in this run contribute; cache hits cost no traversal.
+			"detector_timings_ms": {
+				name: round(elapsed * 1000, 3) for name, elapsed in detector_seconds.items()
+			},
+		},
+		"classes": all_classes,
+		"functions": all_functions,
+		"langgraph_components": detected_components,
+		"graph_topology": topology,
+		"detector_findings": detector_findings,
+		"errors": parse_errors,
+	}
 
 
 class RepoManager:
-	def __init__(self) -> None:
+	def __init__(
+		self,
+		mirror_cache: MirrorCache | None = None,
+		ast_cache: JsonBlobCache | None = None,
+		scan_workers: int = 1,
+		prefilter_sources: bool = True,
+		detectors: tuple[type[AstDetector], ...] | None = None,
+		scan_limits: ScanLimits | None = None,
+		digest_cache: JsonBlobCache | None = None,
+		digest_token_budget: int = DEFAULT_DIGEST_TOKEN_BUDGET,
+	) -> None:
 		self._temp_dir: tempfile.TemporaryDirectory[str] | None = None
 		self._repo_path: Path | None = None
+		self._repo_url: str | None = None
+		self._mirror_cache = mirror_cache
+		self._ast_cache = ast_cache
+		self._scan_workers = max(1, scan_workers)
+		self._prefilter_sources = prefilter_sources
+		self._detectors = detectors
+		self._scan_limits = scan_limits or ScanLimits()
+		self._call_graph: CallGraph | None = None
+		self._digest_cache = digest_cache
+		self._digest_token_budget = digest_token_budget
 
 	@property
 	def repo_path(self) -> str | None:
 		return str(self._repo_path) if self._repo_path else None
 
+	@property
+	def call_graph(self) -> CallGraph | None:
+		return self._call_graph
+
 	def close(self) -> None:
 		if self._temp_dir is not None:
 			self._temp_dir.cleanup()
 			self._temp_dir = None
 			self._repo_path = None
+			self._repo_url = None
 
 	def __enter__(self) -> "RepoManager":
 		return self
@@ -107,17 +595,42 @@ class RepoManager:
 	def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
 		self.close()
 
-	def clone_repo(self, repo_url: str) -> str:
+	def clone_repo(self, repo_url: str, mode: str = "full") -> str:
 		if not repo_url or not repo_url.strip():
 			raise ValueError("Repository URL cannot be empty.")
+		if mode not in CLONE_MODES:
+			raise ValueError(f"Unsupported clone mode '{mode}'. Expected one of {CLONE_MODES}.")
+
+		sparse_patterns = SPARSE_CHECKOUT_PATTERNS if mode == "sparse" else None
 
 		self.close()
-		self._temp_dir = tempfile.TemporaryDirectory()
+		self._temp_dir = tempfile.TemporaryDirectory(
+			dir=self._mirror_cache.worktree_root if self._mirror_cache else None
+		)
 		destination = Path(self._temp_dir.name) / "target_repo"
 
 		try:
-			Repo.clone_from(repo_url, destination)
+			if self._mirror_cache is not None:
+				cloned = self._mirror_cache.checkout(
+					repo_url,
+					destination,
+					no_checkout=sparse_patterns is not None,
+				)
+			elif sparse_patterns is not None:
+				# Partial clone: commits and trees only, blobs are fetched on checkout.
+				cloned = Repo.clone_from(
+					repo_url,
+					destination,
+					filter="blob:none",
+					no_checkout=True,
+				)
+			else:
+				cloned = Repo.clone_from(repo_url, destination)
+
+			if sparse_patterns is not None:
+				_apply_sparse_checkout(cloned, sparse_patterns)
 			self._repo_path = destination
+			self._repo_url = repo_url
 			return str(destination)
 		except GitCommandError as error:
 			error_message = str(error).lower()
@@ -156,207 +669,378 @@ class RepoManager:
 		except Exception as error:
 			raise RuntimeError(f"Unexpected git history error: {error}") from error
 
-	def get_file_tree(self, path: str) -> list[str]:
-		base_path = Path(path)
-		if not base_path.exists():
-			raise FileNotFoundError(f"Path does not exist: {path}")
+	def iter_git_history(
+		self,
+		path: str,
+		max_count: int | None = None,
+		numstat: bool | None = None,
+	) -> Iterator[CommitRecord]:
+		repo_path = Path(path)
+		if not repo_path.exists():
+			raise RuntimeError(f"Repository path does not exist: {path}")
+		if not (repo_path / ".git").exists():
+			raise RuntimeError(f"Not a valid git repository: {path}")
 
-		files: list[str] = []
-		for file_path in base_path.rglob("*"):
-			if file_path.is_dir():
-				continue
+		return self._stream_git_history(path, max_count, numstat)
 
-			parts = set(file_path.parts)
-			if ".git" in parts or "__pycache__" in parts:
-				continue
+	@staticmethod
+	def _stream_git_history(
+		path: str,
+		max_count: int | None,
+		numstat: bool | None,
+	) -> Iterator[CommitRecord]:
+		try:
+			yield from iter_commit_records(path, max_count=max_count, numstat=numstat)
+		except subprocess.CalledProcessError as error:
+			detail = (error.stderr or "").strip() or str(error)
+			raise RuntimeError(f"Unable to read git history: {detail}") from error
+		except OSError as error:
+			raise RuntimeError(f"Unexpected git history error: {error}") from error
 
-			files.append(str(file_path.relative_to(base_path)))
+	def changed_files_since(self, path: str, base_sha: str) -> list[str] | None:
+		if not base_sha:
+			return None
+		try:
+			diff_output = Repo(path).git.diff("--name-only", "--no-renames", base_sha, "HEAD")
+		except (GitCommandError, InvalidGitRepositoryError, NoSuchPathError):
+			# The previous commit may have been rewritten away by a force push.
+			return None
+		return [line for line in diff_output.splitlines() if line.strip()]
 
-		files.sort()
-		return files
+	def get_file_tree(self, path: str) -> list[str]:
+		return sorted(entry.path for entry in iter_repo_files(path))
 
-	def analyze_graph_structure(self, path: str) -> dict[str, Any]:
+	def analyze_graph_structure(
+		self,
+		path: str,
+		workers: int | None = None,
+		snapshot: RepoSnapshot | None = None,
+	) -> dict[str, Any]:
 		base_path = Path(path)
 		if not base_path.exists():
 			raise FileNotFoundError(f"Path does not exist: {path}")
 
-		python_files = [
-			base_path / relative_path
-			for relative_path in self.get_file_tree(path)
-			if relative_path.endswith(".py")
-		]
-
-		all_classes: dict[str, list[str]] = {}
-		all_functions: dict[str, list[str]] = {}
-		detected_components: dict[str, list[dict[str, Any]]] = {
-			"stategraph_instantiations": [],
-			"add_node_calls": [],
-			"add_edge_calls": [],
-			"add_conditional_edges_calls": [],
-		}
-		parse_errors: list[dict[str, str]] = []
+		if snapshot is not None:
+			python_entries = [
+				(relative_path, snapshot.entries[relative_path].size)
+				for relative_path in snapshot.paths_with_suffix(".py")
+			]
+		else:
+			python_entries = sorted(
+				(entry.path, entry.size) for entry in iter_repo_files(base_path) if entry.suffix == ".py"
+			)
 
-		for python_file in python_files:
-			try:
-				source = python_file.read_text(encoding="utf-8")
-				tree = ast.parse(source, filename=str(python_file))
-				visitor = GraphAstVisitor(str(python_file.relative_to(base_path)))
-				visitor.visit(tree)
-
-				all_classes[str(python_file.relative_to(base_path))] = visitor.class_names
-				all_functions[str(python_file.relative_to(base_path))] = (
-					visitor.function_names
-				)
+		started = time.perf_counter()
+		limits = self._scan_limits
+		workers = self._scan_workers if workers is None else workers
+		detectors = registered_detectors() if self._detectors is None else self._detectors
+		scan_mode = "prefilter" if self._prefilter_sources else "full"
+		cache_prefix = (
+			f"ast-v{AST_VISITOR_VERSION}-{scan_mode}-{detector_signature(detectors)}"
+			f"-symbols{SymbolIndexDetector.version}"
+		)
+		# Forks and copied submissions often share the whole Python tree with an earlier
+		# audit; the entire analysis is then replayed instead of scanned file by file.
+		tree_key = self._tree_cache_key(cache_prefix, python_entries, snapshot)
+		if tree_key is not None:
+			cached_tree = self._ast_cache.get(tree_key)
+			if cached_tree is not None:
+				return self._replay_tree_analysis(cached_tree, workers, started)
+		cache_hits = 0
+		cache_misses = 0
+		bytes_read = 0
+		skipped: list[dict[str, Any]] = []
+		file_results: list[tuple[str, dict[str, Any]] | None] = [None] * len(python_entries)
+		pending: list[tuple[int, str, bytes, str | None]] = []
 
-				detected_components["stategraph_instantiations"].extend(
-					visitor.stategraph_instantiations
-				)
-				detected_components["add_node_calls"].extend(visitor.add_node_calls)
-				detected_components["add_edge_calls"].extend(visitor.add_edge_calls)
-				detected_components["add_conditional_edges_calls"].extend(
-					visitor.conditional_edge_calls
-				)
-			except SyntaxError as error:
-				parse_errors.append(
-					{
-						"file": str(python_file.relative_to(base_path)),
-						"error": f"SyntaxError: {error.msg} (line {error.lineno})",
-					}
-				)
-			except UnicodeDecodeError as error:
-				parse_errors.append(
+		# Smallest files are admitted first so an exhausted byte budget drops the
+		# fewest files; results are still merged in path order.
+		for index in sorted(range(len(python_entries)), key=lambda item: python_entries[item][1]):
+			relative_path, size = python_entries[index]
+			absolute_path = base_path / relative_path
+
+			skip_reason = limits.path_skip_reason(relative_path)
+			if skip_reason is not None:
+				skipped.append({"file": relative_path, "reason": skip_reason, "bytes": size})
+				continue
+			if size > limits.max_file_bytes:
+				skipped.append(
 					{
-						"file": str(python_file.relative_to(base_path)),
-						"error": f"UnicodeDecodeError: {error}",
+						"file": relative_path,
+						"reason": "oversized",
+						"bytes": size,
+						"graph_tokens": _probe_oversized_source(absolute_path),
 					}
 				)
+				continue
+
+			cache_key: str | None = None
+			# A snapshot blob SHA lets cache hits skip reading the file at all.
+			blob_sha = snapshot.blob_shas.get(relative_path) if snapshot is not None else None
+			if self._ast_cache is not None and blob_sha is not None:
+				cache_key = f"{cache_prefix}:{blob_sha}"
+				cached = self._ast_cache.get(cache_key)
+				if cached is not None:
+					cache_hits += 1
+					file_results[index] = (relative_path, _restamp_scan_result(cached, relative_path))
+					continue
+				cache_misses += 1
+
+			if bytes_read + size > limits.max_total_bytes:
+				skipped.append({"file": relative_path, "reason": "budget_exhausted", "bytes": size})
+				continue
+
+			try:
+				source = absolute_path.read_bytes()
 			except Exception as error:
-				parse_errors.append(
-					{
-						"file": str(python_file.relative_to(base_path)),
-						"error": f"Unexpected parse error: {error}",
-					}
+				file_results[index] = (
+					relative_path,
+					_error_scan_result(f"Unexpected parse error: {error}"),
 				)
+				continue
+			bytes_read += len(source)
 
-		return {
-			"summary": {
-				"python_files_scanned": len(python_files),
-				"classes_found": sum(len(item) for item in all_classes.values()),
-				"functions_found": sum(len(item) for item in all_functions.values()),
-				"stategraph_detected": bool(
-					detected_components["stategraph_instantiations"]
-				),
-				"node_definitions_detected": bool(detected_components["add_node_calls"]),
+			skip_reason = limits.content_skip_reason(source[:SAMPLE_BYTES])
+			if skip_reason is not None:
+				skipped.append({"file": relative_path, "reason": skip_reason, "bytes": len(source)})
+				continue
+
+			if self._ast_cache is not None and cache_key is None:
+				cache_key = f"{cache_prefix}:{git_blob_sha(source)}"
+				cached = self._ast_cache.get(cache_key)
+				if cached is not None:
+					cache_hits += 1
+					file_results[index] = (relative_path, _restamp_scan_result(cached, relative_path))
+					continue
+				cache_misses += 1
+
+			pending.append((index, relative_path, source, cache_key))
+
+		pending.sort(key=lambda item: item[0])
+		read_done = time.perf_counter()
+		scanned = _scan_pending_sources(
+			[(relative_path, source) for _, relative_path, source, _ in pending],
+			workers,
+			prefilter=self._prefilter_sources,
+			detectors=tuple(detectors),
+			symbols=True,
+		)
+		for (index, relative_path, _, cache_key), result in zip(pending, scanned):
+			if cache_key is not None and self._ast_cache is not None:
+				self._ast_cache.put(
+					cache_key,
+					{key: value for key, value in result.items() if key != "detector_timings"},
+				)
+			file_results[index] = (relative_path, result)
+		scan_done = time.perf_counter()
+
+		analysis = _merge_scan_results([item for item in file_results if item is not None])
+		# The symbol table is only an input to the call graph; keep it out of the evidence payload.
+		symbol_findings, symbol_stats = self._index_symbols(
+			base_path,
+			dict(python_entries),
+			[builder["file"] for builder in analysis["graph_topology"]["builders"]],
+			snapshot,
+			{
+				relative_path: result["symbols"]
+				for relative_path, result in (item for item in file_results if item is not None)
+				if "symbols" in result
+			},
+			workers,
+		)
+		symbol_done = time.perf_counter()
+		self._call_graph = CallGraph.from_symbol_findings(symbol_findings)
+		analysis["node_call_graph"] = {
+			"index": self._call_graph.summary(),
+			"builders": self._call_graph.node_call_report(analysis["graph_topology"]),
+		}
+		# Kept out of the evidence payload; callers pop it to query the duplicate index.
+		analysis["fingerprint"] = merge_signatures(
+			result["fingerprint"]
+			for _, result in (item for item in file_results if item is not None)
+			if result.get("fingerprint")
+		)
+		analysis["summary"]["scan_workers"] = workers
+		analysis["summary"]["python_files_found"] = len(python_entries)
+		analysis["summary"]["bytes_read"] = bytes_read
+		analysis["summary"]["skipped_files"] = {
+			"count": len(skipped),
+			"bytes": sum(item["bytes"] for item in skipped),
+			"by_reason": dict(Counter(item["reason"] for item in skipped)),
+			"limits": {
+				"max_file_bytes": limits.max_file_bytes,
+				"max_total_bytes": limits.max_total_bytes,
 			},
-			"classes": all_classes,
-			"functions": all_functions,
-			"langgraph_components": detected_components,
-			"errors": parse_errors,
 		}
+		analysis["skipped_files"] = sorted(skipped, key=lambda item: item["file"])[:MAX_REPORTED_SKIPS]
+		# Oversized files get their own list so vendored noise cannot truncate them away:
+		# one carrying LangGraph tokens may hold the graph the scan never parsed.
+		oversized = [item for item in skipped if item["reason"] == "oversized"]
+		analysis["oversized_files"] = sorted(oversized, key=lambda item: item["file"])[:MAX_REPORTED_SKIPS]
+		analysis["summary"]["skipped_files"]["oversized_graph_candidates"] = sum(
+			bool(item["graph_tokens"]) for item in oversized
+		)
+		analysis["summary"]["ast_cache"] = {
+			"enabled": self._ast_cache is not None,
+			"hits": cache_hits,
+			"misses": cache_misses,
+			"tree_hit": False,
+		}
+		analysis["summary"]["symbol_index"] = symbol_stats
+		if tree_key is not None:
+			self._ast_cache.put(tree_key, {"analysis": analysis, "symbols": symbol_findings})
+		# Wall-clock per phase, so pool scaling can be told apart from the serial work around it.
+		analysis["summary"]["phase_timings_ms"] = {
+			"read": round((read_done - started) * 1000, 3),
+			"scan": round((scan_done - read_done) * 1000, 3),
+			"symbol_index": round((symbol_done - scan_done) * 1000, 3),
+		}
+		return analysis
+
+	def _tree_cache_key(
+		self,
+		cache_prefix: str,
+		python_entries: list[tuple[str, int]],
+		snapshot: RepoSnapshot | None,
+	) -> str | None:
+		# Only a fully clean index pins every file's content without reading it.
+		if self._ast_cache is None or snapshot is None or not python_entries:
+			return None
+		blobs = [(relative_path, snapshot.blob_shas.get(relative_path)) for relative_path, _ in python_entries]
+		if any(blob_sha is None for _, blob_sha in blobs):
+			return None
+		tree = json.dumps([repr(self._scan_limits), sorted(blobs)], separators=(",", ":"))
+		return f"{cache_prefix}-tree:{hashlib.sha256(tree.encode('utf-8')).hexdigest()}"
+
+	def _replay_tree_analysis(self, cached: dict[str, Any], workers: int, started: float) -> dict[str, Any]:
+		analysis = cached["analysis"]
+		self._call_graph = CallGraph.from_symbol_findings(cached["symbols"])
+		summary = analysis["summary"]
+		summary["scan_workers"] = workers
+		summary["bytes_read"] = 0
+		summary["detector_timings_ms"] = {}
+		summary["ast_cache"] = {"enabled": True, "hits": 0, "misses": 0, "tree_hit": True}
+		summary["phase_timings_ms"] = {
+			"read": round((time.perf_counter() - started) * 1000, 3),
+			"scan": 0.0,
+			"symbol_index": 0.0,
+		}
+		return analysis
+
+	def _index_symbols(
+		self,
+		base_path: Path,
+		python_sizes: dict[str, int],
+		seed_files: list[str],
+		snapshot: RepoSnapshot | None,
+		scanned_symbols: dict[str, list[dict[str, Any]]],
+		workers: int,
+	) -> tuple[list[dict[str, Any]], dict[str, int]]:
+		# The call graph only needs modules reachable from the graph builders. Files
+		# parsed by the fused scan already carry their symbols; only prefiltered
+		# modules in the import closure are parsed here, one import level at a time
+		# so each level goes through the scan pool as a single batch.
+		module_paths = _module_paths(sorted(python_sizes))
+		limits = self._scan_limits
+		level = sorted(set(seed_files) & python_sizes.keys())
+		seen = set(level)
+		findings: list[dict[str, Any]] = []
+		stats = {"files": 0, "from_scan": 0, "parsed": 0, "cache_hits": 0}
+		cache_prefix = f"symbols-v{SymbolIndexDetector.version}"
+
+		while level:
+			resolved: dict[str, list[dict[str, Any]]] = {}
+			pending: list[tuple[str, bytes, str]] = []
+			for relative_path in level:
+				if relative_path in scanned_symbols:
+					resolved[relative_path] = scanned_symbols[relative_path]
+					stats["from_scan"] += 1
+					continue
+				if limits.path_skip_reason(relative_path) is not None or python_sizes[relative_path] > limits.max_file_bytes:
+					continue
+
+				blob_sha = snapshot.blob_shas.get(relative_path) if snapshot is not None else None
+				cache_key = f"{cache_prefix}:{blob_sha}" if blob_sha is not None else None
+				cached = self._ast_cache.get(cache_key) if self._ast_cache is not None and cache_key else None
+				if cached is None:
+					try:
+						source = (base_path / relative_path).read_bytes()
+					except OSError:
+						continue
+					if cache_key is None:
+						cache_key = f"{cache_prefix}:{git_blob_sha(source)}"
+						cached = self._ast_cache.get(cache_key) if self._ast_cache is not None else None
+				if cached is not None:
+					resolved[relative_path] = cached["findings"]
+					stats["cache_hits"] += 1
+					continue
+				pending.append((relative_path, source, cache_key))
+
+			parsed = _map_batches(
+				_scan_symbol_batch,
+				[(relative_path, source) for relative_path, source, _ in pending],
+				workers,
+			)
+			for (relative_path, _, cache_key), file_findings in zip(pending, parsed):
+				resolved[relative_path] = file_findings
+				stats["parsed"] += 1
+				if self._ast_cache is not None:
+					self._ast_cache.put(cache_key, {"findings": file_findings})
+
+			next_level: list[str] = []
+			for relative_path in level:
+				if relative_path not in resolved:
+					continue
+				stats["files"] += 1
+				module = module_name_for(relative_path)
+				is_package = Path(relative_path).name == "__init__.py"
+				for finding in resolved[relative_path]:
+					findings.append({"file": relative_path, **finding})
+					if finding.get("kind") != "module":
+						continue
+					for spec in finding.get("imports", {}).values():
+						target = absolute_import(module, is_package, spec)
+						# "from pkg import name" binds either a submodule or a symbol of pkg.
+						for candidate in (target, target.rpartition(".")[0]):
+							imported_path = module_paths.get(candidate)
+							if imported_path is not None and imported_path not in seen:
+								seen.add(imported_path)
+								next_level.append(imported_path)
+			level = sorted(next_level)
+		return findings, stats
 
 	def get_repo_summary(
 		self,
 		repo_url: str,
 		ignore_patterns: list[str] | None = None,
+		token_budget: int | None = None,
+		snapshot: RepoSnapshot | None = None,
 	) -> str:
+		return self.build_repo_digest(repo_url, ignore_patterns, token_budget, snapshot).text
+
+	def build_repo_digest(
+		self,
+		repo_url: str,
+		ignore_patterns: list[str] | None = None,
+		token_budget: int | None = None,
+		snapshot: RepoSnapshot | None = None,
+	) -> RepoDigest:
 		if not repo_url or not repo_url.strip():
 			raise ValueError("Repository URL cannot be empty.")
 
-		patterns = ignore_patterns or [
-			".git",
-			"node_modules",
-			"dist",
-			"build",
-			"coverage",
-			"__pycache__",
-			".venv",
-			".mypy_cache",
-			".pytest_cache",
-		]
-
-		try:
-			from gitingest import ingest
-		except ImportError as error:
-			raise RuntimeError(
-				"gitingest is not installed. Run 'uv add gitingest' and retry."
-			) from error
+		# The digest is built from the clone already on disk; the network is only
+		# touched if this manager has not cloned the repository yet.
+		if self._repo_path is None or normalize_repo_url(self._repo_url or "") != normalize_repo_url(repo_url):
+			self.clone_repo(repo_url)
+			snapshot = None
+		assert self._repo_path is not None
 
 		try:
-			summary_result = self._call_gitingest_ingest(
-				ingest_func=ingest,
-				repo_url=repo_url,
-				ignore_patterns=patterns,
+			return build_repo_digest(
+				snapshot or RepoSnapshot.build(self._repo_path),
+				token_budget=token_budget or self._digest_token_budget,
+				ignore_patterns=ignore_patterns or DEFAULT_IGNORE_PATTERNS,
+				cache=self._digest_cache,
 			)
-			summary_text = self._extract_summary_text(summary_result)
-			if not summary_text.strip():
-				raise RuntimeError("gitingest returned an empty summary.")
-			return summary_text
 		except Exception as error:
 			raise RuntimeError(f"Failed to generate repository summary: {error}") from error
-
-	@staticmethod
-	def _call_gitingest_ingest(
-		ingest_func: Any,
-		repo_url: str,
-		ignore_patterns: list[str],
-	) -> Any:
-		candidates: list[dict[str, Any]] = [
-			{"repo_url": repo_url, "ignore_patterns": ignore_patterns},
-			{"url": repo_url, "ignore_patterns": ignore_patterns},
-			{"repo": repo_url, "ignore_patterns": ignore_patterns},
-			{"repo_url": repo_url, "exclude_patterns": ignore_patterns},
-			{"url": repo_url, "exclude_patterns": ignore_patterns},
-			{"repo": repo_url, "exclude_patterns": ignore_patterns},
-		]
-
-		signature = inspect.signature(ingest_func)
-		accepts_kwargs = any(
-			parameter.kind == inspect.Parameter.VAR_KEYWORD
-			for parameter in signature.parameters.values()
-		)
-
-		for kwargs in candidates:
-			filtered_kwargs = kwargs
-			if not accepts_kwargs:
-				filtered_kwargs = {
-					key: value
-					for key, value in kwargs.items()
-					if key in signature.parameters
-				}
-
-			if not filtered_kwargs:
-				continue
-
-			try:
-				return ingest_func(**filtered_kwargs)
-			except TypeError:
-				continue
-
-		return ingest_func(repo_url)
-
-	@staticmethod
-	def _extract_summary_text(summary_result: Any) -> str:
-		if isinstance(summary_result, str):
-			return summary_result
-
-		if isinstance(summary_result, dict):
-			for key in (
-				"summary",
-				"content",
-				"text",
-				"report",
-				"result",
-				"output",
-			):
-				value = summary_result.get(key)
-				if isinstance(value, str):
-					return value
-			return str(summary_result)
-
-		for attr in ("summary", "content", "text", "report", "result", "output"):
-			if hasattr(summary_result, attr):
-				value = getattr(summary_result, attr)
-				if isinstance(value, str):
-					return value
-
-		return str(summary_result)
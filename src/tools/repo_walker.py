@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import stat
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Literal
+
+
+DEFAULT_PRUNED_DIRS = frozenset(
+	{
+		".git",
+		"__pycache__",
+		"node_modules",
+		".venv",
+		"venv",
+		"site-packages",
+		".tox",
+		".nox",
+		".mypy_cache",
+		".pytest_cache",
+		".ruff_cache",
+	}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RepoEntry:
+	path: str
+	size: int
+	kind: Literal["file", "symlink"]
+
+	@property
+	def suffix(self) -> str:
+		return os.path.splitext(self.path)[1].lower()
+
+
+@dataclass(frozen=True, slots=True)
+class _IgnoreRule:
+	base: str
+	pattern: str
+	negated: bool
+	directory_only: bool
+	anchored: bool
+
+	def matches(self, relative_path: str, is_dir: bool) -> bool:
+		if self.directory_only and not is_dir:
+			return False
+
+		if self.base:
+			prefix = self.base + "/"
+			if not relative_path.startswith(prefix):
+				return False
+			relative_path = relative_path[len(prefix) :]
+
+		if self.anchored:
+			return fnmatch.fnmatchcase(relative_path, self.pattern)
+		return fnmatch.fnmatchcase(relative_path.rsplit("/", 1)[-1], self.pattern)
+
+
+def iter_repo_files(
+	root: str | Path,
+	pruned_dirs: frozenset[str] = DEFAULT_PRUNED_DIRS,
+	use_git: bool = True,
+) -> Iterator[RepoEntry]:
+	base_path = Path(root)
+	if not base_path.exists():
+		raise FileNotFoundError(f"Path does not exist: {root}")
+
+	if use_git and (base_path / ".git").exists():
+		yielded = False
+		try:
+			for entry in _iter_git_files(base_path, pruned_dirs):
+				yielded = True
+				yield entry
+			return
+		except (OSError, subprocess.SubprocessError):
+			if yielded:
+				raise
+
+	yield from _iter_scandir_files(base_path, pruned_dirs)
+
+
+def _iter_git_files(base_path: Path, pruned_dirs: frozenset[str]) -> Iterator[RepoEntry]:
+	# Tracked plus untracked-but-not-ignored files, the same set `git status` considers.
+	# Skip-worktree entries from a sparse checkout are dropped by the lstat below.
+	command = [
+		"git",
+		"-C",
+		str(base_path),
+		"ls-files",
+		"-z",
+		"--cached",
+		"--others",
+		"--exclude-standard",
+	]
+	process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+	assert process.stdout is not None
+
+	try:
+		pending = b""
+		while True:
+			block = process.stdout.read(65536)
+			if not block:
+				break
+			records = (pending + block).split(b"\0")
+			pending = records.pop()
+			for record in records:
+				entry = _git_record_to_entry(base_path, record, pruned_dirs)
+				if entry is not None:
+					yield entry
+		if pending:
+			entry = _git_record_to_entry(base_path, pending, pruned_dirs)
+			if entry is not None:
+				yield entry
+	finally:
+		process.stdout.close()
+		return_code = process.wait()
+
+	if return_code != 0:
+		raise subprocess.CalledProcessError(return_code, command)
+
+
+def _git_record_to_entry(
+	base_path: Path,
+	record: bytes,
+	pruned_dirs: frozenset[str],
+) -> RepoEntry | None:
+	if not record:
+		return None
+
+	posix_path = os.fsdecode(record)
+	parts = posix_path.split("/")
+	if any(part in pruned_dirs for part in parts[:-1]):
+		return None
+
+	native_path = os.path.join(*parts)
+	return _stat_entry(base_path / native_path, native_path)
+
+
+def _iter_scandir_files(base_path: Path, pruned_dirs: frozenset[str]) -> Iterator[RepoEntry]:
+	stack: list[tuple[str, str, list[_IgnoreRule]]] = [
+		(str(base_path), "", _read_ignore_rules(base_path, ""))
+	]
+
+	while stack:
+		directory, relative_dir, rules = stack.pop()
+		try:
+			with os.scandir(directory) as iterator:
+				entries = sorted(iterator, key=lambda item: item.name)
+		except OSError:
+			continue
+
+		subdirectories: list[tuple[str, str, list[_IgnoreRule]]] = []
+		for entry in entries:
+			relative_posix = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+			try:
+				is_dir = entry.is_dir(follow_symlinks=False)
+			except OSError:
+				continue
+
+			if is_dir:
+				if entry.name in pruned_dirs or _is_ignored(rules, relative_posix, True):
+					continue
+				child_rules = rules + _read_ignore_rules(Path(entry.path), relative_posix)
+				subdirectories.append((entry.path, relative_posix, child_rules))
+				continue
+
+			if _is_ignored(rules, relative_posix, False):
+				continue
+
+			try:
+				entry_stat = entry.stat(follow_symlinks=False)
+			except OSError:
+				continue
+			kind: Literal["file", "symlink"] = "symlink" if entry.is_symlink() else "file"
+			if kind == "symlink" and not os.path.isfile(entry.path):
+				continue
+			yield RepoEntry(
+				path=os.path.join(*relative_posix.split("/")),
+				size=entry_stat.st_size,
+				kind=kind,
+			)
+
+		stack.extend(reversed(subdirectories))
+
+
+def _stat_entry(absolute_path: Path, relative_path: str) -> RepoEntry | None:
+	try:
+		entry_stat = os.lstat(absolute_path)
+	except OSError:
+		return None
+
+	if stat.S_ISLNK(entry_stat.st_mode):
+		if not absolute_path.is_file():
+			return None
+		return RepoEntry(path=relative_path, size=entry_stat.st_size, kind="symlink")
+	if not stat.S_ISREG(entry_stat.st_mode):
+		return None
+	return RepoEntry(path=relative_path, size=entry_stat.st_size, kind="file")
+
+
+def _read_ignore_rules(directory: Path, relative_dir: str) -> list[_IgnoreRule]:
+	ignore_file = directory / ".gitignore"
+	try:
+		lines = ignore_file.read_text(encoding="utf-8", errors="replace").splitlines()
+	except OSError:
+		return []
+
+	rules: list[_IgnoreRule] = []
+	for raw_line in lines:
+		line = raw_line.rstrip()
+		if not line or line.startswith("#"):
+			continue
+
+		negated = line.startswith("!")
+		if negated:
+			line = line[1:]
+		directory_only = line.endswith("/")
+		line = line.rstrip("/")
+		anchored = "/" in line
+		line = line.lstrip("/")
+		if line.startswith("**/"):
+			line = line[3:]
+			anchored = "/" in line
+		if not line:
+			continue
+
+		rules.append(
+			_IgnoreRule(
+				base=relative_dir,
+				pattern=line,
+				negated=negated,
+				directory_only=directory_only,
+				anchored=anchored,
+			)
+		)
+	return rules
+
+
+def _is_ignored(rules: list[_IgnoreRule], relative_path: str, is_dir: bool) -> bool:
+	# Last matching rule wins, as in git.
+	ignored = False
+	for rule in rules:
+		if rule.matches(relative_path, is_dir):
+			ignored = not rule.negated
+	return ignored
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+from src.tools.cache_store import env_int
+
+
+MAX_FILE_BYTES_ENV = "AUDITOR_SCAN_MAX_FILE_BYTES"
+MAX_TOTAL_BYTES_ENV = "AUDITOR_SCAN_MAX_TOTAL_BYTES"
+DEFAULT_MAX_FILE_BYTES = 2 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 256 * 1024 * 1024
+
+VENDORED_DIRS = frozenset(
+	{
+		"vendor",
+		"vendored",
+		"_vendor",
+		"third_party",
+		"thirdparty",
+		"third-party",
+		"extern",
+		"external",
+		"site-packages",
+		"dist-packages",
+		"node_modules",
+		"build",
+		"dist",
+	}
+)
+GENERATED_SUFFIXES = ("_pb2.py", "_pb2_grpc.py", "_pb2.pyi")
+_GENERATED_MARKERS = (b"@generated", b"DO NOT EDIT", b"Code generated by", b"Generated by the protocol buffer")
+SAMPLE_BYTES = 64 * 1024
+HEADER_BYTES = 2048
+MINIFIED_AVERAGE_LINE = 400
+MINIFIED_LONGEST_LINE = 20000
+
+
+@dataclass(frozen=True, slots=True)
+class ScanLimits:
+	max_file_bytes: int = DEFAULT_MAX_FILE_BYTES
+	max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES
+	skip_vendored: bool = True
+	skip_generated: bool = True
+
+	@classmethod
+	def from_env(cls) -> "ScanLimits":
+		return cls(
+			max_file_bytes=env_int(MAX_FILE_BYTES_ENV, DEFAULT_MAX_FILE_BYTES),
+			max_total_bytes=env_int(MAX_TOTAL_BYTES_ENV, DEFAULT_MAX_TOTAL_BYTES),
+		)
+
+	def path_skip_reason(self, relative_path: str) -> str | None:
+		parts = relative_path.replace(os.sep, "/").split("/")
+		if self.skip_vendored and any(part.lower() in VENDORED_DIRS for part in parts[:-1]):
+			return "vendored"
+		if self.skip_generated and parts[-1].endswith(GENERATED_SUFFIXES):
+			return "generated"
+		return None
+
+	def content_skip_reason(self, sample: bytes) -> str | None:
+		if b"\0" in sample:
+			return "binary"
+		if self.skip_generated and has_generated_header(sample):
+			return "generated"
+		if looks_minified(sample):
+			return "minified"
+		return None
+
+
+def has_generated_header(sample: bytes) -> bool:
+	# Markers only count in leading comments, so code mentioning them is still scanned.
+	for line in sample[:HEADER_BYTES].splitlines():
+		stripped = line.strip()
+		if stripped and not stripped.startswith(b"#"):
+			return False
+		if any(marker in stripped for marker in _GENERATED_MARKERS):
+			return True
+	return False
+
+
+def looks_minified(sample: bytes) -> bool:
+	if not sample:
+		return False
+	lines = sample.count(b"\n") + 1
+	if len(sample) / lines > MINIFIED_AVERAGE_LINE:
+		return True
+	return max(len(line) for line in sample.split(b"\n")) > MINIFIED_LONGEST_LINE
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Generic, Iterable, TypeVar
+
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+MIN_TOKEN_LENGTH = 3
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+T = TypeVar("T")
+
+
+def tokenize(text: str) -> list[str]:
+	# Shared by documents and queries so both sides agree on what a term is.
+	return [token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) >= MIN_TOKEN_LENGTH]
+
+
+def split_sentences(text: str) -> list[str]:
+	return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+class Bm25Index(Generic[T]):
+	def __init__(self, documents: Iterable[tuple[str, T]] = ()) -> None:
+		self._items: list[T] = []
+		self._lengths: list[int] = []
+		self._postings: dict[str, list[tuple[int, int]]] = {}
+		self._total_length = 0
+		for text, item in documents:
+			self.add(text, item)
+
+	def __len__(self) -> int:
+		return len(self._items)
+
+	def add(self, text: str, item: T) -> None:
+		position = len(self._items)
+		terms = Counter(tokenize(text))
+		for term, frequency in terms.items():
+			self._postings.setdefault(term, []).append((position, frequency))
+		length = sum(terms.values())
+		self._items.append(item)
+		self._lengths.append(length)
+		self._total_length += length
+
+	def score(self, query: str) -> dict[int, float]:
+		if not self._items:
+			return {}
+		count = len(self._items)
+		average_length = self._total_length / count or 1.0
+		scores: dict[int, float] = {}
+		# Only postings of the query terms are touched, so cost tracks how often
+		# those terms occur rather than document size.
+		for term in set(tokenize(query)):
+			postings = self._postings.get(term)
+			if not postings:
+				continue
+			idf = math.log(1.0 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+			for position, frequency in postings:
+				norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self._lengths[position] / average_length)
+				scores[position] = scores.get(position, 0.0) + idf * frequency * (BM25_K1 + 1.0) / (frequency + norm)
+		return scores
+
+	def search(self, query: str, limit: int | None = None) -> list[tuple[float, T]]:
+		ranked = sorted(self.score(query).items(), key=lambda pair: (-pair[1], pair[0]))
+		if limit is not None:
+			ranked = ranked[:limit]
+		return [(score, self._items[position]) for position, score in ranked]
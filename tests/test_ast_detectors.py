@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.tools.ast_detectors import AstDetector, UnsafeExecutionDetector, registered_detectors
+from src.tools.repo_tools import scan_python_source
+
+
+def test_detector_must_define_handlers() -> None:
+	class Incomplete(AstDetector):
+		name = "incomplete"
+
+	with pytest.raises(TypeError):
+		Incomplete("module.py")
+
+
+def test_unsafe_calls_pass_the_prefilter() -> None:
+	source = b"import os, subprocess\n\ndef run(cmd):\n\tos.system(cmd)\n\tsubprocess.run(cmd, shell=True)\n\teval(cmd)\n"
+
+	result = scan_python_source(source, "runner.py", prefilter=True, detectors=(UnsafeExecutionDetector,))
+
+	assert not result["inventory_only"]
+	kinds = [finding["kind"] for finding in result["detectors"]["unsafe_execution"]]
+	assert kinds == ["raw_shell", "shell_true", "dynamic_eval"]
+
+
+def test_words_containing_trigger_names_are_prefiltered() -> None:
+	source = b'"""Evaluate the shell system executor."""\n\ndef evaluate(executor):\n\treturn executor\n'
+
+	result = scan_python_source(source, "scoring.py", prefilter=True, detectors=(UnsafeExecutionDetector,))
+
+	assert result["inventory_only"]
+	assert result["functions"] == ["evaluate"]
+
+
+# Sources each detector flags, including spellings the byte prefilter has to see
+# through: whitespace around call punctuation, line continuations and module-qualified names.
+_FLAGGED_SOURCES = {
+	"langgraph": [
+		b"from langgraph.graph import StateGraph\n\nbuilder = StateGraph (\n\tdict,\n)\n",
+		b"def wire(builder):\n\tbuilder . add_node ('review', review)\n\tbuilder.add_edge('a', 'b')\n",
+		b"def wire(builder):\n\tbuilder.add_conditional_edges('a', route)\n\tbuilder.set_entry_point('a')\n",
+	],
+	"unsafe_execution": [
+		b"import os\n\nos.system('ls')\n",
+		b"import os\n\nos . popen('ls')\n",
+		b"import subprocess\n\nsubprocess.run(cmd, shell =True)\n",
+		b"import subprocess\n\nsubprocess.check_output(\n\tcmd,\n\tshell=\n\tTrue,\n)\n",
+		b"import subprocess\n\nsubprocess.call(cmd, shell=(True))\n",
+		b"import commands\n\ncommands.getstatusoutput('ls')\n",
+		b"eval (source)\n",
+		b"exec\\\n(source)\n",
+	],
+	"structured_output": [
+		b"structured = llm.with_structured_output(Verdict)\n",
+		b"tools = llm . bind_tools([search])\n",
+		b"from langchain_core import output_parsers\n\nparser = output_parsers.JsonOutputParser()\n",
+	],
+	"state_schema": [
+		b"from pydantic import BaseModel\n\nclass Verdict(BaseModel):\n\tscore: int\n",
+		b"import typing as t\n\nclass State(t.TypedDict):\n\tname: str\n",
+		b"from typing import Annotated\nimport operator\n\nclass State:\n\tlogs: Annotated[list, operator.add]\n",
+	],
+}
+
+
+def _findings(result: dict) -> dict:
+	return {"components": result["components"], "detectors": result["detectors"]}
+
+
+def test_flagged_sources_cover_every_registered_detector() -> None:
+	assert {"langgraph", *(detector.name for detector in registered_detectors())} == set(_FLAGGED_SOURCES)
+
+
+@pytest.mark.parametrize(
+	("name", "source"),
+	[(name, source) for name, sources in _FLAGGED_SOURCES.items() for source in sources],
+)
+def test_prefilter_never_skips_a_flagged_source(name: str, source: bytes) -> None:
+	detectors = registered_detectors()
+
+	full = scan_python_source(source, "module.py", detectors=detectors)
+	filtered = scan_python_source(source, "module.py", prefilter=True, detectors=detectors)
+
+	flagged = full["detectors"].get(name) if name != "langgraph" else any(full["components"].values())
+	assert flagged, "corpus entry no longer triggers its detector"
+	assert not filtered["inventory_only"]
+	assert _findings(filtered) == _findings(full)
+
+
+def test_prefilter_matches_full_scan_on_this_repository() -> None:
+	detectors = registered_detectors()
+	root = Path(__file__).resolve().parents[1]
+
+	for path in sorted([*root.joinpath("src").rglob("*.py"), *root.glob("*.py")]):
+		source = path.read_bytes()
+		full = scan_python_source(source, path.name, detectors=detectors)
+		if not any(full["components"].values()) and not any(full["detectors"].values()):
+			continue
+		filtered = scan_python_source(source, path.name, prefilter=True, detectors=detectors)
+		assert _findings(filtered) == _findings(full), path
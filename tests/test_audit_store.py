@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.nodes.detectives import _previous_evidence
+from src.nodes.judges import _reusable_opinions
+from src.state import Evidence, JudicialOpinion
+from src.tools.audit_store import REPO_ROOT_MARKER, AuditStore, detect_changed_inputs
+
+REPO_URL = "https://github.com/example/auditor"
+
+
+def _saved_record(store: AuditStore, old_clone: Path) -> dict:
+	pdf_location = str(old_clone / "reports" / "final_report.pdf")
+	return store.save(
+		REPO_URL,
+		{
+			"repo_commit": "a" * 40,
+			"repo_path": str(old_clone),
+			"pdf_relative_path": "reports/final_report.pdf",
+			"evidences": {
+				"doc_analysis": [
+					Evidence(
+						goal="Extract architectural requirements from PDF",
+						found=True,
+						content="{}",
+						location=pdf_location,
+						rationale="parsed",
+						confidence=0.9,
+					)
+				]
+			},
+			"opinions": [
+				JudicialOpinion(
+					judge="Prosecutor",
+					criterion_id="report_accuracy",
+					score=3,
+					argument="Claims partly verified.",
+					cited_evidence=[pdf_location],
+				)
+			],
+		},
+	)
+
+
+def test_stored_locations_are_relative_to_the_clone(tmp_path: Path) -> None:
+	record = _saved_record(AuditStore(tmp_path / "audits"), tmp_path / "run1" / "target_repo")
+
+	location = record["evidences"]["doc_analysis"][0]["location"]
+	assert location == f"{REPO_ROOT_MARKER}/reports/final_report.pdf"
+	assert record["opinions"][0]["cited_evidence"] == [location]
+
+
+def test_reused_evidence_points_into_the_current_clone(tmp_path: Path) -> None:
+	store = AuditStore(tmp_path / "audits")
+	_saved_record(store, tmp_path / "run1" / "target_repo")
+	previous = store.load(REPO_URL)
+	new_clone = tmp_path / "run2" / "target_repo"
+	expected = str(new_clone / "reports" / "final_report.pdf")
+
+	evidence = _previous_evidence(
+		previous,
+		"doc_analysis",
+		"Extract architectural requirements from PDF",
+		str(new_clone),
+	)
+	opinions = _reusable_opinions(
+		{
+			"incremental": True,
+			"previous_audit": previous,
+			"repo_path": str(new_clone),
+			"changed_inputs": {"repo": False, "history": False, "pdf": False},
+		},
+		"Prosecutor",
+		[{"id": "report_accuracy"}],
+	)
+
+	assert evidence is not None and evidence.location == expected
+	assert opinions["report_accuracy"].cited_evidence == [expected]
+
+
+def test_any_tracked_file_change_reruns_the_repo_analysis() -> None:
+	previous = {"commit_sha": "a" * 40, "pdf_path": "reports/final_report.pdf"}
+	head = "b" * 40
+
+	assert detect_changed_inputs(previous, head, "reports/final_report.pdf", ["pyproject.toml"]) == {
+		"repo": True,
+		"history": True,
+		"pdf": False,
+	}
+	assert detect_changed_inputs(previous, head, "reports/final_report.pdf", ["reports\\final_report.pdf"])["pdf"]
+	# An empty diff, e.g. a merge that changed no files, keeps the stored analysis.
+	assert not detect_changed_inputs(previous, head, "reports/final_report.pdf", [])["repo"]
+	assert detect_changed_inputs(previous, head, "reports/final_report.pdf", None) == {
+		"repo": True,
+		"history": True,
+		"pdf": True,
+	}
+	assert detect_changed_inputs(previous, "a" * 40, "reports/final_report.pdf", None) == {
+		"repo": False,
+		"history": False,
+		"pdf": False,
+	}
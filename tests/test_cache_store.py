@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.tools.cache_store import JsonBlobCache
+
+
+def test_blob_cache_round_trips_compressed_entries(tmp_path: Path) -> None:
+	cache = JsonBlobCache(tmp_path / "blobs", max_bytes=1024 * 1024, compress=True)
+	value = {"markdown": "# Report\n" * 200, "chunks": [{"header": "Report", "page": 1}]}
+
+	cache.put("report", value)
+
+	assert cache.get("report") == value
+	assert cache.get("missing") is None
+	assert (cache.hits, cache.misses) == (1, 1)
+	(entry,) = (tmp_path / "blobs").glob("*/*.json.gz")
+	assert entry.stat().st_size < len("# Report\n" * 200)
+
+
+def test_blob_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+	cache = JsonBlobCache(tmp_path / "blobs", max_bytes=3000)
+	for index, key in enumerate(("old", "recent", "fresh")):
+		cache.put(key, "x" * 900)
+		entry = cache._entry_path(key)
+		os.utime(entry, (1_000_000 + index, 1_000_000 + index))
+	# Reading refreshes an entry's mtime, so "old" becomes the most recently used.
+	assert cache.get("old") is not None
+
+	cache.put("newest", "x" * 900)
+
+	assert cache.get("recent") is None
+	assert cache.get("old") is not None
+	assert cache.get("newest") is not None
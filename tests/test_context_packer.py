@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from src.tools.context_packer import pack_context, render_chunk
+from src.tools.doc_tools import ForensicChunk
+
+
+def _chunk(chunk_id: str, words: int) -> ForensicChunk:
+	return ForensicChunk(
+		chunk_id=chunk_id,
+		header=f"Section {chunk_id}",
+		header_level=2,
+		content=" ".join(["evidence"] * words),
+		page_numbers=[int(chunk_id[1:])],
+	)
+
+
+CHUNKS = [_chunk("c1", 40), _chunk("c2", 1_000), _chunk("c3", 40), _chunk("c4", 80)]
+
+
+def test_ranked_sections_are_packed_in_document_order_within_budget() -> None:
+	c1, c2, c3, c4 = CHUNKS
+	packed = pack_context(CHUNKS, [(3.0, c3), (2.0, c2), (1.0, c1), (0.0, c4)], token_budget=500)
+
+	assert render_chunk(c3).startswith("## Section c3 (pages 3)\nevidence")
+	assert packed.chunk_ids == ["c2", "c3"]
+	assert packed.truncated_chunk_ids == ["c2"]
+	assert packed.omitted_chunks == 2
+	assert packed.estimated_tokens <= packed.token_budget == 500
+	assert packed.text.index("Section c2") < packed.text.index("Section c3")
+	assert "[truncated: context budget reached]" in packed.text
+	assert "text" not in packed.summary()
+
+
+def test_smaller_lower_ranked_section_fills_remaining_budget() -> None:
+	c1, c2, c3, c4 = CHUNKS
+	# c2 neither fits nor leaves room for a useful partial, so c1 is packed after c4.
+	packed = pack_context(CHUNKS, [(2.0, c4), (1.5, c2), (1.0, c1)], token_budget=290)
+
+	assert packed.chunk_ids == ["c1", "c4"]
+	assert packed.truncated_chunk_ids == []
+	assert packed.omitted_chunks == 2
+
+
+def test_without_relevance_signal_the_document_is_packed_front_to_back() -> None:
+	packed = pack_context(CHUNKS, [(0.0, chunk) for chunk in reversed(CHUNKS)], token_budget=200)
+
+	assert packed.chunk_ids == ["c1", "c3"]
+	assert packed.truncated_chunk_ids == []
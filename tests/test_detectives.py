@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.nodes import detectives
+from src.tools.doc_tools import PdfArtifact
+from src.tools.repo_snapshot import RepoSnapshot
+
+fitz = pytest.importorskip("fitz")
+
+
+def _report(repo: Path) -> Path:
+	path = repo / "reports" / "final_report.pdf"
+	path.parent.mkdir(parents=True)
+	diagram = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 16, 16), 0)
+	diagram.set_rect(diagram.irect, (40, 90, 200))
+	with fitz.open() as document:
+		page = document.new_page()
+		page.insert_text((72, 72), "Architecture", fontsize=18)
+		page.insert_textbox(fitz.Rect(72, 96, 520, 200), "The StateGraph fans in to one aggregator. " * 4, fontsize=10)
+		page.insert_image(fitz.Rect(72, 220, 232, 380), stream=diagram.tobytes("png"))
+		document.save(path)
+	return path
+
+
+class _RecordingVision:
+	# Stands in for ChatGroq so the vision node runs without network access.
+	messages: list[Any] = []
+
+	def __init__(self, **options: Any) -> None:
+		pass
+
+	def invoke(self, messages: list[Any]) -> SimpleNamespace:
+		_RecordingVision.messages = messages
+		return SimpleNamespace(content="Fan-in aggregator confirmed.")
+
+
+def test_ingestion_node_reads_the_report_once_without_converting(tmp_path: Path) -> None:
+	repo = tmp_path / "repo"
+	report = _report(repo)
+
+	update = detectives.pdf_ingestion_node(
+		{"repo_path": str(repo), "pdf_path": "", "repo_snapshot": RepoSnapshot.build(repo)}
+	)
+
+	artifact = update["pdf_artifact"]
+	assert update["pdf_path"] == str(report)
+	assert artifact.parsed and artifact.image_error is None
+	assert artifact.page_count == 1 and len(artifact.image_paths) == 1
+	assert artifact.size_bytes == report.stat().st_size
+	assert artifact.probe is not None and artifact.probe.text_chars > 0
+	# Text conversion is left to the doc analyst's stream.
+	assert artifact.chunks == [] and artifact.markdown == ""
+	assert "1 pages, 1 images" in update["messages"][0]
+
+
+def test_ingestion_node_records_a_missing_report(tmp_path: Path) -> None:
+	update = detectives.pdf_ingestion_node({"repo_path": "", "pdf_path": str(tmp_path / "missing.pdf")})
+
+	artifact = update["pdf_artifact"]
+	assert artifact.error_type == "FileNotFoundError"
+	assert not artifact.parsed and artifact.image_paths == []
+
+
+def test_vision_node_uses_the_shared_artifact(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	repo = tmp_path / "repo"
+	_report(repo)
+	artifact = detectives.pdf_ingestion_node({"repo_path": str(repo), "pdf_path": ""})["pdf_artifact"]
+
+	def reopen(pdf_path: str) -> PdfArtifact:
+		raise AssertionError("the vision node reopened the PDF")
+
+	monkeypatch.setattr(detectives._DOC_ANALYST, "inspect_pdf", reopen)
+	monkeypatch.setattr(detectives, "ChatGroq", _RecordingVision)
+
+	update = detectives.vision_inspector_node({"repo_path": str(repo), "pdf_path": "", "pdf_artifact": artifact})
+
+	(evidence,) = update["evidences"]["vision_analysis"]
+	assert evidence.found and evidence.location == artifact.pdf_path
+	assert evidence.content == "Fan-in aggregator confirmed."
+	(message,) = _RecordingVision.messages
+	assert [part["type"] for part in message.content] == ["text", "image_url"]
+
+
+def test_vision_node_reports_the_artifact_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	monkeypatch.setattr(detectives, "ChatGroq", _RecordingVision)
+	missing = str(tmp_path / "missing.pdf")
+	artifact = detectives.pdf_ingestion_node({"repo_path": "", "pdf_path": missing})["pdf_artifact"]
+
+	update = detectives.vision_inspector_node({"repo_path": "", "pdf_path": missing, "pdf_artifact": artifact})
+
+	(evidence,) = update["evidences"]["vision_analysis"]
+	assert not evidence.found and evidence.confidence == 0.0
+	assert "PDF file not found" in evidence.content
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from src.tools.doc_index import ProvenanceIndex
+
+PAYLOAD = {
+	"texts": [
+		{"text": "## Fan-In   Design", "prov": [{"page_no": 2}]},
+		{"text": "The aggregator waits for both detectives.", "prov": [{"page_no": 2}, {"page_no": 3}]},
+		{"text": "Unplaced caption"},
+	],
+	"tables": [
+		{"prov": [{"page_no": 3}], "data": {"num_rows": 4, "num_cols": 2, "table_cells": [{"text": "cell"}]}},
+		{"page_no": 5, "rows": 2, "cols": 3},
+	],
+	"pages": {"1": {"page_no": 1}, "2": {"page_no": 2}, "3": {"page_no": 3}, "5": {"page_no": 5}},
+}
+
+
+def test_index_maps_lines_to_pages_and_tables() -> None:
+	index = ProvenanceIndex.build(PAYLOAD)
+
+	assert index.pages == [1, 2, 3, 5]
+	assert index.pages_for(["# Fan-In Design"]) == [2]
+	assert index.pages_for(["- the aggregator waits for  both detectives.", "See page 7."]) == [2, 3, 7]
+	assert index.pages_for(["Unplaced caption", ""]) == []
+	assert index.tables_for([3, 4, 5]) == ["table_001", "table_002"]
+
+
+def test_tables_are_registered_once_with_their_shape() -> None:
+	index = ProvenanceIndex.build(PAYLOAD, first_table_number=4)
+
+	assert [
+		(table["table_id"], table["key"], table["rows"], table["cols"], table["page"]) for table in index.tables
+	] == [
+		("table_004", "tables[0]", 4, 2, 3),
+		("table_005", "tables[1]", 2, 3, 5),
+	]
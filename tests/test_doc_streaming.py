@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.tools import doc_tools
+from src.tools.cache_store import JsonBlobCache
+from src.tools.doc_tools import DocAnalyst, DocumentForensics
+from src.tools.pdf_probe import pymupdf_conversion
+
+fitz = pytest.importorskip("fitz")
+
+PAGES = 40
+PAGES_PER_RANGE = 8
+
+
+@pytest.fixture(scope="module")
+def report_pdf(tmp_path_factory: pytest.TempPathFactory) -> Path:
+	path = tmp_path_factory.mktemp("reports") / "report.pdf"
+	with fitz.open() as document:
+		for number in range(1, PAGES + 1):
+			page = document.new_page()
+			# Every third page continues the previous section, so chunks span ranges.
+			if number % 3:
+				page.insert_text((72, 72), f"Section {number}", fontsize=18)
+			box = fitz.Rect(72, 96, page.rect.width - 72, page.rect.height - 72)
+			page.insert_textbox(box, f"Page {number} evidence about the StateGraph fan-in. " * 8, fontsize=10)
+		document.save(path)
+	return path
+
+
+def _dumps(chunks: list) -> list[dict]:
+	return [chunk if isinstance(chunk, dict) else chunk.model_dump() for chunk in chunks]
+
+
+def test_batch_parallel_and_streamed_chunks_match(report_pdf: Path) -> None:
+	batch = DocumentForensics(page_workers=1, pages_per_range=PAGES_PER_RANGE).ingest(str(report_pdf))
+	parallel = DocumentForensics(page_workers=2, pages_per_range=PAGES_PER_RANGE).ingest(str(report_pdf))
+	streamed = list(DocumentForensics(page_workers=1, pages_per_range=PAGES_PER_RANGE).iter_chunks(str(report_pdf)))
+
+	assert batch["success"] and parallel["success"]
+	assert parallel["pipeline"]["mode"] == "page_parallel"
+	assert _dumps(batch["chunks"]) == _dumps(parallel["chunks"]) == _dumps(streamed)
+
+
+def test_streamed_conversion_is_cached(report_pdf: Path, tmp_path: Path) -> None:
+	cache = JsonBlobCache(tmp_path / "docling", max_bytes=64 * 1024 * 1024)
+	first = list(DocumentForensics(conversion_cache=cache, pages_per_range=PAGES_PER_RANGE).iter_chunks(str(report_pdf)))
+	hits_before = cache.hits
+	second = list(DocumentForensics(conversion_cache=cache, pages_per_range=PAGES_PER_RANGE).iter_chunks(str(report_pdf)))
+
+	assert cache.hits == hits_before + 1
+	assert _dumps(first) == _dumps(second)
+
+	# A streamed entry has no markdown, so a batch ingest converts and upgrades it.
+	result = DocumentForensics(conversion_cache=cache, pages_per_range=PAGES_PER_RANGE).ingest(str(report_pdf))
+	assert result["success"] and not result["cache_hit"]
+	assert result["markdown"]
+	assert DocumentForensics(conversion_cache=cache).ingest(str(report_pdf))["cache_hit"]
+
+
+class FakeDocling:
+	# Stands in for docling's DocumentConverter; converts the text layer the same
+	# way as the PyMuPDF fallback so its chunks can be compared.
+	conversions = 0
+
+	def convert(self, source: SimpleNamespace) -> SimpleNamespace:
+		FakeDocling.conversions += 1
+		with fitz.open(stream=source.stream.read(), filetype="pdf") as document:
+			markdown_text, json_payload = pymupdf_conversion(document)
+		return SimpleNamespace(
+			document=SimpleNamespace(
+				export_to_markdown=lambda: markdown_text,
+				export_to_dict=lambda: json_payload,
+			)
+		)
+
+
+def test_serial_docling_stream_does_not_deadlock(report_pdf: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	expected = _dumps(DocumentForensics(pages_per_range=PAGES_PER_RANGE).iter_chunks(str(report_pdf)))
+	monkeypatch.setattr(doc_tools, "DocumentConverter", FakeDocling)
+	monkeypatch.setattr(doc_tools, "DocumentStream", lambda name, stream: SimpleNamespace(name=name, stream=stream))
+	monkeypatch.setattr(doc_tools, "_SHARED_CONVERTERS", {})
+	FakeDocling.conversions = 0
+	streamed: list = []
+
+	def consume() -> None:
+		streamed.extend(DocumentForensics(page_workers=1, pages_per_range=PAGES_PER_RANGE).iter_chunks(str(report_pdf)))
+
+	worker = threading.Thread(target=consume, daemon=True)
+	worker.start()
+	worker.join(timeout=30)
+
+	assert not worker.is_alive(), "serial Docling streaming deadlocked on the converter lock"
+	assert FakeDocling.conversions == PAGES // PAGES_PER_RANGE
+	assert _dumps(streamed) == expected
+
+
+def test_streamed_requirements_keep_no_chunks(report_pdf: Path, tmp_path: Path) -> None:
+	path = tmp_path / "rubric.pdf"
+	with fitz.open() as document:
+		page = document.new_page()
+		page.insert_text((72, 72), "Objectives", fontsize=18)
+		page.insert_textbox(fitz.Rect(72, 96, 520, 300), "Build a StateGraph with a fan-in aggregator. " * 4, fontsize=10)
+		document.save(path)
+	analyst = DocAnalyst(pages_per_range=PAGES_PER_RANGE)
+
+	artifact = analyst.inspect_pdf(str(path))
+	streamed = list(analyst.iter_requirements(artifact.pdf_path, artifact.content_sha256, artifact.probe))
+
+	assert artifact.chunks == [] and artifact.pipeline == {}
+	assert artifact.probe is not None and artifact.probe.text_chars > 0
+	assert [chunk.header for chunk in streamed] == ["Objectives"]
+	assert analyst.chunks == []
+	assert analyst.pipeline["chunks"] == 1 and analyst.pipeline["mode"] == "streamed"
+	assert analyst.extract_rubric_dimensions().objectives.startswith("Build a StateGraph")
+
+	retained = list(analyst.iter_requirements(str(report_pdf), retain=True))
+	assert analyst.chunks == retained
+	assert analyst.pack_context(["fan-in evidence"], token_budget=200).chunk_ids
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from src.tools.cache_store import JsonBlobCache
+from src.tools.doc_summarizer import MapReduceSummarizer
+from src.tools.doc_tools import ForensicChunk
+
+CHUNKS = [
+	ForensicChunk(chunk_id=f"c{index}", header=f"Rule {index}", header_level=2, content=f"Threshold {index} applies.")
+	for index in range(5)
+]
+
+
+class FakeModel:
+	def __init__(self, failing: str | None = None) -> None:
+		self.failing = failing
+		self.prompts: list[str] = []
+
+	def __call__(self, prompt: str) -> str:
+		self.prompts.append(prompt)
+		if self.failing and self.failing in prompt:
+			raise ConnectionError("provider unavailable")
+		# Map calls extract the section's rule; reduce calls merge every rule they see.
+		rules = sorted(set(rule.lower() for rule in re.findall(r"[Rr]ule \d", prompt)))
+		return json.dumps({"scoring_rubric_rules": rules, "technical_constraints": []})
+
+
+def test_partial_failure_keeps_successful_map_results_cached(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.setattr("src.tools.doc_summarizer.time.sleep", lambda seconds: None)
+	cache = JsonBlobCache(tmp_path / "summaries", max_bytes=1024 * 1024)
+
+	failing = FakeModel(failing="## Rule 3")
+	with pytest.raises(RuntimeError, match="provider unavailable"):
+		MapReduceSummarizer(failing, cache=cache, concurrency=2).summarize(CHUNKS)
+
+	retry = FakeModel()
+	result = MapReduceSummarizer(retry, cache=cache, concurrency=2).summarize(iter(CHUNKS))
+
+	assert result.units == 5
+	assert result.cache_hits == 4
+	assert result.map_calls == 1
+	assert sum("EXCERPT" in prompt for prompt in retry.prompts) == 1
+	assert json.loads(result.text)["scoring_rubric_rules"] == [f"rule {index}" for index in range(5)]
+
+
+def test_repeated_sections_are_summarized_once(tmp_path: Path) -> None:
+	model = FakeModel()
+	result = MapReduceSummarizer(model, concurrency=4).summarize([*CHUNKS[:2], *CHUNKS[:2]])
+
+	assert result.units == 4
+	assert result.map_calls == 2
+	assert result.reduce_calls == 1
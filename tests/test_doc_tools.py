@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.tools import doc_tools
+from src.tools.cache_store import JsonBlobCache
+from src.tools.doc_tools import DocAnalyst, DocumentForensics, get_shared_converter
+from src.tools.pdf_probe import pymupdf_conversion
+
+fitz = pytest.importorskip("fitz")
+
+
+class StubConverter:
+	# Stands in for docling's DocumentConverter: construction is what loads models,
+	# so both constructions and conversions are counted.
+	built = 0
+	conversions = 0
+
+	def __init__(self, **options: object) -> None:
+		StubConverter.built += 1
+
+	def convert(self, source: object) -> SimpleNamespace:
+		StubConverter.conversions += 1
+		if isinstance(source, str):
+			document = fitz.open(source)
+		else:
+			document = fitz.open(stream=source.stream.read(), filetype="pdf")
+		with document:
+			markdown_text, json_payload = pymupdf_conversion(document)
+		return SimpleNamespace(
+			document=SimpleNamespace(
+				export_to_markdown=lambda: markdown_text,
+				export_to_dict=lambda: json_payload,
+			)
+		)
+
+
+@pytest.fixture
+def stub_docling(monkeypatch: pytest.MonkeyPatch) -> type[StubConverter]:
+	monkeypatch.setattr(doc_tools, "DocumentConverter", StubConverter)
+	monkeypatch.setattr(doc_tools, "DocumentStream", lambda name, stream: SimpleNamespace(name=name, stream=stream))
+	monkeypatch.setattr(doc_tools, "PdfPipelineOptions", None)
+	monkeypatch.setattr(doc_tools, "_SHARED_CONVERTERS", {})
+	monkeypatch.setattr(doc_tools, "docling_version", lambda: "2.0.0")
+	StubConverter.built = 0
+	StubConverter.conversions = 0
+	return StubConverter
+
+
+def _report(path: Path, title: str) -> Path:
+	with fitz.open() as document:
+		page = document.new_page()
+		page.insert_text((72, 72), title, fontsize=18)
+		page.insert_textbox(fitz.Rect(72, 96, 520, 400), "The StateGraph fans in to one aggregator. " * 6, fontsize=10)
+		document.save(path)
+	return path
+
+
+def test_shared_converter_is_built_once_per_tier(stub_docling: type[StubConverter]) -> None:
+	first = get_shared_converter(doc_tools.TIER_TEXT)
+
+	assert get_shared_converter(doc_tools.TIER_TEXT) is first
+	assert get_shared_converter(doc_tools.TIER_FULL) is not first
+	assert stub_docling.built == 2
+
+
+def test_shared_converter_requires_docling(monkeypatch: pytest.MonkeyPatch) -> None:
+	monkeypatch.setattr(doc_tools, "DocumentConverter", None)
+
+	with pytest.raises(RuntimeError, match="Docling is not installed"):
+		get_shared_converter()
+
+
+def test_repeat_ingest_is_served_from_the_conversion_cache(
+	stub_docling: type[StubConverter],
+	tmp_path: Path,
+) -> None:
+	report = _report(tmp_path / "report.pdf", "Architecture")
+	cache = JsonBlobCache(tmp_path / "docling", max_bytes=16 * 1024 * 1024, compress=True)
+
+	first = DocumentForensics(conversion_cache=cache).ingest(str(report))
+	second = DocumentForensics(conversion_cache=cache).ingest(str(report), data=report.read_bytes())
+
+	assert first["success"] and not first["cache_hit"]
+	assert first["pipeline"]["engine"] == "docling-2.0.0"
+	assert second["cache_hit"]
+	assert stub_docling.conversions == 1 and stub_docling.built == 1
+	assert (second["markdown"], second["chunks"]) == (first["markdown"], first["chunks"])
+
+
+def test_conversion_cache_misses_on_new_content_or_engine(
+	stub_docling: type[StubConverter],
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+) -> None:
+	report = _report(tmp_path / "report.pdf", "Architecture")
+	cache = JsonBlobCache(tmp_path / "docling", max_bytes=16 * 1024 * 1024)
+	DocumentForensics(conversion_cache=cache).ingest(str(report))
+
+	_report(report, "Revised architecture")
+	assert not DocumentForensics(conversion_cache=cache).ingest(str(report))["cache_hit"]
+
+	monkeypatch.setattr(doc_tools, "docling_version", lambda: "2.1.0")
+	assert not DocumentForensics(conversion_cache=cache).ingest(str(report))["cache_hit"]
+	assert stub_docling.conversions == 3
+
+
+def test_inspection_defers_conversion_and_ingest_reuses_its_probe(
+	stub_docling: type[StubConverter],
+	tmp_path: Path,
+) -> None:
+	report = _report(tmp_path / "report.pdf", "Architecture")
+	analyst = DocAnalyst()
+
+	inspected = analyst.inspect_pdf(str(report))
+	assert stub_docling.conversions == 0
+	assert inspected.chunks == [] and inspected.summary()["tier"] == inspected.probe.tier()
+
+	ingested = analyst.ingest_pdf(str(report))
+
+	assert stub_docling.conversions == 1
+	assert ingested.content_sha256 == inspected.content_sha256
+	# The converter is handed the probe taken during inspection rather than re-probing.
+	assert ingested.pipeline["probe"] == ingested.probe.summary()
+	assert [chunk["header"] for chunk in ingested.chunks] == ["Architecture"]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from src.tools.git_forensics import analyze_commit_progression
+from src.tools.git_history import CommitRecord, iter_commit_records
+
+HOUR = 3600
+
+
+def _record(
+	index: int,
+	subject: str,
+	paths: tuple[str, ...],
+	insertions: int,
+	generated_churn: int = 0,
+) -> CommitRecord:
+	return CommitRecord(
+		sha=f"{index:040x}",
+		author="student",
+		email="student@example.com",
+		authored_at=index * HOUR,
+		committed_at=index * HOUR,
+		subject=subject,
+		files_changed=len(paths),
+		insertions=insertions,
+		deletions=0,
+		paths=paths,
+		generated_churn=generated_churn,
+	)
+
+
+def test_lockfile_churn_does_not_make_a_bulk_commit() -> None:
+	records = [
+		_record(1, "Initial project setup with uv", ("pyproject.toml", "uv.lock"), 3020, generated_churn=3000),
+		_record(2, "Add repo clone and AST tools", ("src/tools/repo_tools.py",), 120),
+		_record(3, "Add PDF forensics tool", ("src/tools/doc_tools.py",), 110),
+		_record(4, "Wire the StateGraph nodes", ("src/graph.py", "src/nodes/judges.py"), 150),
+	]
+
+	result = analyze_commit_progression(reversed(records))
+
+	assert result["total_churn"] == 400
+	assert result["bulk_commits"] == []
+	assert not result["bulk_upload_detected"]
+	assert result["progression_detected"]
+
+
+def test_history_reports_generated_churn(tmp_path: Path) -> None:
+	def git(*args: str) -> None:
+		subprocess.run(
+			["git", "-C", str(tmp_path), "-c", "user.name=student", "-c", "user.email=s@example.com", *args],
+			check=True,
+			capture_output=True,
+		)
+
+	git("init", "-q")
+	(tmp_path / "main.py").write_text("print('hi')\n", encoding="utf-8")
+	(tmp_path / "uv.lock").write_text("".join(f"line {n}\n" for n in range(50)), encoding="utf-8")
+	git("add", ".")
+	git("commit", "-q", "-m", "Initial setup")
+
+	(record,) = list(iter_commit_records(tmp_path, numstat=True))
+
+	assert record.churn == 51
+	assert record.generated_churn == 50
+	assert record.authored_churn == 1
+
+
+def test_vendored_and_generated_files_do_not_make_a_bulk_commit() -> None:
+	vendored = tuple(f"vendor/lib/module_{index}.py" for index in range(30))
+	generated = tuple(f"src/proto/message_{index}_pb2.py" for index in range(10))
+	records = [
+		_record(1, "Initial project setup with uv", ("pyproject.toml", "src/graph.py"), 20),
+		_record(2, "Add tools and vendored parser", ("src/tools/repo_tools.py", *vendored, *generated), 120),
+		_record(3, "Add PDF forensics tool", ("src/tools/doc_tools.py",), 110),
+		_record(4, "Wire the StateGraph nodes", ("src/nodes/detectives.py", "src/nodes/judges.py"), 150),
+	]
+
+	result = analyze_commit_progression(reversed(records))
+
+	assert result["bulk_commits"] == []
+	assert not result["bulk_upload_detected"]
+
+	sweeping = _record(5, "Add everything", tuple(f"src/module_{index}.py" for index in range(12)), 100)
+	result = analyze_commit_progression(reversed([*records, sweeping]))
+
+	assert result["bulk_commits"] == [{"hash": sweeping.sha[:10], "authored_files": 12, "churn_share": 0.2}]
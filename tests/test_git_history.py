@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.tools.git_history import is_generated_path, iter_commit_records
+
+
+def _git(root: Path, *args: str) -> str:
+	return subprocess.run(
+		["git", "-C", str(root), "-c", "user.name=student", "-c", "user.email=s@example.com", *args],
+		check=True,
+		capture_output=True,
+		text=True,
+	).stdout.strip()
+
+
+def _commit(root: Path, subject: str, files: dict[str, bytes]) -> None:
+	for relative_path, data in files.items():
+		path = root / relative_path
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_bytes(data)
+	_git(root, "add", ".")
+	_git(root, "commit", "-q", "-m", subject)
+
+
+def _history(root: Path) -> Path:
+	root.mkdir()
+	_git(root, "init", "-q")
+	_commit(root, "Initial setup", {"pyproject.toml": b"[project]\n", "README.md": b"# app\n"})
+	tools = {f"src/tools/tool_{index}.py": b"def tool():\n\treturn 1\n" for index in range(5)}
+	_commit(root, "Add tools\n\nLonger body that is not part of the subject.", tools)
+	_commit(root, "Add diagram", {"docs/diagram.png": b"\x89PNG\r\n\x00\x01", "src/graph.py": b"builder = None\n"})
+	return root
+
+
+def test_records_stream_newest_first_with_numstat(tmp_path: Path) -> None:
+	root = _history(tmp_path / "repo")
+
+	records = list(iter_commit_records(root, numstat=True))
+
+	assert [record.subject for record in records] == ["Add diagram", "Add tools", "Initial setup"]
+	assert [record.sha for record in records] == _git(root, "log", "--format=%H").splitlines()
+	diagram = records[0]
+	# Binary files count as changed but report no line churn.
+	assert diagram.files_changed == 2
+	assert diagram.churn == 1
+	assert diagram.email == "s@example.com"
+	assert diagram.committed_at >= records[-1].committed_at
+	assert diagram.as_dict()["paths"] == ["docs/diagram.png", "src/graph.py"]
+
+
+def test_name_only_records_have_no_churn(tmp_path: Path) -> None:
+	root = _history(tmp_path / "repo")
+
+	records = list(iter_commit_records(root, numstat=False, max_count=2))
+
+	assert len(records) == 2
+	assert records[1].files_changed == 5
+	assert records[1].insertions is None and records[1].churn is None and records[1].authored_churn is None
+
+
+def test_paths_are_capped_but_still_counted(tmp_path: Path) -> None:
+	root = _history(tmp_path / "repo")
+
+	tools = next(record for record in iter_commit_records(root, max_paths=2) if record.subject == "Add tools")
+
+	assert tools.files_changed == 5
+	assert len(tools.paths) == 2
+
+
+def test_closing_the_stream_early_stops_git(tmp_path: Path) -> None:
+	root = _history(tmp_path / "repo")
+
+	records = iter_commit_records(root)
+	first = next(records)
+	records.close()
+
+	assert first.subject == "Add diagram"
+
+
+def test_git_failures_surface_after_the_stream(tmp_path: Path) -> None:
+	with pytest.raises(subprocess.CalledProcessError):
+		list(iter_commit_records(tmp_path))
+
+
+def test_generated_paths_cover_lockfiles_and_minified_assets() -> None:
+	assert is_generated_path("uv.lock")
+	assert is_generated_path("web/Package-Lock.json")
+	assert is_generated_path("static/app.min.js")
+	assert not is_generated_path("src/lock.py")
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.tools.repo_tools import RepoManager
+
+GRAPH_SOURCE = """
+from langgraph.graph import END, START, StateGraph
+
+PLAN = "plan"
+
+builder = StateGraph(dict)
+builder.add_node(PLAN, plan_node)
+builder.add_node("search", search_node)
+builder.add_node("read", read_node)
+builder.add_node("merge", merge_node)
+builder.add_node("orphan", orphan_node)
+builder.add_edge(START, PLAN)
+builder.add_edge(PLAN, "search")
+builder.add_edge(PLAN, "read")
+builder.add_edge(["search", "read"], "merge")
+builder.add_conditional_edges("merge", route, {"retry": PLAN, "done": END})
+builder.add_conditional_edges("search", pick_next)
+"""
+
+
+def test_topology_resolves_constants_joins_and_branches(tmp_path: Path) -> None:
+	(tmp_path / "graph.py").write_text(GRAPH_SOURCE, encoding="utf-8")
+
+	topology = RepoManager().analyze_graph_structure(str(tmp_path))["graph_topology"]
+	(builder,) = topology["builders"]
+
+	assert builder["entry_points"] == ["plan"]
+	assert {edge["kind"] for edge in builder["edges"] if edge["target"] == "merge"} == {"join"}
+	assert builder["fan_out"] == {"plan": ["read", "search"]}
+	assert builder["fan_in"]["merge"] == ["read", "search"]
+	assert builder["conditional_branches"] == {"merge": ["__end__", "plan"]}
+	assert builder["dynamic_routers"][0]["router"] == "pick_next"
+	assert builder["stages"] == [["plan"], ["read", "search"], ["merge"]]
+	assert builder["unreachable"] == ["orphan"]
+	assert builder["cycles"] == [["merge", "plan", "read", "search"]]
+	assert builder["reaches_end"]
+	assert topology["parallel_fan_out_detected"] and topology["fan_in_detected"] and topology["cycles_detected"]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.tools.minhash import (
+	SubmissionIndex,
+	estimate_similarity,
+	merge_signatures,
+	minhash_signature,
+)
+
+ORIGINAL = b"""
+def build_graph(state):
+	workflow = StateGraph(state)
+	for name in ("repo", "doc", "vision"):
+		workflow.add_node(name, lambda value: value + 1)
+	workflow.add_edge(START, "repo")
+	return workflow.compile()
+
+
+def score(opinions, weight=3):
+	total = 0
+	for opinion in opinions:
+		if opinion.score > weight:
+			total += opinion.score * 2
+	return total / max(len(opinions), 1)
+"""
+
+# The same code with identifiers, literals and comments changed.
+RENAMED = b"""
+# copied from a classmate
+def make_pipeline(s):
+	g = StateGraph(s)
+	for n in ("a", "b", "c"):
+		g.add_node(n, lambda v: v + 7)
+	g.add_edge(START, "a")
+	return g.compile()
+
+
+def grade(items, w=5):
+	acc = 0
+	for item in items:
+		if item.score > w:
+			acc += item.score * 4
+	return acc / max(len(items), 1)
+"""
+
+UNRELATED = b"""
+class Cache:
+	def __init__(self):
+		self.items = {}
+
+	def get(self, key):
+		try:
+			return self.items[key]
+		except KeyError:
+			raise LookupError(key) from None
+
+	async def refresh(self, loader):
+		async with loader as source:
+			while await source.has_more():
+				self.items.update(await source.fetch())
+"""
+
+
+def test_renamed_copy_has_the_same_signature() -> None:
+	assert minhash_signature(ORIGINAL) == minhash_signature(RENAMED)
+	assert estimate_similarity(minhash_signature(ORIGINAL), minhash_signature(UNRELATED)) < 0.3
+
+
+def test_merged_signature_covers_every_file() -> None:
+	merged = merge_signatures([minhash_signature(ORIGINAL), minhash_signature(UNRELATED)])
+
+	assert merged == merge_signatures([minhash_signature(UNRELATED), minhash_signature(ORIGINAL)])
+	assert estimate_similarity(merged, minhash_signature(ORIGINAL)) > 0.3
+	assert estimate_similarity(merged, merged) == 1.0
+
+
+def test_index_returns_near_duplicates_of_other_submissions(tmp_path: Path) -> None:
+	index = SubmissionIndex(tmp_path / "submissions.sqlite3")
+	original = minhash_signature(ORIGINAL)
+	index.add("https://github.com/a/auditor.git", "a" * 40, original, {"graph.py": "blob-1"})
+	index.add("https://github.com/b/other", "b" * 40, minhash_signature(UNRELATED), {"cache.py": "blob-2"})
+
+	matches = index.query(
+		minhash_signature(RENAMED),
+		exclude_repo_url="https://github.com/c/copy",
+		file_blobs={"src/graph.py": "blob-1"},
+	)
+	own = index.query(original, exclude_repo_url="https://github.com/a/auditor")
+
+	assert [match["repo_url"] for match in matches] == ["github.com/a/auditor"]
+	assert matches[0]["similarity"] == 1.0
+	assert matches[0]["identical_files"] == 1
+	assert own == []
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import fitz
+
+from src.tools.doc_index import ProvenanceIndex
+from src.tools.pdf_parallel import offset_pages, page_ranges, split_document, stitch_ranges
+
+
+def test_page_ranges_cover_every_page_once() -> None:
+	assert page_ranges(40, 16) == [(1, 16), (17, 32), (33, 40)]
+	assert page_ranges(3, 16) == [(1, 3)]
+	assert page_ranges(2, 0) == [(1, 1), (2, 2)]
+	assert page_ranges(0, 16) == []
+
+
+def test_split_document_keeps_each_range_in_order() -> None:
+	with fitz.open() as document:
+		for number in range(1, 6):
+			document.new_page().insert_text((72, 72), f"Page marker {number}")
+		parts = split_document(document, page_ranges(5, 2))
+
+	texts = []
+	for part in parts:
+		with fitz.open(stream=part, filetype="pdf") as opened:
+			texts.append([page.get_text().strip() for page in opened])
+	assert texts == [["Page marker 1", "Page marker 2"], ["Page marker 3", "Page marker 4"], ["Page marker 5"]]
+
+
+def test_offset_pages_shifts_page_numbers_and_page_keys() -> None:
+	payload = {
+		"texts": [{"text": "Fan-in", "prov": [{"page_no": 1}, {"page_no": 2}]}],
+		"tables": [{"page": 2, "flag": True, "rows": 3}],
+		"pages": {"1": {"page_no": 1}, "2": {"page_no": 2}},
+	}
+
+	assert offset_pages(payload, 0) is payload
+	shifted = offset_pages(payload, 16)
+
+	assert shifted["texts"][0]["prov"] == [{"page_no": 17}, {"page_no": 18}]
+	assert shifted["tables"] == [{"page": 18, "flag": True, "rows": 3}]
+	assert shifted["pages"] == {"17": {"page_no": 17}, "18": {"page_no": 18}}
+
+
+def test_stitched_ranges_keep_document_page_provenance() -> None:
+	ranges = [(1, 2), (3, 4), (5, 5)]
+	results = [
+		("# Intro\n\nOverview\n", offset_pages({"texts": [{"text": "Overview", "prov": [{"page_no": 2}]}]}, 0)),
+		("  \n", {"texts": []}),
+		("## Design\n", offset_pages({"texts": [{"text": "Design", "prov": [{"page_no": 1}]}]}, 4)),
+	]
+
+	markdown, payload = stitch_ranges(ranges, results)
+	index = ProvenanceIndex.build(payload)
+
+	assert markdown == "# Intro\n\nOverview\n\n## Design\n"
+	assert [(part["page_start"], part["page_end"]) for part in payload["parts"]] == ranges
+	assert index.pages_for(["Overview"]) == [2]
+	assert index.pages_for(["Design"]) == [5]
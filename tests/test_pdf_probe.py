@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from src.tools.pdf_probe import TIER_FULL, TIER_TABLES, TIER_TEXT, PdfProbe, probe_document
+
+
+def test_text_layer_reports_use_the_text_tier() -> None:
+	assert PdfProbe(page_count=4, text_pages=[1, 2, 3, 4]).tier() == TIER_TEXT
+
+
+def test_ruled_tables_use_the_table_tier() -> None:
+	assert PdfProbe(page_count=4, text_pages=[1, 2, 3, 4], table_pages=[3]).tier() == TIER_TABLES
+
+
+def test_scanned_pages_use_the_full_tier_only_above_coverage() -> None:
+	mostly_scanned = PdfProbe(page_count=4, text_pages=[1], scanned_pages=[2, 3, 4])
+	one_scan_in_twenty = PdfProbe(page_count=20, text_pages=list(range(1, 20)), scanned_pages=[20])
+
+	assert mostly_scanned.tier() == TIER_FULL
+	assert one_scan_in_twenty.tier() == TIER_TEXT
+
+
+def test_range_tier_only_considers_pages_in_range() -> None:
+	probe = PdfProbe(page_count=32, text_pages=list(range(1, 17)), scanned_pages=list(range(17, 33)))
+
+	assert probe.range_tier(1, 16) == TIER_TEXT
+	assert probe.range_tier(17, 32) == TIER_FULL
+
+
+def test_probe_document_finds_text_blank_and_table_pages() -> None:
+	fitz = pytest.importorskip("fitz")
+	with fitz.open() as document:
+		text_page = document.new_page()
+		text_page.insert_textbox(fitz.Rect(72, 72, 520, 700), "Evidence paragraph. " * 40, fontsize=10)
+		document.new_page()
+		table_page = document.new_page()
+		table_page.insert_textbox(fitz.Rect(72, 72, 520, 300), "Results table. " * 40, fontsize=10)
+		for row in range(6):
+			table_page.draw_line((72, 400 + row * 18), (520, 400 + row * 18))
+		for column in range(5):
+			table_page.draw_line((72 + column * 112, 400), (72 + column * 112, 490))
+
+		probe = probe_document(document)
+
+	assert probe.text_pages == [1, 3]
+	assert probe.blank_pages == [2]
+	assert probe.table_pages == [3]
+	assert probe.tier() == TIER_TABLES
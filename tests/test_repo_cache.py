@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from src.tools.repo_cache import MirrorCache, normalize_repo_url
+
+
+def _git(root: Path, *args: str) -> str:
+	return subprocess.run(
+		["git", "-C", str(root), "-c", "user.name=auditor", "-c", "user.email=auditor@example.com", *args],
+		check=True,
+		capture_output=True,
+		text=True,
+	).stdout.strip()
+
+
+def _upstream(root: Path) -> Path:
+	root.mkdir(parents=True)
+	_git(root, "init", "-q")
+	(root / "graph.py").write_text("builder = None\n", encoding="utf-8")
+	_git(root, "add", ".")
+	_git(root, "commit", "-q", "-m", "initial")
+	return root
+
+
+def test_equivalent_urls_share_one_cache_key() -> None:
+	assert normalize_repo_url("https://github.com/Owner/Repo.git") == "github.com/owner/repo"
+	assert normalize_repo_url("git@github.com:owner/repo.git") == "github.com/owner/repo"
+	assert MirrorCache.cache_key("https://GitHub.com/owner/repo/") == MirrorCache.cache_key("git@github.com:Owner/Repo")
+	assert normalize_repo_url("https://example.com:8443/Team/Repo.git") == "example.com:8443/Team/Repo"
+
+
+def test_repeat_checkout_fetches_new_commits_into_the_mirror(tmp_path: Path) -> None:
+	upstream = _upstream(tmp_path / "upstream")
+	cache = MirrorCache(tmp_path / "cache" / "mirrors", max_bytes=1 << 30)
+
+	first = cache.checkout(str(upstream), tmp_path / "run1")
+	(upstream / "nodes.py").write_text("def node(state):\n\treturn state\n", encoding="utf-8")
+	_git(upstream, "add", ".")
+	_git(upstream, "commit", "-q", "-m", "add nodes")
+	second = cache.checkout(str(upstream), tmp_path / "run2")
+
+	assert cache.mirror_path(str(upstream)).is_dir()
+	assert len(list(cache.root.glob("*.git"))) == 1
+	assert first.head.commit.hexsha != second.head.commit.hexsha == _git(upstream, "rev-parse", "HEAD")
+	assert (tmp_path / "run2" / "nodes.py").is_file()
+	assert second.remote("origin").url == str(upstream)
+
+
+def test_eviction_drops_least_recently_used_mirrors(tmp_path: Path) -> None:
+	old = _upstream(tmp_path / "old")
+	new = _upstream(tmp_path / "new")
+	cache = MirrorCache(tmp_path / "cache" / "mirrors", max_bytes=1 << 30)
+	cache.checkout(str(old), tmp_path / "run-old")
+	cache.checkout(str(new), tmp_path / "run-new")
+
+	cache.max_bytes = 0
+	evicted = cache.evict(keep={MirrorCache.cache_key(str(new))})
+
+	assert evicted == [MirrorCache.cache_key(str(old))]
+	assert not cache.mirror_path(str(old)).exists()
+	assert cache.mirror_path(str(new)).is_dir()
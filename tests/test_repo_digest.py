@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from src.tools.cache_store import JsonBlobCache
+from src.tools.repo_digest import build_repo_digest
+from src.tools.repo_snapshot import RepoSnapshot
+
+
+def _git(root: Path, *args: str) -> None:
+	subprocess.run(
+		["git", "-C", str(root), "-c", "user.name=auditor", "-c", "user.email=auditor@example.com", *args],
+		check=True,
+		capture_output=True,
+	)
+
+
+def test_sparse_digest_is_not_reused_for_full_checkout(tmp_path: Path) -> None:
+	repo = tmp_path / "repo"
+	repo.mkdir()
+	(repo / "graph.py").write_text("builder = StateGraph(dict)\n", encoding="utf-8")
+	(repo / "README.md").write_text("# Project overview\n", encoding="utf-8")
+	_git(repo, "init", "-q")
+	_git(repo, "add", ".")
+	_git(repo, "commit", "-q", "-m", "initial")
+	cache = JsonBlobCache(tmp_path / "cache", max_bytes=1024 * 1024)
+
+	_git(repo, "sparse-checkout", "set", "--no-cone", "*.py")
+	sparse = build_repo_digest(RepoSnapshot.build(repo), cache=cache)
+	_git(repo, "sparse-checkout", "disable")
+	full = build_repo_digest(RepoSnapshot.build(repo), cache=cache)
+
+	assert sparse.commit_sha == full.commit_sha
+	assert sparse.files == ["graph.py"]
+	assert full.files == ["graph.py", "README.md"]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.tools.repo_snapshot import RepoSnapshot
+
+
+def _write(root: Path, relative_path: str, data: bytes = b"x\n") -> None:
+	path = root / relative_path
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_bytes(data)
+
+
+def _git(root: Path, *args: str) -> str:
+	return subprocess.run(
+		["git", "-C", str(root), "-c", "user.name=auditor", "-c", "user.email=auditor@example.com", *args],
+		check=True,
+		capture_output=True,
+		text=True,
+	).stdout.strip()
+
+
+def _native(*posix_paths: str) -> list[str]:
+	return [os.path.join(*path.split("/")) for path in posix_paths]
+
+
+def _tree(root: Path) -> Path:
+	_write(root, "src/graph.py", b"builder = None\n")
+	_write(root, "src/nodes/judges.py", b"def judge(state):\n\treturn state\n")
+	_write(root, "reports/final_report.pdf", b"%PDF-1.4\n")
+	_write(root, "docs/interim/report.pdf", b"%PDF-1.4\n")
+	_write(root, "docs/diagram.PNG", b"\x89PNG\r\n")
+	_write(root, "README.md", b"# app\n")
+	_write(root, "Makefile", b"all:\n")
+	return root
+
+
+def test_snapshot_buckets_paths_by_extension_and_language(tmp_path: Path) -> None:
+	snapshot = RepoSnapshot.build(_tree(tmp_path / "repo"))
+
+	assert snapshot.paths_with_suffix(".py") == _native("src/graph.py", "src/nodes/judges.py")
+	assert snapshot.paths_with_suffix(".PY") == snapshot.paths_with_suffix(".py")
+	assert snapshot.pdf_candidates == _native("docs/interim/report.pdf", "reports/final_report.pdf")
+	assert snapshot.image_candidates == _native("docs/diagram.PNG")
+	assert snapshot.by_language["other"] == ["Makefile"]
+	assert snapshot.contains("src/nodes/judges.py")
+	assert not snapshot.contains("src/missing.py")
+	assert snapshot.summary() == {
+		"files": 7,
+		"total_bytes": sum(entry.size for entry in snapshot.entries.values()),
+		"languages": {"image": 1, "markdown": 1, "other": 1, "pdf": 2, "python": 2},
+		"pdf_candidates": 2,
+		"image_candidates": 1,
+		"commit_sha": None,
+	}
+
+
+@pytest.mark.parametrize(
+	"pattern",
+	["reports/final_report.pdf", "**/final_report.pdf", "reports/*.pdf", "**/*.pdf", "src/*.py", "**/nodes/*.py"],
+)
+def test_snapshot_match_agrees_with_path_glob(tmp_path: Path, pattern: str) -> None:
+	root = _tree(tmp_path / "repo")
+	snapshot = RepoSnapshot.build(root)
+
+	expected = sorted(str(path.relative_to(root)) for path in root.glob(pattern) if path.is_file())
+
+	assert sorted(snapshot.match(pattern)) == expected
+
+
+def test_snapshot_trusts_index_shas_only_for_clean_files(tmp_path: Path) -> None:
+	root = _tree(tmp_path / "repo")
+	_git(root, "init", "-q")
+	_git(root, "add", ".")
+	_git(root, "commit", "-q", "-m", "initial")
+	_write(root, "src/graph.py", b"builder = StateGraph(dict)\n")
+	_write(root, "src/untracked.py", b"value = 1\n")
+
+	snapshot = RepoSnapshot.build(root)
+
+	assert snapshot.commit_sha == _git(root, "rev-parse", "HEAD")
+	(judges,) = _native("src/nodes/judges.py")
+	assert snapshot.blob_shas[judges] == _git(root, "hash-object", "src/nodes/judges.py")
+	assert snapshot.contains("src/graph.py") and snapshot.contains("src/untracked.py")
+	assert set(snapshot.blob_shas).isdisjoint(_native("src/graph.py", "src/untracked.py"))
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.tools.cache_store import JsonBlobCache
+from src.tools.repo_snapshot import RepoSnapshot
+from src.tools.repo_tools import RepoManager
+from src.tools.scan_limits import ScanLimits
+
+
+def _write(root: Path, relative_path: str, text: str) -> None:
+	path = root / relative_path
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_text(text, encoding="utf-8")
+
+
+def _git(root: Path, *args: str) -> str:
+	return subprocess.run(
+		["git", "-C", str(root), "-c", "user.name=auditor", "-c", "user.email=auditor@example.com", *args],
+		check=True,
+		capture_output=True,
+		text=True,
+	).stdout.strip()
+
+
+def _bare_upstream(tmp_path: Path) -> Path:
+	work = tmp_path / "work"
+	_write(work, "app/graph.py", "builder = None\n")
+	_write(work, "docs/report.pdf", "%PDF-1.4\n")
+	_write(work, "pyproject.toml", "[project]\nname = 'app'\n")
+	_write(work, "README.md", "# app\n")
+	_git(work, "init", "-q")
+	_git(work, "add", ".")
+	_git(work, "commit", "-q", "-m", "initial")
+	bare = tmp_path / "upstream.git"
+	_git(tmp_path, "clone", "-q", "--bare", str(work), str(bare))
+	return bare
+
+
+def _checked_out(root: Path) -> set[str]:
+	return {path.relative_to(root).as_posix() for path in root.rglob("*") if path.is_file() and ".git" not in path.parts}
+
+
+def test_symbol_index_follows_builder_imports(tmp_path: Path) -> None:
+	repo = tmp_path / "repo"
+	_write(repo, "app/__init__.py", "")
+	_write(
+		repo,
+		"app/graph.py",
+		"from langgraph.graph import StateGraph\n"
+		"from app.nodes import review_node\n\n"
+		"builder = StateGraph(dict)\n"
+		"builder.add_node('review', review_node)\n",
+	)
+	_write(
+		repo,
+		"app/nodes.py",
+		"from app.helpers import score\n\n"
+		"def review_node(state):\n"
+		"\treturn score(state)\n",
+	)
+	_write(repo, "app/helpers.py", "def score(state):\n\treturn {}\n")
+	_write(repo, "scripts/unrelated.py", "import json\n\ndef main():\n\treturn json.dumps({})\n")
+
+	manager = RepoManager(ast_cache=JsonBlobCache(tmp_path / "ast", max_bytes=1024 * 1024))
+	analysis = manager.analyze_graph_structure(str(repo))
+	cached = manager.analyze_graph_structure(str(repo))
+
+	summary = analysis["summary"]
+	assert "symbols" not in summary["detector_counts"]
+	# The builder's symbols come from the fused scan; only its prefiltered imports are re-parsed.
+	assert summary["symbol_index"] == {"files": 3, "from_scan": 1, "parsed": 2, "cache_hits": 0}
+	assert cached["summary"]["symbol_index"] == {"files": 3, "from_scan": 1, "parsed": 0, "cache_hits": 2}
+	assert summary["prefiltered_files"] == 4
+	node = analysis["node_call_graph"]["builders"][0]["nodes"]["review"]
+	assert node["symbol"] == "app.nodes.review_node"
+	assert node["internal"] == ["app.helpers.score"]
+
+
+def test_scan_skips_files_outside_the_byte_budgets(tmp_path: Path) -> None:
+	_write(tmp_path, "app/graph.py", "from langgraph.graph import StateGraph\n\nbuilder = StateGraph(dict)\n")
+	_write(tmp_path, "app/nodes.py", "def node(state):\n\treturn state\n" * 60)
+	_write(tmp_path, "vendor/lib.py", "builder = StateGraph(dict)\n")
+	_write(tmp_path, "app/schema_pb2.py", "builder = StateGraph(dict)\n")
+	_write(tmp_path, "app/generated.py", "# @generated by tooling\nbuilder = StateGraph(dict)\n")
+	_write(tmp_path, "app/minified.py", "x = 1; " * 70)
+	_write(tmp_path, "app/huge.py", "builder = StateGraph(dict)\n" + "# padding\n" * 1_000)
+	(tmp_path / "app" / "blob.py").write_bytes(b"data = 1\0\n")
+
+	limits = ScanLimits(max_file_bytes=4_096, max_total_bytes=2_000)
+	analysis = RepoManager(scan_limits=limits).analyze_graph_structure(str(tmp_path))
+
+	reasons = {item["file"].replace("\\", "/"): item["reason"] for item in analysis["skipped_files"]}
+	assert reasons == {
+		"vendor/lib.py": "vendored",
+		"app/schema_pb2.py": "generated",
+		"app/generated.py": "generated",
+		"app/minified.py": "minified",
+		"app/blob.py": "binary",
+		"app/huge.py": "oversized",
+		"app/nodes.py": "budget_exhausted",
+	}
+	assert analysis["summary"]["bytes_read"] <= 2_000
+	assert analysis["summary"]["python_files_found"] == 8
+	assert [builder["file"] for builder in analysis["graph_topology"]["builders"]] == ["app/graph.py"]
+	(oversized,) = analysis["oversized_files"]
+	assert oversized["file"].replace("\\", "/") == "app/huge.py" and oversized["graph_tokens"]
+	assert analysis["summary"]["skipped_files"]["oversized_graph_candidates"] == 1
+
+
+def test_ast_cache_serves_unchanged_and_renamed_files(tmp_path: Path) -> None:
+	repo = tmp_path / "repo"
+	_write(repo, "graph.py", "from langgraph.graph import StateGraph\n\nbuilder = StateGraph(dict)\n")
+	_write(repo, "nodes.py", "from langgraph.graph import StateGraph\n\nother = StateGraph(list)\n")
+	manager = RepoManager(ast_cache=JsonBlobCache(tmp_path / "ast", max_bytes=1024 * 1024))
+
+	first = manager.analyze_graph_structure(str(repo))
+	(repo / "nodes.py").rename(repo / "workflow.py")
+	second = manager.analyze_graph_structure(str(repo))
+
+	assert first["summary"]["ast_cache"] == {"enabled": True, "hits": 0, "misses": 2, "tree_hit": False}
+	assert second["summary"]["ast_cache"] == {"enabled": True, "hits": 2, "misses": 0, "tree_hit": False}
+	assert [builder["file"] for builder in second["graph_topology"]["builders"]] == ["graph.py", "workflow.py"]
+
+
+def test_identical_python_tree_replays_the_whole_analysis(tmp_path: Path) -> None:
+	def submission(root: Path, extra: str = "") -> RepoSnapshot:
+		_write(
+			root,
+			"app/graph.py",
+			"from langgraph.graph import StateGraph\n"
+			"from app.nodes import review\n\n"
+			"builder = StateGraph(dict)\n"
+			"builder.add_node('review', review)\n",
+		)
+		_write(root, "app/nodes.py", "def review(state):\n\treturn state\n" + extra)
+		_write(root, "README.md", f"# {root.name}\n")
+		_git(root, "init", "-q")
+		_git(root, "add", ".")
+		_git(root, "commit", "-q", "-m", "initial")
+		return RepoSnapshot.build(root)
+
+	manager = RepoManager(ast_cache=JsonBlobCache(tmp_path / "ast", max_bytes=1024 * 1024))
+	original = submission(tmp_path / "original")
+	first = manager.analyze_graph_structure(original.root, snapshot=original)
+
+	# A fork with the same Python files but its own README skips the scan entirely.
+	fork = submission(tmp_path / "fork")
+	replayed = manager.analyze_graph_structure(fork.root, snapshot=fork)
+	assert replayed["summary"]["ast_cache"]["tree_hit"]
+	assert replayed["summary"]["bytes_read"] == 0
+	assert replayed["node_call_graph"] == first["node_call_graph"]
+	assert replayed["fingerprint"] == first["fingerprint"]
+	assert manager.call_graph is not None and manager.call_graph.summary() == first["node_call_graph"]["index"]
+
+	# A near-duplicate rescans, but only its changed file misses the per-blob cache.
+	edited = submission(tmp_path / "edited", extra="\n\ndef score(state):\n\treturn 1\n")
+	rescanned = manager.analyze_graph_structure(edited.root, snapshot=edited)
+	assert rescanned["summary"]["ast_cache"] == {"enabled": True, "hits": 1, "misses": 1, "tree_hit": False}
+
+
+def test_parallel_scan_matches_serial_scan(tmp_path: Path) -> None:
+	_write(tmp_path, "graph.py", "from langgraph.graph import StateGraph\n\nbuilder = StateGraph(dict)\n")
+	for index in range(80):
+		_write(
+			tmp_path,
+			f"pkg/module_{index:02d}.py",
+			f"from langgraph.graph import StateGraph\n\nclass Node{index}:\n\tpass\n\ng{index} = StateGraph(dict)\n"
+			f"g{index}.add_node('n{index}', Node{index})\n",
+		)
+
+	def comparable(analysis: dict) -> dict:
+		summary = {
+			key: value
+			for key, value in analysis["summary"].items()
+			if key not in {"scan_workers", "detector_timings_ms", "phase_timings_ms"}
+		}
+		return {**analysis, "summary": summary}
+
+	serial = RepoManager().analyze_graph_structure(str(tmp_path), workers=1)
+	parallel = RepoManager().analyze_graph_structure(str(tmp_path), workers=2)
+
+	assert parallel["summary"]["scan_workers"] == 2
+	assert len(parallel["graph_topology"]["builders"]) == 81
+	assert comparable(parallel) == comparable(serial)
+
+
+def test_clone_modes_against_a_local_bare_repo(tmp_path: Path) -> None:
+	upstream = _bare_upstream(tmp_path)
+	manager = RepoManager()
+
+	try:
+		full = Path(manager.clone_repo(str(upstream)))
+		assert _checked_out(full) == {"app/graph.py", "docs/report.pdf", "pyproject.toml", "README.md"}
+
+		sparse = Path(manager.clone_repo(str(upstream), mode="sparse"))
+		assert _checked_out(sparse) == {"app/graph.py", "docs/report.pdf"}
+		assert not full.exists()
+	finally:
+		manager.close()
+
+	with pytest.raises(ValueError):
+		manager.clone_repo(str(upstream), mode="shallow")
+
+
+def test_changed_files_since_lists_every_tracked_change(tmp_path: Path) -> None:
+	repo = tmp_path / "repo"
+	_write(repo, "app/graph.py", "builder = None\n")
+	_write(repo, "README.md", "# app\n")
+	_git(repo, "init", "-q")
+	_git(repo, "add", ".")
+	_git(repo, "commit", "-q", "-m", "initial")
+	base = _git(repo, "rev-parse", "HEAD")
+	_write(repo, "README.md", "# app\n\nUsage notes.\n")
+	_write(repo, "pyproject.toml", "[project]\nname = 'app'\n")
+	_git(repo, "add", ".")
+	_git(repo, "commit", "-q", "-m", "docs")
+
+	manager = RepoManager()
+
+	assert manager.changed_files_since(str(repo), base) == ["README.md", "pyproject.toml"]
+	assert manager.changed_files_since(str(repo), "0" * 40) is None
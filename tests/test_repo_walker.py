@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+from src.tools.repo_walker import iter_repo_files
+
+
+def _write(root: Path, relative_path: str, text: str = "x\n") -> None:
+	path = root / relative_path
+	path.parent.mkdir(parents=True, exist_ok=True)
+	path.write_text(text, encoding="utf-8")
+
+
+def _tree(root: Path) -> Path:
+	_write(root, ".gitignore", "*.log\n!keep.log\n/dist/\nbuild/\ndocs/draft.md\n")
+	_write(root, "src/app.py")
+	_write(root, "src/debug.log")
+	_write(root, "src/keep.log")
+	_write(root, "src/.gitignore", "generated_*.py\n")
+	_write(root, "src/generated_schema.py")
+	_write(root, "src/nested/build/output.py")
+	_write(root, "dist/bundle.py")
+	_write(root, "lib/dist/helper.py")
+	_write(root, "docs/draft.md")
+	_write(root, "docs/guide.md")
+	_write(root, "node_modules/pkg/index.js")
+	return root
+
+
+def _paths(root: Path, use_git: bool) -> set[str]:
+	return {entry.path.replace(os.sep, "/") for entry in iter_repo_files(root, use_git=use_git)}
+
+
+def test_scandir_walk_applies_nested_gitignore_rules(tmp_path: Path) -> None:
+	root = _tree(tmp_path / "repo")
+
+	assert _paths(root, use_git=False) == {
+		".gitignore",
+		"src/.gitignore",
+		"src/app.py",
+		"src/keep.log",
+		"lib/dist/helper.py",
+		"docs/guide.md",
+	}
+
+
+def test_scandir_walk_matches_git_ls_files(tmp_path: Path) -> None:
+	root = _tree(tmp_path / "repo")
+	subprocess.run(["git", "init", "-q", str(root)], check=True)
+
+	assert _paths(root, use_git=False) == _paths(root, use_git=True)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from src.tools.text_index import Bm25Index, split_sentences, tokenize
+
+
+def test_tokenize_drops_short_tokens_and_case() -> None:
+	assert tokenize("The StateGraph fan_in is OK, v2!") == ["the", "stategraph", "fan_in"]
+	assert split_sentences("First one. Second?  Third!") == ["First one.", "Second?", "Third!"]
+
+
+def test_search_ranks_rarer_and_denser_matches_first() -> None:
+	index = Bm25Index(
+		[
+			("Judges score each rubric dimension.", "judges"),
+			("The aggregator joins detective evidence before the judges.", "aggregator"),
+			("Parallel detectives write evidence; the aggregator merges evidence.", "merge"),
+			("Installation uses uv sync.", "install"),
+		]
+	)
+
+	ranked = index.search("aggregator evidence")
+
+	assert len(index) == 4
+	assert [item for _, item in ranked] == ["merge", "aggregator"]
+	assert ranked[0][0] > ranked[1][0] > 0
+	assert index.search("aggregator evidence", limit=1) == ranked[:1]
+	assert index.search("unrelated words") == []
+
+
+def test_equal_scores_keep_insertion_order() -> None:
+	index: Bm25Index[int] = Bm25Index()
+	for position in range(3):
+		index.add("identical section text", position)
+
+	assert [item for _, item in index.search("section")] == [0, 1, 2]
+	assert Bm25Index().score("anything") == {}